@@ -4,6 +4,7 @@
 
 from .server import Server
 from .client import Client
+from .async_server import AsyncServer
 
-__all__ = ['Server', 'Client']
+__all__ = ['Server', 'Client', 'AsyncServer']
 
@@ -0,0 +1,264 @@
+"""
+Kriptoloji Projesi - Asyncio Tabanlı Eşzamanlı Sunucu
+RSA ile anahtar dağıtımı ve AES/DES ile şifreli veri iletimi
+
+Server.start bağlantıları sırayla veya bir iş parçacığı havuzunda
+(connection_workers) işler; her bağlantı bir iş parçacığı tutar.
+AsyncServer aynı protokolü (client.Client ile uyumlu) asyncio.start_server
+üzerinden konuşur ve binlerce bağlantıyı aynı anda taşır:
+
+- RSA ve simetrik çözme işlemleri bir executor'da çalışır; olay döngüsü
+  hiçbir zaman bloklanmaz.
+- Eşzamanlı bağlantı sayısı bir semafor ile sınırlanır; slot bekleyen
+  bağlantı accept_timeout içinde yer bulamazsa reddedilir.
+- Sabit settimeout değerleri yerine her okuma için read_timeout ve tüm
+  bağlantı için connection_timeout kullanılır.
+- Mesajlar istemciyle ortak protocol modülündeki ikili çerçevelerle
+  okunur; sınırlar başlıktaki uzunluktan bilinir (readexactly).
+- Oturum modunda (bkz. session modülü) bağlantı el sıkışmadan sonra açık
+  kalır; connection_timeout sadece el sıkışmayı sınırlar, oturumdaki her
+  mesaj için read_timeout (boşta kalma süresi) geçerlidir.
+"""
+
+import sys
+import os
+
+# Proje root'unu Python path'ine ekle
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from client_server import protocol
+from client_server.hybrid import HybridReceiver
+from client_server.server import Server
+from client_server.session import ServerSession
+from client_server.tickets import DEFAULT_TICKET_LIFETIME
+
+DEFAULT_MAX_CONNECTIONS = 1024
+DEFAULT_MAX_MESSAGE_SIZE = protocol.MAX_PAYLOAD_SIZE
+# Bundan küçük oturum mesajları olay döngüsünde çözülür (executor'a geçiş daha pahalı)
+INLINE_DECRYPT_LIMIT = 64 * 1024
+
+
+class AsyncServer(Server):
+    """
+    Asyncio tabanlı eşzamanlı sunucu.
+
+    Args:
+        host, port: Dinlenecek adres (port 0 ise boş bir port seçilir)
+        max_connections: Aynı anda işlenen en fazla bağlantı
+        accept_timeout: Dolu sunucuda slot için beklenecek en uzun süre (s)
+        read_timeout: Tek bir mesajın okunması için süre sınırı (s)
+        connection_timeout: El sıkışma (ve tek mesajlık bağlantı) için süre sınırı (s)
+        executor_workers: Çözme işlemleri için iş parçacığı sayısı
+        verbose: Çözülen mesajları yazdırır
+        ticket_lifetime, ticket_rotation: Oturum bileti süresi ve bilet anahtarı yenilenme aralığı (s)
+        key_path, key_passphrase, lazy_key, validate_key: RSA anahtarı dosyası,
+            parolası, arka planda yükleme ve tutarlılık kontrolü (bkz. Server)
+        enable_x25519: X25519 anahtar anlaşmasını sun (bkz. key_exchange)
+        rsa_workers, rsa_max_pending: Eski RSA mesajı parçalarını çözen havuz (bkz. Server)
+        max_message_size: Tek çerçevenin ve hibrit RSA mesajının boyut sınırı (byte)
+    """
+
+    def __init__(self, host='localhost', port=12345, max_connections=DEFAULT_MAX_CONNECTIONS,
+                 accept_timeout=5.0, read_timeout=10.0, connection_timeout=30.0,
+                 executor_workers=None, verbose=True, ticket_lifetime=DEFAULT_TICKET_LIFETIME,
+                 ticket_rotation=None, key_path=None, key_passphrase=None, lazy_key=False,
+                 validate_key=True, enable_x25519=True, rsa_workers=None, rsa_max_pending=None,
+                 max_message_size=DEFAULT_MAX_MESSAGE_SIZE):
+        super().__init__(host=host, port=port, ticket_lifetime=ticket_lifetime,
+                         ticket_rotation=ticket_rotation, key_path=key_path,
+                         key_passphrase=key_passphrase, lazy_key=lazy_key,
+                         validate_key=validate_key, enable_x25519=enable_x25519,
+                         rsa_workers=rsa_workers, rsa_max_pending=rsa_max_pending,
+                         max_message_size=max_message_size)
+        self.max_connections = max_connections
+        self.accept_timeout = accept_timeout
+        self.read_timeout = read_timeout
+        self.connection_timeout = connection_timeout
+        self.verbose = verbose
+        self.executor = ThreadPoolExecutor(max_workers=executor_workers)
+        self.stats = {'active': 0, 'served': 0, 'failed': 0, 'rejected': 0,
+                      'sessions': 0, 'messages': 0}
+        self._slots = None
+        self._server = None
+
+    async def _read_frame(self, reader, expected):
+        """Okuma süre sınırıyla bir çerçeve okur."""
+        return await asyncio.wait_for(
+            protocol.read_frame(reader, expected, self.max_message_size), self.read_timeout
+        )
+
+    async def _run(self, fn, *args):
+        """Bloklayan kriptografik işlemi executor'da çalıştırır."""
+        return await asyncio.get_running_loop().run_in_executor(self.executor, fn, *args)
+
+    async def _serve_connection(self, reader, writer):
+        """
+        El sıkışmayı ve tek mesajlık alışverişi yürütür.
+
+        Returns:
+            Oturum modu istendiyse ServerSession, değilse None
+        """
+        if not self.key_ready:
+            # lazy_key: anahtar arka planda yüklenirken olay döngüsü bloklanmaz
+            await self._run(self.wait_for_key)
+        # X25519 payı üretimi (~50 µs) olay döngüsünde yapılır
+        greeting, key_share = self.new_greeting()
+        writer.write(greeting)
+        await writer.drain()
+
+        first_types = (protocol.MSG_ENCRYPTED_KEY, protocol.MSG_KEY_EXCHANGE,
+                       protocol.MSG_HYBRID_KEY, protocol.MSG_RSA_MESSAGE)
+        msg_type, flags, payload = await self._read_frame(reader, first_types + (protocol.MSG_RESUME,))
+        if msg_type == protocol.MSG_RESUME:
+            # Bilet doğrulaması sadece AES-GCM ve HKDF; olay döngüsünde yapılır
+            session, reply = self.try_resume(payload)
+            writer.write(reply)
+            await writer.drain()
+            if session is not None:
+                return session
+            msg_type, flags, payload = await self._read_frame(reader, first_types)
+        if msg_type == protocol.MSG_HYBRID_KEY:
+            algorithm = 'RSA'
+            plaintext = await self._receive_hybrid_message(reader, payload)
+        elif msg_type == protocol.MSG_RSA_MESSAGE:
+            algorithm = 'RSA'
+            chunks = protocol.unpack_rsa_chunks(payload)
+            plaintext = await self._run(self.decrypt_rsa_message, chunks)
+        else:
+            if msg_type == protocol.MSG_KEY_EXCHANGE:
+                algorithm, symmetric_key = self.agree_session_key(payload, key_share)
+            else:
+                algorithm, encrypted_key = protocol.unpack_encrypted_key(payload)
+                symmetric_key = await self._run(self.decrypt_symmetric_key, encrypted_key)
+            self._count_handshake('full')
+            if flags & protocol.FLAG_SESSION:
+                if flags & protocol.FLAG_TICKET_REQUEST:
+                    writer.write(self.issue_ticket_frame(algorithm, symmetric_key))
+                return ServerSession(algorithm, symmetric_key)
+            _, _, payload = await self._read_frame(reader, protocol.MSG_ENCRYPTED_MESSAGE)
+            iv, ciphertext = protocol.unpack_encrypted_message(payload)
+            plaintext = await self._run(self.decrypt_message, algorithm, symmetric_key, iv, ciphertext)
+
+        self.stats['messages'] += 1
+        self.on_message(writer.get_extra_info('peername'), algorithm, plaintext)
+        writer.write(self._ack_frame)
+        await writer.drain()
+        return None
+
+    async def _receive_hybrid_message(self, reader, payload):
+        """Hibrit mesajın anahtarını executor'da açar, parçaları geldikçe çözer."""
+        receiver = await self._run(HybridReceiver, payload, self._rsa_decrypt, self.max_message_size)
+        while not receiver.finished:
+            _, flags, chunk = await self._read_frame(reader, protocol.MSG_HYBRID_CHUNK)
+            if len(chunk) > INLINE_DECRYPT_LIMIT:
+                await self._run(receiver.receive, flags, chunk)
+            else:
+                receiver.receive(flags, chunk)
+        return receiver.message()
+
+    async def _serve_session(self, reader, writer, session):
+        """Oturum mesajlarını CLOSE gelene kadar çözer; istenen noktalarda toplu onay gönderir."""
+        peer = writer.get_extra_info('peername')
+        expected = (protocol.MSG_SESSION_MESSAGE, protocol.MSG_CLOSE)
+        self.stats['sessions'] += 1
+        while True:
+            msg_type, flags, payload = await self._read_frame(reader, expected)
+            if msg_type == protocol.MSG_CLOSE:
+                writer.write(session.ack_frame())
+                await writer.drain()
+                return
+            iv, ciphertext = session.open(payload)
+            if len(ciphertext) > INLINE_DECRYPT_LIMIT:
+                plaintext = await self._run(session.decrypt, iv, ciphertext)
+            else:
+                plaintext = session.decrypt(iv, ciphertext)
+            self.stats['messages'] += 1
+            self.on_message(peer, session.algorithm, plaintext)
+            if flags & protocol.FLAG_ACK_REQUEST:
+                writer.write(session.ack_frame())
+                await writer.drain()
+
+    def on_message(self, peer, algorithm, plaintext):
+        """Çözülen mesajı işler (varsayılan: yazdırır)."""
+        if self.verbose:
+            print(f"[{peer}] {algorithm}: {plaintext}")
+
+    async def handle_client(self, reader, writer):
+        """Tek bir bağlantıyı slot, süre sınırları ve hata yönetimiyle işler."""
+        peer = writer.get_extra_info('peername')
+        try:
+            await asyncio.wait_for(self._slots.acquire(), self.accept_timeout)
+        except asyncio.TimeoutError:
+            self.stats['rejected'] += 1
+            writer.close()
+            return
+
+        self.stats['active'] += 1
+        try:
+            session = await asyncio.wait_for(self._serve_connection(reader, writer),
+                                             self.connection_timeout)
+            if session is not None:
+                await self._serve_session(reader, writer, session)
+            self.stats['served'] += 1
+        except Exception as e:
+            self.stats['failed'] += 1
+            if self.verbose:
+                print(f"Hata [{peer}]: {type(e).__name__}: {e}")
+            if isinstance(e, ValueError):
+                # İstemci onay beklerken takılı kalmasın
+                protocol.write_frame(writer, protocol.MSG_ERROR, str(e).encode('utf-8'))
+        finally:
+            self.stats['active'] -= 1
+            self._slots.release()
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except (ConnectionError, OSError):
+                pass
+
+    async def start_serving(self):
+        """Dinlemeye başlar ve asyncio.Server nesnesini döndürür."""
+        self._slots = asyncio.Semaphore(self.max_connections)
+        self._server = await asyncio.start_server(
+            self.handle_client, self.host, self.port, backlog=self.max_connections
+        )
+        # port 0 verildiyse seçilen portu kaydet
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self._server
+
+    async def serve_forever(self):
+        """Sunucuyu durdurulana kadar çalıştırır."""
+        server = await self.start_serving()
+        print(f"\n{'='*60}")
+        print(f"Asyncio sunucu başlatıldı: {self.host}:{self.port} "
+              f"(en fazla {self.max_connections} eşzamanlı bağlantı)")
+        print(f"{'='*60}\n")
+        async with server:
+            await server.serve_forever()
+
+    def start(self):
+        """Sunucuyu başlatır (bloklar)."""
+        try:
+            asyncio.run(self.serve_forever())
+        except KeyboardInterrupt:
+            print("\n\nSunucu kapatılıyor...")
+        finally:
+            self.stop()
+
+    def stop(self):
+        """Sunucuyu ve executor'ı durdurur."""
+        if self._server is not None:
+            self._server.close()
+            self._server = None
+            print("Sunucu kapatıldı")
+        self.executor.shutdown(wait=False)
+        self.rsa_pool.shutdown()
+
+
+if __name__ == "__main__":
+    AsyncServer().start()
@@ -0,0 +1,377 @@
+"""
+İstemci-Sunucu Performans Ölçümleri
+Terminal üzerinden çalıştırmak için: python client_server/benchmark_client_server.py
+"""
+
+import sys
+import os
+
+# Proje root'unu Python path'ine ekle
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+import asyncio
+import base64
+import contextlib
+import io
+import json
+import socket
+import tempfile
+import threading
+import time
+
+from cryptography.hazmat.primitives.asymmetric import padding
+from cryptography.hazmat.primitives import serialization, hashes
+
+from modern_ciphers import aes_encrypt
+from client_server import protocol
+from client_server.client import LEGACY_RSA_CHUNK_SIZE, Client
+from client_server.rsa_pool import RSADecryptPool
+from client_server.server import Server
+from client_server.async_server import AsyncServer
+from client_server.key_exchange import generate_key_share, pack_key_exchange
+
+_OAEP = padding.OAEP(mgf=padding.MGF1(algorithm=hashes.SHA256()),
+                     algorithm=hashes.SHA256(), label=None)
+
+
+def _report(name, n_connections, elapsed):
+    """Ölçüm sonucunu bağlantı/saniye olarak yazdırır."""
+    print(f"{name:<44} {n_connections / elapsed:>10,.1f} bağlantı/s  ({elapsed:.3f} s)")
+
+
+async def _async_client(host, port, message):
+    """Çerçeveli protokolü (açık anahtar, şifreli anahtar, şifreli mesaj, onay) konuşan istemci."""
+    reader, writer = await asyncio.open_connection(host, port)
+    _, _, payload = await protocol.read_frame(reader, protocol.MSG_PUBLIC_KEY)
+    public_key = serialization.load_der_public_key(payload)
+
+    symmetric_key = os.urandom(16)
+    iv, ciphertext = aes_encrypt(message, symmetric_key)
+    encrypted_key = public_key.encrypt(symmetric_key, _OAEP)
+    protocol.write_frame(writer, protocol.MSG_ENCRYPTED_KEY,
+                         protocol.pack_encrypted_key('AES', encrypted_key))
+    protocol.write_frame(writer, protocol.MSG_ENCRYPTED_MESSAGE,
+                         protocol.pack_encrypted_message(iv, ciphertext))
+    await writer.drain()
+    msg_type, _, _ = await protocol.read_frame(reader)
+    writer.close()
+    await writer.wait_closed()
+    return msg_type == protocol.MSG_ACK
+
+
+def benchmark_wire_size(sizes=(64, 4096, 65536)):
+    """Eski JSON+base64 mesajları ile ikili çerçevelerin hat üzerindeki boyutunu karşılaştırır."""
+    print("\n--- Hat üzerindeki boyut (anahtar + mesaj) ---")
+    encrypted_key = os.urandom(256)
+    for size in sizes:
+        iv, ciphertext = aes_encrypt('a' * size, os.urandom(16))
+        legacy = len(json.dumps({
+            'type': 'encrypted_key', 'algorithm': 'AES',
+            'encrypted_key': base64.b64encode(encrypted_key).decode('utf-8')
+        })) + len(json.dumps({
+            'type': 'encrypted_message',
+            'iv': base64.b64encode(iv).decode('utf-8'),
+            'ciphertext': base64.b64encode(ciphertext).decode('utf-8')
+        }))
+        framed = (len(protocol.pack_frame(protocol.MSG_ENCRYPTED_KEY,
+                                          protocol.pack_encrypted_key('AES', encrypted_key)))
+                  + len(protocol.pack_frame(protocol.MSG_ENCRYPTED_MESSAGE,
+                                            protocol.pack_encrypted_message(iv, ciphertext))))
+        print(f"{size:>8} byte mesaj: JSON+base64 {legacy:>8} byte, çerçeve {framed:>8} byte "
+              f"(%{100 * (legacy - framed) / legacy:.1f} daha küçük)")
+
+
+def _start_blocking_server(**kwargs):
+    """Server.start'ı boş bir portta arka planda çalıştırır (çıktısı bastırılmalıdır)."""
+    server = Server(port=0, **kwargs)
+    # Server.start portu kendisi bağlar; boş bir port seçip onu kullan
+    probe = socket.socket()
+    probe.bind(('localhost', 0))
+    server.port = probe.getsockname()[1]
+    probe.close()
+    threading.Thread(target=server.start, daemon=True).start()
+    time.sleep(0.5)
+    return server
+
+
+def benchmark_startup(repeats=5):
+    """Sunucu başlatma süresi: her seferinde üretme, diskten yükleme ve arka planda (lazy) yükleme."""
+    print(f"\n--- Sunucu başlatma süresi (ortalama, {repeats} tekrar) ---")
+
+    def measure(make):
+        start = time.perf_counter()
+        server = make()
+        ready = time.perf_counter() - start
+        server.wait_for_key()
+        return ready, time.perf_counter() - start
+
+    with tempfile.TemporaryDirectory() as tmp, contextlib.redirect_stdout(io.StringIO()):
+        path = os.path.join(tmp, 'server_key.pem')
+        secret_path = os.path.join(tmp, 'server_key_secret.pem')
+        Server(port=0, key_path=secret_path, key_passphrase='parola')
+        cases = [
+            ("Her başlatmada üret (soğuk)", lambda: Server(port=0)),
+            ("İlk çalıştırma: üret + kaydet",
+             lambda: (os.path.exists(path) and os.remove(path)) or Server(port=0, key_path=path)),
+            ("Diskten yükle (PEM)", lambda: Server(port=0, key_path=path)),
+            ("Diskten yükle (PEM, kontrolsüz)", lambda: Server(port=0, key_path=path, validate_key=False)),
+            ("Diskten yükle (parolalı PEM)",
+             lambda: Server(port=0, key_path=secret_path, key_passphrase='parola')),
+            ("Lazy (arka planda yükle)", lambda: Server(port=0, key_path=path, lazy_key=True)),
+            ("Lazy (arka planda üret)", lambda: Server(port=0, lazy_key=True)),
+        ]
+        results = []
+        for name, make in cases:
+            timings = [measure(make) for _ in range(repeats)]
+            results.append((name, sum(t[0] for t in timings) / repeats, sum(t[1] for t in timings) / repeats))
+    for name, ready, key_ready in results:
+        print(f"{name:<44} hazır {ready * 1000:>8.2f} ms, anahtar {key_ready * 1000:>8.2f} ms")
+
+
+def benchmark_blocking_server(n_connections=20):
+    """Tek istemcili (sıralı) Server.start döngüsünün bağlantı hızını ölçer."""
+    print(f"\n--- Bloklayan sunucu, {n_connections} sıralı bağlantı ---")
+    with contextlib.redirect_stdout(io.StringIO()):
+        server = _start_blocking_server()
+
+        start = time.perf_counter()
+        for i in range(n_connections):
+            client = Client(port=server.port)
+            client.connect()
+            client.receive_public_key()
+            client.send_encrypted_message(f"mesaj {i}", 'AES')
+            client.disconnect()
+        elapsed = time.perf_counter() - start
+    _report("Server.start (Client)", n_connections, elapsed)
+
+
+def benchmark_blocking_pool(n_connections=20, n_stalled=2, client_timeout=2.0):
+    """Sessiz (stalled) istemciler varken sıralı ve havuzlu Server.start."""
+    print(f"\n--- Bloklayan sunucu, {n_stalled} sessiz istemci + {n_connections} bağlantı "
+          f"(client_timeout={client_timeout} s) ---")
+    for name, options in (("sıralı", {}), ("havuz (8 işçi)", {'connection_workers': 8})):
+        with contextlib.redirect_stdout(io.StringIO()):
+            server = _start_blocking_server(client_timeout=client_timeout, **options)
+            # Bağlanıp hiçbir şey göndermeyen istemciler
+            stalled = [socket.create_connection(('localhost', server.port)) for _ in range(n_stalled)]
+            start = time.perf_counter()
+            for i in range(n_connections):
+                client = Client(port=server.port, timeout=30.0)
+                client.connect()
+                client.receive_public_key()
+                client.send_encrypted_message(f"mesaj {i}", 'AES')
+                client.disconnect()
+            elapsed = time.perf_counter() - start
+            stats = dict(server.stats)
+            for sock in stalled:
+                sock.close()
+            while server.stats['active'] or server.stats['queued']:
+                time.sleep(0.01)
+            server.stop()
+        _report(f"Server.start ({name})", n_connections, elapsed)
+        print(f"    istatistik: {stats}")
+
+
+def benchmark_sessions(n_messages=2000, ack_every_list=(1, 32, 256)):
+    """Mesaj başına el sıkışma ile tek oturum üzerinden mesaj hızını karşılaştırır."""
+    print(f"\n--- Mesaj hızı: bağlantı başına bir mesaj vs oturum ({n_messages} mesaj) ---")
+    with contextlib.redirect_stdout(io.StringIO()):
+        server = _start_blocking_server()
+        n_single = max(1, n_messages // 10)
+        start = time.perf_counter()
+        for i in range(n_single):
+            client = Client(port=server.port)
+            client.connect()
+            client.receive_public_key()
+            client.send_encrypted_message(f"mesaj {i}", 'AES')
+            client.disconnect()
+        single_elapsed = time.perf_counter() - start
+
+        session_results = []
+        for ack_every in ack_every_list:
+            client = Client(port=server.port)
+            client.connect()
+            client.receive_public_key()
+            start = time.perf_counter()
+            client.start_session('AES', ack_every=ack_every)
+            for i in range(n_messages):
+                client.send_session_message(f"mesaj {i}")
+            client.end_session()
+            session_results.append((ack_every, time.perf_counter() - start))
+            client.disconnect()
+    print(f"{'Mesaj başına bağlantı + RSA':<44} {n_single / single_elapsed:>10,.1f} mesaj/s")
+    for ack_every, elapsed in session_results:
+        print(f"{f'Oturum (her {ack_every} mesajda onay)':<44} {n_messages / elapsed:>10,.1f} mesaj/s")
+
+
+def benchmark_resumption(n_connections=200):
+    """Yeniden bağlanmada tam el sıkışma (RSA) ile bilet ile sürdürmeyi karşılaştırır."""
+    print(f"\n--- Yeniden bağlanma: tam el sıkışma vs oturum bileti ({n_connections} bağlantı) ---")
+    with contextlib.redirect_stdout(io.StringIO()):
+        server = _start_blocking_server()
+        results = []
+        for use_ticket in (False, True):
+            client = Client(port=server.port)
+            start = time.perf_counter()
+            for i in range(n_connections):
+                client.connect()
+                client.receive_public_key()
+                client.start_session('AES', use_ticket=use_ticket)
+                client.send_session_message(f"mesaj {i}")
+                client.end_session()
+                client.disconnect()
+            results.append(time.perf_counter() - start)
+        handshakes = dict(server.handshakes)
+
+        # Sadece sunucu tarafındaki el sıkışma maliyeti
+        encrypted_key = server.public_key.encrypt(os.urandom(16), _OAEP)
+        resume_payload = os.urandom(16) + server.tickets.issue('AES', os.urandom(16))
+        start = time.perf_counter()
+        for _ in range(n_connections):
+            server.decrypt_symmetric_key(encrypted_key)
+        rsa_elapsed = time.perf_counter() - start
+        start = time.perf_counter()
+        for _ in range(n_connections):
+            server.try_resume(resume_payload)
+        resume_elapsed = time.perf_counter() - start
+
+    _report("Tam el sıkışma (RSA) + 1 mesaj", n_connections, results[0])
+    _report("Biletle sürdürme + 1 mesaj", n_connections, results[1])
+    print(f"{'Sunucu: RSA anahtar çözme':<44} {n_connections / rsa_elapsed:>10,.1f} el sıkışma/s")
+    print(f"{'Sunucu: bilet doğrulama + HKDF':<44} {n_connections / resume_elapsed:>10,.1f} el sıkışma/s")
+    print(f"El sıkışmalar: {handshakes}")
+
+
+def benchmark_key_exchange(n_handshakes=500):
+    """RSA-OAEP anahtar taşıma ile X25519 + HKDF anahtar anlaşmasının el sıkışma hızı."""
+    print(f"\n--- Anahtar kurma: RSA-OAEP vs X25519 ({n_handshakes} el sıkışma) ---")
+    with contextlib.redirect_stdout(io.StringIO()):
+        server = Server(port=0)
+        client = Client(port=0)
+        client.public_key = server.public_key
+
+        # Sunucu CPU'su: RSA'da bir özel anahtar çözme, X25519'da pay üretimi + anlaşma + HKDF
+        encrypted_key = client.encrypt_symmetric_key(os.urandom(16))
+        start = time.perf_counter()
+        for _ in range(n_handshakes):
+            server.decrypt_symmetric_key(encrypted_key)
+        rsa_elapsed = time.perf_counter() - start
+
+        _, client_share = generate_key_share()
+        payload = pack_key_exchange('AES', client_share)
+        start = time.perf_counter()
+        for _ in range(n_handshakes):
+            _, key_share = server.new_greeting()
+            server.agree_session_key(payload, key_share)
+        x25519_elapsed = time.perf_counter() - start
+
+        # Uçtan uca: bağlan, anahtarı kur, tek oturum mesajı, kapat
+        server = _start_blocking_server()
+        end_to_end = []
+        for key_exchange in ('RSA', 'X25519'):
+            client = Client(port=server.port, key_exchange=key_exchange)
+            n = n_handshakes // 5
+            start = time.perf_counter()
+            for i in range(n):
+                client.connect()
+                client.receive_public_key()
+                client.start_session('AES', use_ticket=False)
+                client.send_session_message(f"mesaj {i}")
+                client.end_session()
+                client.disconnect()
+            end_to_end.append((key_exchange, n, time.perf_counter() - start))
+
+    print(f"{'Sunucu: RSA-2048 OAEP çözme':<44} {n_handshakes / rsa_elapsed:>10,.1f} el sıkışma/s")
+    print(f"{'Sunucu: X25519 pay + anlaşma + HKDF':<44} {n_handshakes / x25519_elapsed:>10,.1f} el sıkışma/s")
+    for key_exchange, n, elapsed in end_to_end:
+        _report(f"Uçtan uca oturum kurma ({key_exchange})", n, elapsed)
+
+
+def benchmark_rsa_messages(sizes=(1024, 65536, 1024 * 1024), repeats=3):
+    """'RSA' mesajları uçtan uca: eski parça başına RSA-OAEP ile hibrit (RSA + AES-GCM akışı)."""
+    print(f"\n--- RSA mesajları: parça başına RSA vs hibrit (uçtan uca, {repeats} tekrar) ---")
+    results = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        server = _start_blocking_server()
+        client = Client(port=server.port)
+        for size in sizes:
+            message = 'x' * size
+            for name, send in (("parça başına RSA", client.send_legacy_rsa_message),
+                               ("hibrit", lambda m: client.send_encrypted_message(m, 'RSA'))):
+                start = time.perf_counter()
+                for _ in range(repeats):
+                    client.connect()
+                    client.receive_public_key()
+                    send(message)
+                    client.disconnect()
+                results.append((size, name, (time.perf_counter() - start) / repeats))
+        server.stop()
+    for size, name, elapsed in results:
+        print(f"{size // 1024:>6} KB {name:<20} {elapsed * 1000:>10.2f} ms/mesaj "
+              f"{size / elapsed / 1024 / 1024:>10.2f} MB/s")
+
+
+def benchmark_rsa_pool(size=256 * 1024, workers_list=(1, 2, 4, 8)):
+    """Eski biçimdeki RSA mesajının parçalarını farklı havuz boyutlarıyla çözme (sunucu CPU'su)."""
+    print(f"\n--- Eski RSA mesajı: parça çözme havuzu ({size // 1024} KB, {os.cpu_count()} çekirdek) ---")
+    with contextlib.redirect_stdout(io.StringIO()):
+        server = Server(port=0)
+        client = Client(port=0)
+    client.public_key = server.public_key
+    data = os.urandom(size)
+    chunks = [client.encrypt_symmetric_key(data[i:i + LEGACY_RSA_CHUNK_SIZE])
+              for i in range(0, size, LEGACY_RSA_CHUNK_SIZE)]
+    for workers in workers_list:
+        pool = RSADecryptPool(server._rsa_decrypt, workers)
+        start = time.perf_counter()
+        assert b''.join(pool.map(chunks)) == data
+        elapsed = time.perf_counter() - start
+        pool.shutdown()
+        print(f"{workers:>3} iş parçacığı {len(chunks):>6} parça {elapsed * 1000:>10.1f} ms "
+              f"{len(chunks) / elapsed:>10,.0f} parça/s")
+
+
+def benchmark_async_server(concurrency_list=(1, 100, 1000)):
+    """AsyncServer'ın artan eşzamanlı bağlantı sayısındaki hızını ölçer."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        server = AsyncServer(port=0, max_connections=1024, connection_timeout=120.0,
+                             accept_timeout=120.0, verbose=False)
+
+    async def run(n):
+        await server.start_serving()
+        start = time.perf_counter()
+        results = await asyncio.gather(*(_async_client(server.host, server.port, f"mesaj {i}")
+                                         for i in range(n)))
+        elapsed = time.perf_counter() - start
+        server._server.close()
+        return results, elapsed
+
+    print("\n--- Asyncio sunucu, eşzamanlı bağlantılar ---")
+    for n in concurrency_list:
+        results, elapsed = asyncio.run(run(n))
+        assert all(results), "Onay alınamayan bağlantı var!"
+        _report(f"AsyncServer ({n} eşzamanlı istemci)", n, elapsed)
+    print(f"İstatistikler: {server.stats}")
+    server.executor.shutdown()
+
+
+def main():
+    print("="*60)
+    print("İSTEMCİ-SUNUCU PERFORMANS ÖLÇÜMÜ")
+    print("="*60)
+    benchmark_startup()
+    benchmark_wire_size()
+    benchmark_blocking_server()
+    benchmark_blocking_pool()
+    benchmark_sessions()
+    benchmark_resumption()
+    benchmark_key_exchange()
+    benchmark_rsa_messages()
+    benchmark_rsa_pool()
+    benchmark_async_server()
+
+
+if __name__ == "__main__":
+    main()
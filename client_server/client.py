@@ -12,27 +12,65 @@ if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
 import socket
-import json
-import base64
 import time
 from cryptography.hazmat.primitives.asymmetric import padding
 from cryptography.hazmat.primitives import serialization, hashes
 from cryptography.hazmat.backends import default_backend
 from modern_ciphers import aes_encrypt, des_encrypt
+from client_server import protocol
+from client_server.hybrid import hybrid_frames
+from client_server.session import (
+    DEFAULT_ACK_EVERY, derive_mac_key, session_context, pack_session_message, unpack_ack
+)
+from client_server.key_exchange import (
+    SYMMETRIC_KEY_SIZES, derive_session_key, generate_key_share, pack_key_exchange, unpack_greeting
+)
+from client_server.tickets import (
+    RANDOM_SIZE, derive_resumption_key, pack_resume, unpack_ticket_message
+)
+
+# RSA-2048 + OAEP-SHA256 ile tek parçada şifrelenebilecek en fazla byte (256 - 2*32 - 2)
+LEGACY_RSA_CHUNK_SIZE = 190
 
 
 class Client:
-    def __init__(self, host='localhost', port=12345):
+    """
+    Sunucuya AES/DES (veya RSA) ile şifreli mesaj gönderen istemci.
+    
+    Args:
+        host, port: Sunucu adresi
+        timeout: Soket işlemleri için süre sınırı (s)
+        key_exchange: Simetrik anahtarın kurulma yolu; 'RSA' (RSA-OAEP ile
+            anahtar taşıma) veya 'X25519' (geçici ECDH + HKDF; sunucu sunmuyorsa
+            RSA'ya dönülür)
+    """
+    
+    def __init__(self, host='localhost', port=12345, timeout=10.0, key_exchange='RSA'):
+        if key_exchange not in ('RSA', 'X25519'):
+            raise ValueError("Anahtar değişimi 'RSA' veya 'X25519' olmalıdır")
         self.host = host
         self.port = port
+        self.timeout = timeout
+        self.key_exchange = key_exchange
         self.socket = None
         self.public_key = None
+        self.server_key_share = None
+        self.session = None
+        self.session_mac_key = None
+        self.ack_every = DEFAULT_ACK_EVERY
+        self.next_sequence = 0
+        self.acked = 0
+        # Son tam el sıkışmada alınan oturum bileti (bağlantılar arasında saklanır)
+        self.ticket = None
     
     def connect(self):
         """Sunucuya bağlanır."""
         self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.socket.settimeout(self.timeout)
         try:
             self.socket.connect((self.host, self.port))
+            # Küçük çerçeveler Nagle algoritmasıyla bekletilmesin
+            self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
             print(f"✓ Sunucuya bağlandı: {self.host}:{self.port}")
             return True
         except Exception as e:
@@ -42,74 +80,19 @@ class Client:
     def receive_public_key(self):
         """Sunucudan açık anahtarı alır."""
         try:
-            # Socket timeout ayarla
-            self.socket.settimeout(10.0)
-            
-            # Kısa bir bekleme (sunucunun veriyi göndermesi için)
-            time.sleep(0.3)
-            
-            # Veriyi al - daha basit yaklaşım
-            data = b''
-            chunk = None
-            
-            # İlk chunk'ı al
-            try:
-                chunk = self.socket.recv(8192)  # Daha büyük buffer
-                if chunk:
-                    data += chunk
-            except socket.timeout:
-                print("Timeout: Sunucudan veri gelmedi")
-                return False
-            
-            # Eğer veri küçükse, daha fazla veri olabilir
-            if len(data) < 1000:  # RSA public key genellikle daha büyüktür
-                try:
-                    # Non-blocking moda geç
-                    self.socket.settimeout(0.1)
-                    while True:
-                        try:
-                            chunk = self.socket.recv(8192)
-                            if not chunk:
-                                break
-                            data += chunk
-                        except socket.timeout:
-                            break  # Daha fazla veri yok
-                except:
-                    pass
-            
-            if not data:
-                print("Hata: Sunucudan veri alınamadı")
-                return False
-            
-            # JSON'u parse et
-            try:
-                decoded = data.decode('utf-8')
-                key_message = json.loads(decoded)
-            except json.JSONDecodeError as e:
-                print(f"Hata: JSON parse edilemedi: {str(e)}")
-                print(f"Alınan veri uzunluğu: {len(data)} byte")
-                print(f"Alınan veri (ilk 500 karakter): {data[:500]}")
-                return False
-            except UnicodeDecodeError as e:
-                print(f"Hata: Unicode decode hatası: {str(e)}")
-                return False
-            
-            if key_message.get('type') == 'public_key':
-                public_key_pem = key_message['public_key'].encode('utf-8')
-                self.public_key = serialization.load_pem_public_key(
-                    public_key_pem,
-                    backend=default_backend()
-                )
-                print("✓ Açık anahtar alındı")
-                return True
-            else:
-                print(f"Hata: Beklenmeyen mesaj tipi: {key_message.get('type')}")
-                print(f"Mesaj içeriği: {str(key_message)[:200]}")
-                return False
+            _, flags, payload = protocol.recv_frame(self.socket, protocol.MSG_PUBLIC_KEY)
+            der, self.server_key_share = unpack_greeting(flags, payload)
+            self.public_key = serialization.load_der_public_key(
+                der,
+                backend=default_backend()
+            )
+            print("✓ Açık anahtar alındı")
+            return True
+        except socket.timeout:
+            print("Timeout: Sunucudan veri gelmedi")
+            return False
         except Exception as e:
             print(f"Hata: Açık anahtar alınırken hata oluştu: {str(e)}")
-            import traceback
-            traceback.print_exc()
             return False
     
     def encrypt_symmetric_key(self, symmetric_key):
@@ -122,7 +105,29 @@ class Client:
                 label=None
             )
         )
-        return base64.b64encode(encrypted_key).decode('utf-8')
+        return encrypted_key
+    
+    def _key_exchange_frame(self, algorithm, flags=0):
+        """
+        Oturum anahtarını kuran çerçeveyi hazırlar (X25519 seçildiyse ve
+        sunucu pay gönderdiyse KEY_EXCHANGE, değilse RSA ile ENCRYPTED_KEY).
+        
+        Returns:
+            (çerçeve, simetrik anahtar) tuple'ı
+        """
+        if self.key_exchange == 'X25519' and self.server_key_share is not None:
+            private_key, client_share = generate_key_share()
+            symmetric_key = derive_session_key(private_key, self.server_key_share, algorithm,
+                                               self.server_key_share, client_share)
+            frame = protocol.pack_frame(protocol.MSG_KEY_EXCHANGE,
+                                        pack_key_exchange(algorithm, client_share), flags)
+            return frame, symmetric_key
+        
+        symmetric_key = os.urandom(SYMMETRIC_KEY_SIZES[algorithm])
+        frame = protocol.pack_frame(protocol.MSG_ENCRYPTED_KEY,
+                                    protocol.pack_encrypted_key(algorithm, self.encrypt_symmetric_key(symmetric_key)),
+                                    flags)
+        return frame, symmetric_key
     
     def send_encrypted_message(self, message, algorithm='AES'):
         """
@@ -133,60 +138,19 @@ class Client:
             algorithm: 'AES', 'DES' veya 'RSA'
         """
         if algorithm == 'RSA':
-            # RSA ile direkt mesaj şifreleme
-            print(f"Mesaj RSA ile şifreleniyor...")
-            
-            # Mesajı parçalara böl (RSA 2048 bit = 245 byte max)
-            max_chunk_size = 245
-            message_bytes = message.encode('utf-8')
-            encrypted_chunks = []
-            
-            for i in range(0, len(message_bytes), max_chunk_size):
-                chunk = message_bytes[i:i+max_chunk_size]
-                encrypted_chunk = self.public_key.encrypt(
-                    chunk,
-                    padding.OAEP(
-                        mgf=padding.MGF1(algorithm=hashes.SHA256()),
-                        algorithm=hashes.SHA256(),
-                        label=None
-                    )
-                )
-                encrypted_chunks.append(base64.b64encode(encrypted_chunk).decode('utf-8'))
-            
-            print("✓ Mesaj RSA ile şifrelendi")
-            
-            # RSA şifreli mesajı gönder
-            message_data = {
-                'type': 'rsa_encrypted_message',
-                'algorithm': 'RSA',
-                'chunks': encrypted_chunks
-            }
-            message_json = json.dumps(message_data)
-            message_bytes = message_json.encode('utf-8')
-            
-            # Veriyi parça parça gönder (büyük mesajlar için)
-            total_sent = 0
-            while total_sent < len(message_bytes):
-                try:
-                    sent = self.socket.send(message_bytes[total_sent:])
-                    if sent == 0:
-                        raise RuntimeError("Socket baglantisi kesildi")
-                    total_sent += sent
-                except Exception as e:
-                    print(f"Hata: Mesaj gonderilirken hata: {str(e)}")
-                    raise
-            
+            # Hibrit şifreleme: RSA sadece rastgele AES-256-GCM anahtarını sarar,
+            # mesaj parça parça AEAD ile şifrelenip akış olarak gönderilir
+            print(f"Mesaj RSA (hibrit) ile şifreleniyor...")
+            for frame in hybrid_frames(message.encode('utf-8'), self.encrypt_symmetric_key):
+                self.socket.sendall(frame)
             print("✓ Şifrelenmiş mesaj gönderildi")
             
         else:
-            # Simetrik anahtar oluştur
-            if algorithm == 'AES':
-                symmetric_key = os.urandom(16)
-            elif algorithm == 'DES':
-                symmetric_key = os.urandom(8)
-            else:
+            if algorithm not in ('AES', 'DES'):
                 raise ValueError("Algoritma 'AES', 'DES' veya 'RSA' olmalıdır")
             
+            # Simetrik anahtarı oluştur (RSA ile şifrelenir veya X25519 ile türetilir)
+            key_frame, symmetric_key = self._key_exchange_frame(algorithm)
             print(f"\nSimetrik anahtar oluşturuldu: {symmetric_key.hex()[:32]}...")
             
             # Mesajı şifrele
@@ -198,44 +162,146 @@ class Client:
             
             print("✓ Mesaj şifrelendi")
             
-            # Simetrik anahtarı RSA ile şifrele
-            print("Simetrik anahtar RSA ile şifreleniyor...")
-            encrypted_key_b64 = self.encrypt_symmetric_key(symmetric_key)
-            print("✓ Simetrik anahtar şifrelendi")
-            
-            # Şifrelenmiş anahtarı gönder
-            key_data = {
-                'type': 'encrypted_key',
-                'algorithm': algorithm,
-                'encrypted_key': encrypted_key_b64
-            }
-            key_json = json.dumps(key_data)
-            self.socket.sendall(key_json.encode('utf-8'))
+            # Anahtar ve mesaj çerçeveleri tek seferde gönderilir;
+            # sınırlar başlıktaki uzunluktan bulunduğu için beklemeye gerek yok
+            message_frame = protocol.pack_frame(protocol.MSG_ENCRYPTED_MESSAGE,
+                                                protocol.pack_encrypted_message(iv, ciphertext))
+            self.socket.sendall(key_frame + message_frame)
             print("✓ Şifrelenmiş anahtar gönderildi")
-            
-            # Kısa bir bekleme (sunucunun veriyi alması için)
-            import time
-            time.sleep(0.1)
-            
-            # Şifrelenmiş mesajı gönder
-            message_data = {
-                'type': 'encrypted_message',
-                'iv': base64.b64encode(iv).decode('utf-8'),
-                'ciphertext': base64.b64encode(ciphertext).decode('utf-8')
-            }
-            message_json = json.dumps(message_data)
-            self.socket.sendall(message_json.encode('utf-8'))
             print("✓ Şifrelenmiş mesaj gönderildi")
         
         # Sunucudan onay al
-        response = self.socket.recv(4096).decode('utf-8')
-        response_data = json.loads(response)
-        
-        if response_data['type'] == 'ack':
-            print(f"\n✓ Sunucu onayı: {response_data['message']}")
+        _, _, response = protocol.recv_frame(self.socket, protocol.MSG_ACK)
+        print(f"\n✓ Sunucu onayı: {bytes(response).decode('utf-8')}")
         
         return True
     
+    def send_legacy_rsa_message(self, message):
+        """
+        Mesajı eski biçimde (her parça ayrı RSA-OAEP ile) gönderir; hibrit
+        biçimi desteklemeyen sunucularla uyumluluk için saklanmıştır.
+        """
+        message_bytes = message.encode('utf-8')
+        encrypted_chunks = [
+            self.encrypt_symmetric_key(message_bytes[i:i + LEGACY_RSA_CHUNK_SIZE])
+            for i in range(0, len(message_bytes), LEGACY_RSA_CHUNK_SIZE)
+        ]
+        protocol.send_frame(self.socket, protocol.MSG_RSA_MESSAGE,
+                            protocol.pack_rsa_chunks(encrypted_chunks))
+        _, _, response = protocol.recv_frame(self.socket, protocol.MSG_ACK)
+        print(f"\n✓ Sunucu onayı: {bytes(response).decode('utf-8')}")
+        return True
+    
+    def _resume_session(self, algorithm):
+        """
+        Saklanan biletle RSA kullanmadan oturumu sürdürmeyi dener.
+        
+        Returns:
+            Sunucu bileti kabul ettiyse oturum anahtarı, reddettiyse None
+        """
+        ticket = self.ticket
+        if ticket is None or ticket['algorithm'] != algorithm or time.monotonic() >= ticket['expires']:
+            return None
+        client_random = os.urandom(RANDOM_SIZE)
+        protocol.send_frame(self.socket, protocol.MSG_RESUME, pack_resume(client_random, ticket['ticket']))
+        msg_type, _, payload = protocol.recv_frame(
+            self.socket, (protocol.MSG_RESUMED, protocol.MSG_RESUME_REJECTED)
+        )
+        if msg_type == protocol.MSG_RESUME_REJECTED:
+            print(f"Bilet reddedildi: {bytes(payload).decode('utf-8')}")
+            self.ticket = None
+            return None
+        return derive_resumption_key(ticket['secret'], client_random, bytes(payload))
+    
+    def start_session(self, algorithm='AES', ack_every=DEFAULT_ACK_EVERY, use_ticket=True):
+        """
+        Oturum açar: simetrik anahtar bağlantı başına bir kez kurulur (RSA
+        veya X25519, bkz. key_exchange), sonraki mesajlar send_session_message ile aynı soketten
+        sadece AES/DES ile şifrelenerek gider.
+        
+        use_ticket True ise tam el sıkışmada sunucudan oturum bileti istenir;
+        geçerli bir bilet varsa RSA hiç kullanılmadan oturum sürdürülür.
+        
+        Args:
+            algorithm: 'AES' veya 'DES'
+            ack_every: Kaç mesajda bir sunucudan toplu onay istenir
+            use_ticket: Oturum biletlerini kullan
+        
+        Returns:
+            Oturum biletle sürdürüldüyse True, tam el sıkışma yapıldıysa False
+        """
+        if algorithm not in ('AES', 'DES'):
+            raise ValueError("Oturum algoritması 'AES' veya 'DES' olmalıdır")
+        if ack_every < 1:
+            raise ValueError("ack_every pozitif olmalıdır!")
+        
+        symmetric_key = self._resume_session(algorithm) if use_ticket else None
+        resumed = symmetric_key is not None
+        if not resumed:
+            flags = protocol.FLAG_SESSION | (protocol.FLAG_TICKET_REQUEST if use_ticket else 0)
+            key_frame, symmetric_key = self._key_exchange_frame(algorithm, flags)
+            self.socket.sendall(key_frame)
+            if use_ticket:
+                _, _, payload = protocol.recv_frame(self.socket, protocol.MSG_TICKET)
+                lifetime, ticket = unpack_ticket_message(payload)
+                self.ticket = {'ticket': ticket, 'algorithm': algorithm, 'secret': symmetric_key,
+                               'expires': time.monotonic() + lifetime}
+        
+        self.session = session_context(algorithm, symmetric_key)
+        self.session_mac_key = derive_mac_key(symmetric_key)
+        self.ack_every = ack_every
+        self.next_sequence = 0
+        self.acked = 0
+        print(f"✓ Oturum açıldı ({algorithm}{', biletle sürdürüldü' if resumed else ''})")
+        return resumed
+    
+    def _receive_ack(self):
+        """Sunucunun toplu onayını okur; gönderilen tüm mesajları kapsamalıdır."""
+        _, _, payload = protocol.recv_frame(self.socket, protocol.MSG_SESSION_ACK)
+        acked = unpack_ack(payload)
+        if acked != self.next_sequence:
+            raise ValueError(f"Onay uyuşmuyor: {acked} (gönderilen {self.next_sequence})")
+        self.acked = acked
+        return acked
+    
+    def send_session_message(self, message, wait_ack=False):
+        """
+        Açık oturum üzerinden bir mesaj gönderir.
+        
+        Her ack_every mesajda bir (veya wait_ack=True ise) sunucudan onay
+        istenir ve beklenir; aradaki mesajlar onay beklemeden gönderilir.
+        
+        Returns:
+            Mesajın sıra numarası
+        """
+        if self.session is None:
+            raise ValueError("Önce start_session ile oturum açılmalıdır!")
+        sequence = self.next_sequence
+        iv, ciphertext = self.session.encrypt(message.encode('utf-8'))
+        request_ack = wait_ack or (sequence + 1) % self.ack_every == 0
+        protocol.send_frame(self.socket, protocol.MSG_SESSION_MESSAGE,
+                            pack_session_message(sequence, iv, ciphertext, self.session_mac_key),
+                            protocol.FLAG_ACK_REQUEST if request_ack else 0)
+        self.next_sequence += 1
+        if request_ack:
+            self._receive_ack()
+        return sequence
+    
+    def end_session(self):
+        """
+        Oturumu kapatır ve son toplu onayı bekler.
+        
+        Returns:
+            Sunucunun onayladığı toplam mesaj sayısı
+        """
+        if self.session is None:
+            raise ValueError("Açık oturum yok!")
+        protocol.send_frame(self.socket, protocol.MSG_CLOSE)
+        acked = self._receive_ack()
+        self.session = None
+        print(f"✓ Oturum kapatıldı: {acked} mesaj onaylandı")
+        return acked
+    
     def disconnect(self):
         """Sunucu bağlantısını kapatır."""
         if self.socket:
@@ -0,0 +1,125 @@
+"""
+Kriptoloji Projesi - RSA Mesajları için Hibrit Akış Şifreleme
+send_encrypted_message(message, 'RSA') yolunun iç yapısı
+
+Eski biçimde mesaj 190 byte'lık parçalara bölünüp her parça ayrı ayrı
+RSA-OAEP ile şifreleniyordu; 1 MB'lık bir mesaj sunucuda ~5.500 RSA özel
+anahtar işlemi demekti. Hibrit biçimde sadece rastgele bir AES-256-GCM
+anahtarı RSA ile sarılır, mesaj bu anahtarla parça parça şifrelenip
+ayrı çerçevelerle gönderilir. Sunucu her parçayı geldiği anda doğrulayıp
+çözer; tüm mesajın gelmesini beklemez.
+
+    HYBRID_KEY:   nonce öneki (7) | RSA-OAEP ile sarılmış anahtar
+    HYBRID_CHUNK: AES-GCM(parça) || tag (16); son parçada FLAG_LAST_CHUNK
+
+Parça i'nin nonce'u önek || i (4) || son parça bayrağı (1)'dir (bkz.
+modern_ciphers.aead akış biçimi); parçalar yeniden sıralanamaz, eksiltilemez
+ve akış erken kesilemez. Anahtarı istemci sardığı için herkes akış
+başlatabilir; alıcı alınan toplam parça yükünü (tag'ler dahil)
+max_message_size ile sınırlar ve son parça dışındaki boş parçaları reddeder.
+"""
+
+from modern_ciphers import AEADContext, generate_aead_key
+from modern_ciphers.aead import DEFAULT_CHUNK_SIZE, TAG_SIZE, _STREAM_PREFIX_SIZE, _chunk_nonce
+from client_server import protocol
+
+import os
+
+HYBRID_ALGORITHM = 'AES-256-GCM'
+
+
+def pack_hybrid_key(prefix, wrapped_key):
+    """HYBRID_KEY yükü."""
+    return prefix + wrapped_key
+
+def unpack_hybrid_key(payload):
+    """
+    Returns:
+        (nonce öneki, sarılmış anahtar) tuple'ı
+    """
+    if len(payload) <= _STREAM_PREFIX_SIZE:
+        raise ValueError("Geçersiz hibrit anahtar mesajı!")
+    return bytes(payload[:_STREAM_PREFIX_SIZE]), bytes(payload[_STREAM_PREFIX_SIZE:])
+
+
+def hybrid_frames(data, wrap_key, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Veriyi hibrit biçimde şifreleyen çerçeveleri sırayla üretir.
+
+    Args:
+        data: Şifrelenecek veri (buffer protocol)
+        wrap_key: Anahtarı RSA ile saran fonksiyon (bytes -> bytes)
+        chunk_size: Parça boyutu
+
+    Yields:
+        Gönderilecek çerçeveler (önce HYBRID_KEY, sonra HYBRID_CHUNK'lar)
+    """
+    if chunk_size < 1 or chunk_size + TAG_SIZE > protocol.MAX_PAYLOAD_SIZE:
+        raise ValueError("Geçersiz parça boyutu!")
+    key = generate_aead_key(HYBRID_ALGORITHM)
+    prefix = os.urandom(_STREAM_PREFIX_SIZE)
+    context = AEADContext(key, HYBRID_ALGORITHM)
+    yield protocol.pack_frame(protocol.MSG_HYBRID_KEY, pack_hybrid_key(prefix, wrap_key(key)))
+
+    view = memoryview(data).cast('B')
+    count = max(1, -(-len(view) // chunk_size))
+    for index in range(count):
+        is_last = index == count - 1
+        _, sealed = context.encrypt(view[index * chunk_size:(index + 1) * chunk_size],
+                                    nonce=_chunk_nonce(prefix, index, is_last))
+        yield protocol.pack_frame(protocol.MSG_HYBRID_CHUNK, sealed,
+                                  protocol.FLAG_LAST_CHUNK if is_last else 0)
+
+
+class HybridReceiver:
+    """
+    Hibrit mesajın parçalarını geldikçe doğrulayıp çözen alıcı.
+
+    Args:
+        payload: HYBRID_KEY yükü
+        unwrap_key: Sarılmış anahtarı RSA ile çözen fonksiyon (bytes -> bytes)
+        max_message_size: Alınan HYBRID_CHUNK yüklerinin toplam boyut sınırı
+            (byte, tag'ler dahil)
+    """
+
+    def __init__(self, payload, unwrap_key, max_message_size=protocol.MAX_PAYLOAD_SIZE):
+        self.prefix, wrapped_key = unpack_hybrid_key(payload)
+        self._context = AEADContext(unwrap_key(wrapped_key), HYBRID_ALGORITHM)
+        self.max_message_size = max_message_size
+        self.size = 0
+        self.index = 0
+        self.finished = False
+        self._parts = []
+
+    def receive(self, flags, payload):
+        """
+        Bir HYBRID_CHUNK yükünü doğrulayıp çözer.
+
+        Returns:
+            Parçanın düz metni
+
+        Raises:
+            ValueError: Parça doğrulanamazsa, son parça dışında boşsa, son
+                parçadan sonra veri gelirse veya toplam boyut max_message_size'ı aşarsa
+        """
+        if self.finished:
+            raise ValueError("Son parçadan sonra beklenmeyen veri!")
+        is_last = bool(flags & protocol.FLAG_LAST_CHUNK)
+        # Çözmeden önce: sınırı aşan akış için ne CPU ne bellek harcanır.
+        # Sadece tag'den oluşan parçalar da sayılır; sonsuz boş parça akışı olmaz
+        if len(payload) <= TAG_SIZE and not is_last:
+            raise ValueError("Boş hibrit parça!")
+        self.size += len(payload)
+        if self.size > self.max_message_size:
+            raise ValueError("Mesaj boyutu sınırı aşıldı!")
+        plaintext = self._context.decrypt(_chunk_nonce(self.prefix, self.index, is_last), payload)
+        self.index += 1
+        self.finished = is_last
+        self._parts.append(plaintext)
+        return plaintext
+
+    def message(self):
+        """Tüm parçalar alındıktan sonra mesajı metin olarak döndürür."""
+        if not self.finished:
+            raise ValueError("Mesaj henüz tamamlanmadı!")
+        return b''.join(self._parts).decode('utf-8')
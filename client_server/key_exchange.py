@@ -0,0 +1,95 @@
+"""
+Kriptoloji Projesi - X25519 Anahtar Anlaşması
+RSA-OAEP anahtar taşımaya hızlı ve ileri gizlilikli (forward secrecy) alternatif
+
+Sunucu her bağlantıda geçici (ephemeral) bir X25519 anahtar çifti üretir
+ve açık payını RSA açık anahtarıyla birlikte karşılama mesajında
+(PUBLIC_KEY, FLAG_KEY_SHARE bayrağıyla) gönderir. X25519 seçen istemci
+kendi geçici payını KEY_EXCHANGE ile yollar; iki taraf ortak sırdan
+AES/DES oturum anahtarını HKDF-SHA256 ile türetir. Geçici anahtarlar
+bağlantıdan sonra atıldığı için sunucunun RSA anahtarı ele geçse bile
+geçmiş oturumlar çözülemez. Sunucu tarafında bir RSA özel anahtar
+işlemi yerine bir X25519 anahtar üretimi ve bir anlaşma yapılır.
+
+Yük biçimleri:
+    PUBLIC_KEY (FLAG_KEY_SHARE): sunucu payı (32) | DER RSA açık anahtarı
+    KEY_EXCHANGE:                algoritma (1) | istemci payı (32)
+
+KEY_EXCHANGE, ENCRYPTED_KEY ile aynı bayrakları (FLAG_SESSION,
+FLAG_TICKET_REQUEST) ve aynı devamı (ENCRYPTED_MESSAGE veya oturum) kullanır.
+Not: RSA yolunda olduğu gibi sunucu kimliği doğrulanmaz.
+"""
+
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric.x25519 import X25519PrivateKey, X25519PublicKey
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
+
+from client_server import protocol
+
+KEY_SHARE_SIZE = 32
+SYMMETRIC_KEY_SIZES = {'AES': 16, 'DES': 8}
+
+
+def generate_key_share():
+    """
+    Geçici X25519 anahtar çifti üretir.
+
+    Returns:
+        (özel anahtar, 32 byte açık pay) tuple'ı
+    """
+    private_key = X25519PrivateKey.generate()
+    share = private_key.public_key().public_bytes(
+        encoding=serialization.Encoding.Raw,
+        format=serialization.PublicFormat.Raw
+    )
+    return private_key, share
+
+def derive_session_key(private_key, peer_share, algorithm, server_share, client_share):
+    """
+    Ortak sırdan algoritmaya uygun boyutta oturum anahtarı türetir.
+
+    Raises:
+        ValueError: Karşı tarafın payı geçersizse
+    """
+    if algorithm not in SYMMETRIC_KEY_SIZES:
+        raise ValueError("Anahtar anlaşması algoritması 'AES' veya 'DES' olmalıdır")
+    if len(peer_share) != KEY_SHARE_SIZE:
+        raise ValueError("Geçersiz X25519 payı!")
+    shared_secret = private_key.exchange(X25519PublicKey.from_public_bytes(bytes(peer_share)))
+    return HKDF(
+        algorithm=hashes.SHA256(),
+        length=SYMMETRIC_KEY_SIZES[algorithm],
+        salt=server_share + client_share,
+        info=b'client_server x25519 ' + algorithm.encode('ascii'),
+    ).derive(shared_secret)
+
+def pack_greeting(rsa_public_der, server_share):
+    """FLAG_KEY_SHARE bayraklı PUBLIC_KEY yükü."""
+    return server_share + rsa_public_der
+
+def unpack_greeting(flags, payload):
+    """
+    PUBLIC_KEY yükünü çözümler.
+
+    Returns:
+        (DER RSA açık anahtarı, sunucu payı veya None) tuple'ı
+    """
+    if not flags & protocol.FLAG_KEY_SHARE:
+        return bytes(payload), None
+    if len(payload) <= KEY_SHARE_SIZE:
+        raise ValueError("Geçersiz karşılama mesajı!")
+    return bytes(payload[KEY_SHARE_SIZE:]), bytes(payload[:KEY_SHARE_SIZE])
+
+def pack_key_exchange(algorithm, client_share):
+    """KEY_EXCHANGE yükü."""
+    return bytes([protocol.ALGORITHM_IDS[algorithm]]) + client_share
+
+def unpack_key_exchange(payload):
+    """
+    Returns:
+        (algoritma, istemci payı) tuple'ı
+    """
+    if len(payload) != 1 + KEY_SHARE_SIZE:
+        raise ValueError("Geçersiz anahtar anlaşması mesajı!")
+    algorithm, _ = protocol.unpack_encrypted_key(payload[:1])
+    return algorithm, bytes(payload[1:])
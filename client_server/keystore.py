@@ -0,0 +1,110 @@
+"""
+Kriptoloji Projesi - Sunucu RSA Anahtarının Diskte Saklanması
+PEM (PKCS8) dosyasından yükleme, ilk çalıştırmada üretip kaydetme ve
+anahtar döndürme (rotation)
+
+2048 bit RSA anahtarı üretmek yüzlerce milisaniye ile saniyeler sürer;
+diskteki anahtarı yüklemek ise milisaniyeler. Aynı anahtarı paylaşan
+sunucular (yeniden başlatma, kopyalar) aynı açık anahtarı sunar.
+Parola verilirse anahtar dosyası şifreli (BestAvailableEncryption) yazılır.
+
+Yüklemedeki asıl maliyet RSA anahtar tutarlılık kontrolüdür (~50 ms);
+dosya güvenilir bir kaynaktan geliyorsa (sunucunun kendi yazdığı, 0600
+izinli dosya) validate=False ile atlanabilir.
+"""
+
+import os
+import shutil
+import time
+
+from cryptography.hazmat.primitives.asymmetric import rsa
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.backends import default_backend
+
+DEFAULT_KEY_SIZE = 2048
+
+
+def _password(passphrase):
+    if passphrase is None or isinstance(passphrase, bytes):
+        return passphrase
+    return passphrase.encode('utf-8')
+
+def generate_private_key(key_size=DEFAULT_KEY_SIZE):
+    """Yeni bir RSA özel anahtarı üretir."""
+    return rsa.generate_private_key(
+        public_exponent=65537,
+        key_size=key_size,
+        backend=default_backend()
+    )
+
+def save_private_key(private_key, path, passphrase=None):
+    """
+    Özel anahtarı PEM olarak atomik biçimde (geçici dosya + os.replace) ve
+    sadece sahibinin okuyabileceği izinlerle yazar.
+    """
+    password = _password(passphrase)
+    encryption = (serialization.BestAvailableEncryption(password) if password
+                  else serialization.NoEncryption())
+    pem = private_key.private_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PrivateFormat.PKCS8,
+        encryption_algorithm=encryption
+    )
+    tmp_path = f"{path}.tmp"
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, 'wb') as f:
+        f.write(pem)
+    os.replace(tmp_path, path)
+
+def load_private_key(path, passphrase=None, validate=True):
+    """
+    PEM dosyasından özel anahtarı yükler.
+
+    Args:
+        validate: False ise RSA tutarlılık kontrolü atlanır (sadece güvenilir dosyalar için)
+
+    Raises:
+        ValueError: Dosya geçersizse, parola yanlışsa veya eksikse
+    """
+    with open(path, 'rb') as f:
+        pem = f.read()
+    try:
+        private_key = serialization.load_pem_private_key(
+            pem, password=_password(passphrase), backend=default_backend(),
+            unsafe_skip_rsa_key_validation=not validate
+        )
+    except TypeError:
+        # Şifreli dosya için parola verilmemiş (veya tersi)
+        raise ValueError("Anahtar dosyası parolası eksik veya gereksiz!") from None
+    except ValueError:
+        raise ValueError("Anahtar dosyası okunamadı: parola yanlış veya dosya bozuk!") from None
+    if not isinstance(private_key, rsa.RSAPrivateKey):
+        raise ValueError("Anahtar dosyası bir RSA özel anahtarı içermiyor!")
+    return private_key
+
+def load_or_generate_private_key(path, passphrase=None, key_size=DEFAULT_KEY_SIZE, validate=True):
+    """
+    Anahtar dosyası varsa yükler, yoksa üretip kaydeder.
+
+    Returns:
+        (özel anahtar, yeni üretildiyse True) tuple'ı
+    """
+    if os.path.exists(path):
+        return load_private_key(path, passphrase, validate), False
+    private_key = generate_private_key(key_size)
+    save_private_key(private_key, path, passphrase)
+    return private_key, True
+
+def rotate_private_key(path, passphrase=None, key_size=DEFAULT_KEY_SIZE):
+    """
+    Yeni anahtar üretip path'e atomik olarak yazar; eski dosyanın bir
+    kopyası path.<zaman damgası>.old olarak saklanır.
+
+    Returns:
+        Yeni özel anahtar
+    """
+    private_key = generate_private_key(key_size)
+    if os.path.exists(path):
+        shutil.copy2(path, f"{path}.{int(time.time())}.old")
+    save_private_key(private_key, path, passphrase)
+    return private_key
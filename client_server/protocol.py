@@ -0,0 +1,217 @@
+"""
+Kriptoloji Projesi - İkili Çerçeveleme (Framing) Protokolü
+İstemci ve sunucunun ortak kullandığı mesaj biçimi
+
+Her mesaj sabit boyutlu bir başlık ve ardından gelen ham (base64'süz)
+yükten oluşur:
+
+    başlık: tip (1) | sürüm (1) | bayraklar (2) | yük uzunluğu (4)
+    yük:    uzunluk kadar byte
+
+Mesaj sınırı başlıktaki uzunluktan bilindiği için alıcı tam olarak o kadar
+byte okur; süslü parantez saymaya, bekleme (sleep) veya zaman aşımıyla
+"veri bitti mi" tahminine gerek kalmaz.
+
+Yük biçimleri:
+    PUBLIC_KEY:        DER (SubjectPublicKeyInfo) açık anahtar
+    ENCRYPTED_KEY:     algoritma (1) | RSA ile şifrelenmiş simetrik anahtar
+    ENCRYPTED_MESSAGE: IV uzunluğu (1) | IV | şifreli metin
+    RSA_MESSAGE:       [parça uzunluğu (2) | RSA şifreli parça] ...
+    ACK / ERROR:       UTF-8 metin
+
+Oturum mesajları (SESSION_MESSAGE, SESSION_ACK, CLOSE) session, bilet
+mesajları (TICKET, RESUME, RESUMED, RESUME_REJECTED) tickets, X25519
+anahtar anlaşması (KEY_EXCHANGE) key_exchange, hibrit RSA mesajları
+(HYBRID_KEY, HYBRID_CHUNK) hybrid modülünde tanımlanır.
+"""
+
+import struct
+
+VERSION = 1
+MAX_PAYLOAD_SIZE = 16 * 1024 * 1024
+
+# Mesaj tipleri
+MSG_PUBLIC_KEY = 1
+MSG_ENCRYPTED_KEY = 2
+MSG_ENCRYPTED_MESSAGE = 3
+MSG_RSA_MESSAGE = 4
+MSG_ACK = 5
+MSG_ERROR = 6
+MSG_SESSION_MESSAGE = 7
+MSG_SESSION_ACK = 8
+MSG_CLOSE = 9
+MSG_TICKET = 10
+MSG_RESUME = 11
+MSG_RESUMED = 12
+MSG_RESUME_REJECTED = 13
+MSG_KEY_EXCHANGE = 14
+MSG_HYBRID_KEY = 15
+MSG_HYBRID_CHUNK = 16
+
+# Bayraklar
+FLAG_SESSION = 0x0001       # ENCRYPTED_KEY: oturum modunu başlatır
+FLAG_ACK_REQUEST = 0x0002   # SESSION_MESSAGE: sunucudan toplu onay ister
+FLAG_TICKET_REQUEST = 0x0004  # ENCRYPTED_KEY: oturum bileti ister
+FLAG_KEY_SHARE = 0x0008     # PUBLIC_KEY: yük X25519 sunucu payı da içerir
+FLAG_LAST_CHUNK = 0x0010    # HYBRID_CHUNK: mesajın son parçası
+
+MESSAGE_NAMES = {
+    MSG_PUBLIC_KEY: 'public_key',
+    MSG_ENCRYPTED_KEY: 'encrypted_key',
+    MSG_ENCRYPTED_MESSAGE: 'encrypted_message',
+    MSG_RSA_MESSAGE: 'rsa_encrypted_message',
+    MSG_ACK: 'ack',
+    MSG_ERROR: 'error',
+    MSG_SESSION_MESSAGE: 'session_message',
+    MSG_SESSION_ACK: 'session_ack',
+    MSG_CLOSE: 'close',
+    MSG_TICKET: 'ticket',
+    MSG_RESUME: 'resume',
+    MSG_RESUMED: 'resumed',
+    MSG_RESUME_REJECTED: 'resume_rejected',
+    MSG_KEY_EXCHANGE: 'key_exchange',
+    MSG_HYBRID_KEY: 'hybrid_key',
+    MSG_HYBRID_CHUNK: 'hybrid_chunk',
+}
+
+ALGORITHM_IDS = {'AES': 1, 'DES': 2, 'RSA': 3}
+_ALGORITHM_BY_ID = {v: k for k, v in ALGORITHM_IDS.items()}
+
+_HEADER = struct.Struct('>BBHI')
+HEADER_SIZE = _HEADER.size
+_CHUNK_LENGTH = struct.Struct('>H')
+
+
+def pack_frame(msg_type, payload=b'', flags=0):
+    """Başlık ve yükü tek bir çerçevede birleştirir."""
+    if len(payload) > MAX_PAYLOAD_SIZE:
+        raise ValueError("Mesaj boyutu sınırı aşıldı!")
+    return _HEADER.pack(msg_type, VERSION, flags, len(payload)) + bytes(payload)
+
+def parse_header(header, max_size=MAX_PAYLOAD_SIZE):
+    """
+    Çerçeve başlığını çözümler.
+
+    Returns:
+        (tip, bayraklar, yük uzunluğu) tuple'ı
+
+    Raises:
+        ValueError: Sürüm, tip veya uzunluk geçersizse
+    """
+    msg_type, version, flags, length = _HEADER.unpack(header)
+    if version != VERSION:
+        raise ValueError(f"Desteklenmeyen protokol sürümü: {version}")
+    if msg_type not in MESSAGE_NAMES:
+        raise ValueError(f"Bilinmeyen mesaj tipi: {msg_type}")
+    if length > max_size:
+        raise ValueError("Mesaj boyutu sınırı aşıldı!")
+    return msg_type, flags, length
+
+def _check_type(msg_type, payload, expected):
+    """Beklenen tip gelmediyse ValueError fırlatır (ERROR mesajının metniyle)."""
+    if expected is None or msg_type == expected or (
+            not isinstance(expected, int) and msg_type in expected):
+        return
+    if msg_type == MSG_ERROR:
+        raise ValueError(f"Karşı taraf hata bildirdi: {bytes(payload).decode('utf-8', 'replace')}")
+    raise ValueError(f"Beklenmeyen mesaj tipi: {MESSAGE_NAMES[msg_type]}")
+
+
+# --- Bloklayan soketler ---
+
+def recv_exact(sock, n):
+    """Soketten tam olarak n byte okur."""
+    buffer = bytearray(n)
+    view = memoryview(buffer)
+    received = 0
+    while received < n:
+        count = sock.recv_into(view[received:])
+        if not count:
+            raise ConnectionError("Bağlantı karşı tarafça kapatıldı")
+        received += count
+    return buffer
+
+def send_frame(sock, msg_type, payload=b'', flags=0):
+    """Bir çerçeveyi sokete gönderir."""
+    sock.sendall(pack_frame(msg_type, payload, flags))
+
+def recv_frame(sock, expected=None, max_size=MAX_PAYLOAD_SIZE):
+    """
+    Soketten bir çerçeve okur.
+
+    Args:
+        sock: Bloklayan soket
+        expected: Beklenen mesaj tipi (veya tipler); None ise kontrol edilmez
+
+    Returns:
+        (tip, bayraklar, yük) tuple'ı
+    """
+    msg_type, flags, length = parse_header(recv_exact(sock, HEADER_SIZE), max_size)
+    payload = recv_exact(sock, length) if length else bytearray()
+    _check_type(msg_type, payload, expected)
+    return msg_type, flags, payload
+
+
+# --- asyncio akışları ---
+
+async def read_frame(reader, expected=None, max_size=MAX_PAYLOAD_SIZE):
+    """asyncio.StreamReader'dan bir çerçeve okur; bkz. recv_frame."""
+    msg_type, flags, length = parse_header(await reader.readexactly(HEADER_SIZE), max_size)
+    payload = await reader.readexactly(length) if length else b''
+    _check_type(msg_type, payload, expected)
+    return msg_type, flags, payload
+
+def write_frame(writer, msg_type, payload=b'', flags=0):
+    """asyncio.StreamWriter'a bir çerçeve yazar (drain çağıranın işidir)."""
+    writer.write(pack_frame(msg_type, payload, flags))
+
+
+# --- Yük biçimleri ---
+
+def pack_encrypted_key(algorithm, encrypted_key):
+    """ENCRYPTED_KEY yükü: algoritma kimliği ve RSA ile şifrelenmiş anahtar."""
+    if algorithm not in ALGORITHM_IDS:
+        raise ValueError(f"Algoritma {', '.join(ALGORITHM_IDS)} değerlerinden biri olmalıdır!")
+    return bytes([ALGORITHM_IDS[algorithm]]) + encrypted_key
+
+def unpack_encrypted_key(payload):
+    """
+    Returns:
+        (algoritma, şifreli anahtar) tuple'ı
+    """
+    if not payload or payload[0] not in _ALGORITHM_BY_ID:
+        raise ValueError("Geçersiz anahtar mesajı!")
+    return _ALGORITHM_BY_ID[payload[0]], bytes(payload[1:])
+
+def pack_encrypted_message(iv, ciphertext):
+    """ENCRYPTED_MESSAGE yükü: IV uzunluğu, IV ve şifreli metin."""
+    return bytes([len(iv)]) + iv + ciphertext
+
+def unpack_encrypted_message(payload):
+    """
+    Returns:
+        (iv, şifreli metin) tuple'ı
+    """
+    if not payload or len(payload) < 1 + payload[0]:
+        raise ValueError("Geçersiz şifreli mesaj!")
+    iv_size = payload[0]
+    return bytes(payload[1:1 + iv_size]), bytes(payload[1 + iv_size:])
+
+def pack_rsa_chunks(chunks):
+    """RSA_MESSAGE yükü: her parça 2 byte uzunluk önekiyle."""
+    return b''.join(_CHUNK_LENGTH.pack(len(chunk)) + chunk for chunk in chunks)
+
+def unpack_rsa_chunks(payload):
+    """RSA_MESSAGE yükünü parça listesine ayırır."""
+    chunks = []
+    offset = 0
+    while offset < len(payload):
+        if offset + _CHUNK_LENGTH.size > len(payload):
+            raise ValueError("Geçersiz RSA mesajı!")
+        (size,) = _CHUNK_LENGTH.unpack_from(payload, offset)
+        offset += _CHUNK_LENGTH.size
+        if offset + size > len(payload):
+            raise ValueError("Geçersiz RSA mesajı!")
+        chunks.append(bytes(payload[offset:offset + size]))
+        offset += size
+    return chunks
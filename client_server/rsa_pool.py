@@ -0,0 +1,86 @@
+"""
+Kriptoloji Projesi - Eski RSA Mesajları için Paralel Parça Çözme
+RSA_MESSAGE parçalarının bir iş parçacığı havuzunda çözülmesi
+
+Eski biçimde (bkz. Client.send_legacy_rsa_message) her 190 byte'lık parça
+ayrı bir RSA-OAEP özel anahtar işlemidir (2048 bit için ~0.4 ms) ve
+parçalar birbirinden bağımsızdır. cryptography RSA çözme sırasında GIL'i
+bıraktığı için (8192 bitlik tek çözme ~40 ms sürerken diğer iş parçacıkları
+en fazla ~8 ms bekledi) süreç havuzuna ve özel anahtarın kopyalanmasına
+gerek yoktur; iş parçacıkları aynı anahtarı paylaşır.
+
+Havuzdaki bekleyen parça sayısı bir semaforla sınırlanır: aynı anda çok
+sayıda istemci büyük mesaj gönderdiğinde yeni parçalar, yer açılana kadar
+gönderen bağlantının iş parçacığında bekletilir (back-pressure); kuyruk
+sınırsız büyümez. Sonuçlar parçaların gönderim sırasıyla birleştirilir.
+"""
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# İş parçacığı başına bekleyebilecek parça sayısı (varsayılan max_pending için)
+DEFAULT_PENDING_PER_WORKER = 4
+
+
+class RSADecryptPool:
+    """
+    Bağımsız parçaları sınırlı bir iş parçacığı havuzunda çözen yardımcı.
+
+    Args:
+        decrypt: Tek parçayı çözen fonksiyon (bytes -> bytes)
+        workers: İş parçacığı sayısı (None ise os.cpu_count())
+        max_pending: Havuzda aynı anda bekleyebilecek en fazla parça
+            (None ise workers * DEFAULT_PENDING_PER_WORKER)
+    """
+
+    def __init__(self, decrypt, workers=None, max_pending=None):
+        self.workers = workers or os.cpu_count() or 1
+        if self.workers < 1:
+            raise ValueError("İş parçacığı sayısı pozitif olmalıdır!")
+        self.max_pending = max_pending or self.workers * DEFAULT_PENDING_PER_WORKER
+        self._decrypt = decrypt
+        self._slots = threading.BoundedSemaphore(self.max_pending)
+        self._executor = None
+        self._lock = threading.Lock()
+
+    def _submit(self, chunk):
+        """Yer açılana kadar bekler ve parçayı havuza verir."""
+        self._slots.acquire()
+        try:
+            future = self._executor.submit(self._decrypt, chunk)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+    def map(self, chunks):
+        """
+        Parçaları çözer.
+
+        Returns:
+            Çözülmüş parçalar (gönderim sırasıyla)
+
+        Raises:
+            ValueError: Herhangi bir parça çözülemezse (kalan parçalar iptal edilir)
+        """
+        if self.workers == 1 or len(chunks) < 2:
+            # Tek parçada havuza geçiş maliyeti kazançtan büyük
+            return [self._decrypt(chunk) for chunk in chunks]
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(self.workers, thread_name_prefix='rsa-decrypt')
+        futures = []
+        try:
+            for chunk in chunks:
+                futures.append(self._submit(chunk))
+            return [future.result() for future in futures]
+        finally:
+            for future in futures:
+                future.cancel()
+
+    def shutdown(self):
+        """Havuzu kapatır."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
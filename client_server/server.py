@@ -12,30 +12,211 @@ if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
 import socket
-import json
-import base64
-import time
-from cryptography.hazmat.primitives.asymmetric import rsa, padding
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from cryptography.hazmat.primitives.asymmetric import padding
 from cryptography.hazmat.primitives import serialization, hashes
-from cryptography.hazmat.backends import default_backend
 from modern_ciphers import aes_decrypt, des_decrypt
+from client_server import protocol
+from client_server.hybrid import HybridReceiver
+from client_server.key_exchange import (
+    derive_session_key, generate_key_share, pack_greeting, unpack_key_exchange
+)
+from client_server.keystore import (
+    generate_private_key, load_or_generate_private_key, rotate_private_key
+)
+from client_server.rsa_pool import RSADecryptPool
+from client_server.session import ServerSession
+from client_server.tickets import (
+    DEFAULT_TICKET_LIFETIME, RANDOM_SIZE, TicketManager, derive_resumption_key,
+    pack_ticket_message, unpack_resume
+)
 
 
 class Server:
-    def __init__(self, host='localhost', port=12345):
+    """
+    RSA anahtar dağıtımlı sunucu.
+    
+    Args:
+        host, port: Dinlenecek adres
+        ticket_lifetime, ticket_rotation: Oturum bileti süresi ve bilet anahtarı yenilenme aralığı (s)
+        key_path: RSA özel anahtarının PEM dosyası (yoksa üretilip kaydedilir;
+                  None ise her başlatmada bellekte yeni anahtar üretilir)
+        key_passphrase: Anahtar dosyasının parolası
+        validate_key: False ise yüklenen anahtarın RSA tutarlılık kontrolü
+                      atlanır (~50 ms; sadece sunucunun kendi yazdığı dosya için)
+        enable_x25519: Karşılama mesajında X25519 payı sunulur (bkz. key_exchange)
+        lazy_key: True ise anahtar arka planda yüklenir/üretilir; sunucu hemen
+                  dinlemeye başlar, ilk bağlantılar anahtar hazır olunca hizmet alır
+        rsa_workers: Eski RSA mesajlarının parçalarını çözen iş parçacığı
+                     sayısı (None ise os.cpu_count(); 1 ise sırayla çözülür)
+        rsa_max_pending: Havuzda aynı anda bekleyebilecek en fazla parça
+                         (back-pressure; bkz. rsa_pool)
+        connection_workers: Verilirse bağlantılar bu boyutta bir iş parçacığı
+                            havuzunda işlenir (None ise sırayla, accept döngüsünde)
+        max_queued_connections: Havuz modunda işçi bekleyebilecek en fazla
+                                bağlantı; aşılırsa bağlantı reddedilir (None ise
+                                connection_workers)
+        client_timeout: Tek bir istemci soketindeki okuma/yazma süre sınırı (s)
+        max_message_size: Hibrit (parçalı) RSA mesajının toplam boyut sınırı
+            (byte, parça tag'leri dahil)
+    """
+    
+    def __init__(self, host='localhost', port=12345, ticket_lifetime=DEFAULT_TICKET_LIFETIME,
+                 ticket_rotation=None, key_path=None, key_passphrase=None, lazy_key=False,
+                 validate_key=True, enable_x25519=True, rsa_workers=None, rsa_max_pending=None,
+                 connection_workers=None, max_queued_connections=None, client_timeout=30.0,
+                 max_message_size=protocol.MAX_PAYLOAD_SIZE):
         self.host = host
         self.port = port
         self.socket = None
+        self.client_timeout = client_timeout
+        self.max_message_size = max_message_size
+        self._ack_frame = protocol.pack_frame(protocol.MSG_ACK,
+                                              'Mesaj başarıyla alındı ve çözüldü'.encode('utf-8'))
+        
+        # Bağlantı havuzu (connection_workers verilirse) ve gözlenebilir sayaçlar
+        self.connection_workers = connection_workers
+        self.max_queued_connections = (connection_workers if max_queued_connections is None
+                                       else max_queued_connections)
+        self.connection_pool = (ThreadPoolExecutor(connection_workers, thread_name_prefix='connection')
+                                if connection_workers else None)
+        self.stats = {'active': 0, 'queued': 0, 'served': 0, 'failed': 0, 'rejected': 0}
+        self._stats_lock = threading.Lock()
+        # Kuyrukta bekleyen bağlantılar (future -> handler); stop() bunları reddeder
+        self._pending = {}
         
-        # RSA anahtar çifti oluştur
-        print("RSA anahtar cifti olusturuluyor...")
-        self.private_key = rsa.generate_private_key(
-            public_exponent=65537,
-            key_size=2048,
-            backend=default_backend()
+        # Oturum biletleri ve el sıkışma sayaçları
+        self.tickets = TicketManager(ticket_lifetime, ticket_rotation)
+        self.handshakes = {'full': 0, 'resumed': 0, 'rejected_tickets': 0, 'x25519': 0}
+        self.enable_x25519 = enable_x25519
+        self.rsa_pool = RSADecryptPool(self._rsa_decrypt, rsa_workers, rsa_max_pending)
+        
+        # RSA anahtarı: diskten yükle veya üret (lazy_key ise arka planda)
+        self.key_path = key_path
+        self.key_passphrase = key_passphrase
+        self.validate_key = validate_key
+        self._key_state = None   # (özel anahtar, açık anahtar, DER, PUBLIC_KEY çerçevesi)
+        self._previous_private_key = None
+        self._key_error = None
+        self._key_ready = threading.Event()
+        if lazy_key:
+            threading.Thread(target=self._load_key, daemon=True).start()
+        else:
+            self._load_key()
+    
+    def _load_key(self):
+        try:
+            if self.key_path is None:
+                print("RSA anahtar cifti olusturuluyor...")
+                self._set_private_key(generate_private_key())
+                print("✓ RSA anahtar çifti oluşturuldu")
+            else:
+                private_key, generated = load_or_generate_private_key(
+                    self.key_path, self.key_passphrase, validate=self.validate_key
+                )
+                self._set_private_key(private_key)
+                if generated:
+                    print(f"✓ RSA anahtar çifti oluşturuldu ve kaydedildi: {self.key_path}")
+                else:
+                    print(f"✓ RSA anahtarı yüklendi: {self.key_path}")
+        except Exception as e:
+            self._key_error = e
+            print(f"HATA: RSA anahtarı yüklenemedi: {str(e)}")
+        finally:
+            self._key_ready.set()
+    
+    def _set_private_key(self, private_key):
+        """Anahtarı ve ondan türetilen açık anahtar çerçevesini birlikte değiştirir."""
+        public_key = private_key.public_key()
+        der = public_key.public_bytes(
+            encoding=serialization.Encoding.DER,
+            format=serialization.PublicFormat.SubjectPublicKeyInfo
         )
-        self.public_key = self.private_key.public_key()
-        print("✓ RSA anahtar çifti oluşturuldu")
+        self._key_state = (private_key, public_key, der, protocol.pack_frame(protocol.MSG_PUBLIC_KEY, der))
+    
+    @property
+    def key_ready(self):
+        """Anahtar yüklemesi bittiyse True."""
+        return self._key_ready.is_set()
+    
+    def wait_for_key(self, timeout=None):
+        """
+        Anahtar hazır olana kadar bekler.
+        
+        Raises:
+            ValueError: Anahtar yüklenemediyse
+        """
+        if not self._key_ready.wait(timeout):
+            return False
+        if self._key_error is not None:
+            raise ValueError(f"RSA anahtarı yüklenemedi: {self._key_error}")
+        return True
+    
+    @property
+    def private_key(self):
+        self.wait_for_key()
+        return self._key_state[0]
+    
+    @property
+    def public_key(self):
+        self.wait_for_key()
+        return self._key_state[1]
+    
+    @property
+    def public_key_frame(self):
+        """İstemciye gönderilen PUBLIC_KEY çerçevesi (anahtar hazır olana kadar bekler)."""
+        self.wait_for_key()
+        return self._key_state[3]
+    
+    def new_greeting(self):
+        """
+        Bağlantının karşılama (PUBLIC_KEY) çerçevesini hazırlar.
+        
+        Returns:
+            (çerçeve, (geçici X25519 özel anahtarı, sunucu payı) veya None) tuple'ı
+        """
+        if not self.enable_x25519:
+            return self.public_key_frame, None
+        self.wait_for_key()
+        private_key, share = generate_key_share()
+        frame = protocol.pack_frame(protocol.MSG_PUBLIC_KEY, pack_greeting(self._key_state[2], share),
+                                    protocol.FLAG_KEY_SHARE)
+        return frame, (private_key, share)
+    
+    def agree_session_key(self, payload, key_share):
+        """
+        KEY_EXCHANGE yükünden (RSA kullanmadan) oturum anahtarını türetir.
+        
+        Returns:
+            (algoritma, simetrik anahtar) tuple'ı
+        
+        Raises:
+            ValueError: Bu bağlantıda X25519 sunulmadıysa veya pay geçersizse
+        """
+        if key_share is None:
+            raise ValueError("Bu bağlantıda X25519 anahtar anlaşması sunulmadı!")
+        algorithm, client_share = unpack_key_exchange(payload)
+        private_key, server_share = key_share
+        symmetric_key = derive_session_key(private_key, client_share, algorithm, server_share, client_share)
+        self._count_handshake('x25519')
+        return algorithm, symmetric_key
+    
+    def rotate_key(self):
+        """
+        Yeni RSA anahtarına geçer (key_path varsa dosyaya da yazar).
+        
+        Eski anahtar, yeni açık anahtarı henüz almamış bağlantılar için bir
+        sonraki döndürmeye kadar çözmede denenir.
+        """
+        self.wait_for_key()
+        if self.key_path is None:
+            private_key = generate_private_key()
+        else:
+            private_key = rotate_private_key(self.key_path, self.key_passphrase)
+        self._previous_private_key = self._key_state[0]
+        self._set_private_key(private_key)
+        print("✓ RSA anahtarı döndürüldü")
     
     def get_public_key_pem(self):
         """Açık anahtarı PEM formatında döndürür."""
@@ -44,382 +225,366 @@ class Server:
             format=serialization.PublicFormat.SubjectPublicKeyInfo
         )
     
-    def decrypt_symmetric_key(self, encrypted_key_b64):
+    def get_public_key_der(self):
+        """Açık anahtarı DER formatında (protokolün PUBLIC_KEY yükü) döndürür."""
+        return self.public_key.public_bytes(
+            encoding=serialization.Encoding.DER,
+            format=serialization.PublicFormat.SubjectPublicKeyInfo
+        )
+    
+    def _rsa_decrypt(self, ciphertext):
+        """RSA-OAEP çözme; başarısız olursa döndürmeden önceki anahtar denenir."""
+        oaep = padding.OAEP(
+            mgf=padding.MGF1(algorithm=hashes.SHA256()),
+            algorithm=hashes.SHA256(),
+            label=None
+        )
+        try:
+            return self.private_key.decrypt(ciphertext, oaep)
+        except ValueError:
+            if self._previous_private_key is None:
+                raise
+            return self._previous_private_key.decrypt(ciphertext, oaep)
+    
+    def decrypt_symmetric_key(self, encrypted_key):
         """RSA ile şifrelenmiş simetrik anahtarı çözer."""
-        encrypted_key = base64.b64decode(encrypted_key_b64)
-        symmetric_key = self.private_key.decrypt(
-            encrypted_key,
-            padding.OAEP(
-                mgf=padding.MGF1(algorithm=hashes.SHA256()),
-                algorithm=hashes.SHA256(),
-                label=None
+        return self._rsa_decrypt(encrypted_key)
+    
+    def decrypt_rsa_message(self, encrypted_chunks):
+        """RSA ile parça parça şifrelenmiş mesajı çözer (parçalar rsa_pool'da paralel)."""
+        return b''.join(self.rsa_pool.map(encrypted_chunks)).decode('utf-8')
+    
+    def receive_hybrid_message(self, client_socket, payload):
+        """
+        HYBRID_KEY ile başlayan mesajın parçalarını geldikçe çözer; RSA
+        sadece anahtarı açmak için bir kez kullanılır.
+        """
+        receiver = HybridReceiver(payload, self._rsa_decrypt, self.max_message_size)
+        while not receiver.finished:
+            _, flags, chunk = protocol.recv_frame(client_socket, protocol.MSG_HYBRID_CHUNK,
+                                                  self.max_message_size)
+            receiver.receive(flags, chunk)
+        return receiver.message()
+    
+    def decrypt_message(self, algorithm, symmetric_key, iv, ciphertext):
+        """Simetrik anahtarla (AES/DES) şifrelenmiş mesajı çözer."""
+        if algorithm == 'AES':
+            return aes_decrypt(iv, ciphertext, symmetric_key)
+        elif algorithm == 'DES':
+            return des_decrypt(iv, ciphertext, symmetric_key)
+        return "Bilinmeyen algoritma"
+    
+    def issue_ticket_frame(self, algorithm, symmetric_key):
+        """Tam el sıkışmadan sonra istemciye verilecek TICKET çerçevesi."""
+        ticket = self.tickets.issue(algorithm, symmetric_key)
+        return protocol.pack_frame(protocol.MSG_TICKET,
+                                   pack_ticket_message(self.tickets.lifetime, ticket))
+    
+    def try_resume(self, payload):
+        """
+        RESUME mesajındaki bileti RSA kullanmadan doğrular.
+        
+        Returns:
+            (ServerSession veya None, istemciye gönderilecek çerçeve) tuple'ı;
+            bilet geçersizse oturum None ve çerçeve RESUME_REJECTED olur
+        """
+        try:
+            client_random, ticket = unpack_resume(payload)
+            algorithm, secret = self.tickets.open(ticket)
+        except ValueError as e:
+            self._count_handshake('rejected_tickets')
+            return None, protocol.pack_frame(protocol.MSG_RESUME_REJECTED, str(e).encode('utf-8'))
+        server_random = os.urandom(RANDOM_SIZE)
+        symmetric_key = derive_resumption_key(secret, client_random, server_random)
+        self._count_handshake('resumed')
+        return ServerSession(algorithm, symmetric_key), protocol.pack_frame(protocol.MSG_RESUMED, server_random)
+    
+    def serve_session(self, client_socket, session):
+        """
+        Açık oturumdaki mesajları CLOSE gelene kadar çözer; istenen
+        noktalarda toplu onay gönderir.
+        
+        Returns:
+            Oturumda alınan mesaj sayısı
+        """
+        while True:
+            msg_type, flags, payload = protocol.recv_frame(
+                client_socket, (protocol.MSG_SESSION_MESSAGE, protocol.MSG_CLOSE)
             )
-        )
-        return symmetric_key
+            if msg_type == protocol.MSG_CLOSE:
+                client_socket.sendall(session.ack_frame())
+                return session.next_sequence
+            plaintext, ack = session.receive(flags, payload)
+            print(f"[{session.next_sequence - 1}] {plaintext}")
+            if ack is not None:
+                client_socket.sendall(ack)
+    
+    def _count_handshake(self, kind):
+        """El sıkışma sayacını artırır (havuz modunda birden çok iş parçacığından çağrılır)."""
+        with self._stats_lock:
+            self.handshakes[kind] += 1
+    
+    def _run_handler(self, handler, queued=True):
+        """Bağlantıyı işler; aktif/kuyruk/sonuç sayaçlarını günceller."""
+        with self._stats_lock:
+            if queued:
+                self.stats['queued'] -= 1
+            self.stats['active'] += 1
+        ok = False
+        try:
+            ok = handler.handle()
+        finally:
+            with self._stats_lock:
+                self.stats['active'] -= 1
+                self.stats['served' if ok else 'failed'] += 1
+    
+    def _dispatch(self, handler):
+        """
+        Bağlantıyı iş parçacığı havuzuna verir; tüm işçiler meşgul ve kuyruk
+        doluysa bağlantı ERROR mesajıyla hemen reddedilir (accept döngüsü beklemez).
+        """
+        with self._stats_lock:
+            full = (self.stats['active'] + self.stats['queued']
+                    >= self.connection_workers + self.max_queued_connections)
+            if full:
+                self.stats['rejected'] += 1
+            else:
+                self.stats['queued'] += 1
+        if full:
+            handler.reject("Sunucu meşgul, daha sonra tekrar deneyin")
+            return
+        try:
+            with self._stats_lock:
+                future = self.connection_pool.submit(self._run_handler, handler)
+                self._pending[future] = handler
+        except RuntimeError:
+            # stop() ile havuz kapatıldı
+            with self._stats_lock:
+                self.stats['queued'] -= 1
+            handler.reject("Sunucu kapatılıyor")
+            return
+        future.add_done_callback(self._forget)
+    
+    def _forget(self, future):
+        """Tamamlanan (veya iptal edilen) bağlantıyı bekleyenlerden çıkarır."""
+        with self._stats_lock:
+            self._pending.pop(future, None)
     
     def start(self):
         """Sunucuyu başlatır."""
         self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
         self.socket.bind((self.host, self.port))
-        self.socket.listen(1)
+        self.socket.listen(1 if self.connection_pool is None else socket.SOMAXCONN)
         
         print(f"\n{'='*60}")
         print(f"Sunucu başlatıldı: {self.host}:{self.port}")
+        if self.connection_pool is not None:
+            print(f"İş parçacığı havuzu: {self.connection_workers} işçi, "
+                  f"{self.max_queued_connections} bekleyen bağlantı")
         print(f"{'='*60}\n")
         print("İstemci bağlantısı bekleniyor...")
         
         while True:
             try:
                 client_socket, client_address = self.socket.accept()
-                print(f"\n✓ İstemci bağlandı: {client_address}")
-                
-                # Açık anahtarı gönder
-                try:
-                    public_key_pem = self.get_public_key_pem()
-                    key_message = {
-                        'type': 'public_key',
-                        'public_key': public_key_pem.decode('utf-8')
-                    }
-                    key_json = json.dumps(key_message)
-                    key_bytes = key_json.encode('utf-8')
-                    
-                    # Veriyi gönder
-                    total_sent = 0
-                    while total_sent < len(key_bytes):
-                        sent = client_socket.send(key_bytes[total_sent:])
-                        if sent == 0:
-                            raise RuntimeError("Socket baglantisi kesildi")
-                        total_sent += sent
-                    
-                    # Kısa bir bekleme (istemcinin veriyi alması için)
-                    time.sleep(0.1)
-                    print("✓ Açık anahtar gönderildi")
-                except Exception as e:
-                    print(f"HATA: Acik anahtar gonderilirken hata: {str(e)}")
-                    import traceback
-                    traceback.print_exc()
-                    client_socket.close()
-                    continue
-                
-                # İstemciden veri al (parça parça)
-                # İlk mesajı al (encrypted_key veya rsa_encrypted_message)
-                first_data = b''
-                client_socket.settimeout(30.0)  # 30 saniye timeout
-                
-                try:
-                    # İlk chunk'ı al
-                    chunk = client_socket.recv(8192)
-                    if chunk:
-                        first_data += chunk
-                    
-                    # JSON'un tamamlanıp tamamlanmadığını kontrol et
-                    client_socket.settimeout(1.0)  # Kısa timeout
-                    max_attempts = 20
-                    attempts = 0
-                    
-                    while attempts < max_attempts:
-                        try:
-                            # JSON'u kontrol et
-                            decoded = first_data.decode('utf-8')
-                            # İlk JSON'u bul (kapanış parantezini bul)
-                            brace_count = 0
-                            json_end = -1
-                            for i, char in enumerate(decoded):
-                                if char == '{':
-                                    brace_count += 1
-                                elif char == '}':
-                                    brace_count -= 1
-                                    if brace_count == 0:
-                                        json_end = i + 1
-                                        break
-                            
-                            if json_end > 0:
-                                # İlk JSON tamamlanmış
-                                first_message_str = decoded[:json_end]
-                                first_message = json.loads(first_message_str)
-                                # Kalan veriyi sakla (varsa)
-                                remaining_data = decoded[json_end:].strip()
-                                break
-                            else:
-                                # JSON henüz tamamlanmamış, daha fazla veri bekle
-                                chunk = client_socket.recv(8192)
-                                if not chunk:
-                                    break
-                                first_data += chunk
-                                attempts = 0
-                        except (json.JSONDecodeError, UnicodeDecodeError):
-                            # Daha fazla veri bekle
-                            try:
-                                chunk = client_socket.recv(8192)
-                                if not chunk:
-                                    attempts += 1
-                                    if attempts >= 3:
-                                        break
-                                    continue
-                                first_data += chunk
-                                attempts = 0
-                            except socket.timeout:
-                                attempts += 1
-                                if attempts >= 3:
-                                    break
-                                continue
-                        except socket.timeout:
-                            # Timeout, mevcut veriyi kontrol et
-                            if first_data:
-                                try:
-                                    decoded = first_data.decode('utf-8')
-                                    # İlk JSON'u bul
-                                    brace_count = 0
-                                    json_end = -1
-                                    for i, char in enumerate(decoded):
-                                        if char == '{':
-                                            brace_count += 1
-                                        elif char == '}':
-                                            brace_count -= 1
-                                            if brace_count == 0:
-                                                json_end = i + 1
-                                                break
-                                    
-                                    if json_end > 0:
-                                        first_message_str = decoded[:json_end]
-                                        first_message = json.loads(first_message_str)
-                                        remaining_data = decoded[json_end:].strip()
-                                        break
-                                except:
-                                    pass
-                            attempts += 1
-                            if attempts >= 3:
-                                break
-                
-                except Exception as e:
-                    print(f"Veri alma hatası: {str(e)}")
-                    if first_data:
-                        print(f"Alinan veri uzunlugu: {len(first_data)} byte")
-                    client_socket.close()
-                    continue
-                
-                if not first_data:
-                    print("Hata: İstemciden veri alınamadı")
-                    client_socket.close()
-                    continue
-                
-                # JSON'u parse et - iki JSON mesajı birleşmiş olabilir
-                remaining_data = ""  # Varsayılan değer
-                try:
-                    decoded = first_data.decode('utf-8')
-                    # İlk JSON'u ayır (kapanış parantezini bul)
-                    brace_count = 0
-                    json_end = -1
-                    for i, char in enumerate(decoded):
-                        if char == '{':
-                            brace_count += 1
-                        elif char == '}':
-                            brace_count -= 1
-                            if brace_count == 0:
-                                json_end = i + 1
-                                break
-                    
-                    if json_end > 0:
-                        # İki JSON mesajı birleşmiş
-                        first_message_str = decoded[:json_end]
-                        first_message = json.loads(first_message_str)
-                        remaining_data = decoded[json_end:].strip()
-                    else:
-                        # Tek JSON mesajı
-                        first_message = json.loads(decoded)
-                        remaining_data = ""
-                except json.JSONDecodeError as e:
-                    # JSON parse hatası - belki iki JSON birleşmiş
-                    try:
-                        decoded = first_data.decode('utf-8')
-                        # İlk JSON'u bul
-                        brace_count = 0
-                        json_end = -1
-                        for i, char in enumerate(decoded):
-                            if char == '{':
-                                brace_count += 1
-                            elif char == '}':
-                                brace_count -= 1
-                                if brace_count == 0:
-                                    json_end = i + 1
-                                    break
-                        
-                        if json_end > 0:
-                            first_message_str = decoded[:json_end]
-                            first_message = json.loads(first_message_str)
-                            remaining_data = decoded[json_end:].strip()
-                        else:
-                            raise
-                    except:
-                        print(f"Hata: JSON parse edilemedi: {str(e)}")
-                        print(f"Alinan veri uzunlugu: {len(first_data)} byte")
-                        print(f"Alinan veri (ilk 500 karakter): {first_data[:500]}")
-                        client_socket.close()
-                        continue
-                
-                if first_message['type'] == 'rsa_encrypted_message':
-                    # RSA ile direkt şifrelenmiş mesaj
-                    print(f"\nAlgoritma: {first_message['algorithm']}")
-                    print("RSA ile şifrelenmiş mesaj alındı, çözülüyor...")
-                    
-                    encrypted_chunks = first_message['chunks']
-                    plaintext_chunks = []
-                    
-                    for chunk_b64 in encrypted_chunks:
-                        encrypted_chunk = base64.b64decode(chunk_b64)
-                        decrypted_chunk = self.private_key.decrypt(
-                            encrypted_chunk,
-                            padding.OAEP(
-                                mgf=padding.MGF1(algorithm=hashes.SHA256()),
-                                algorithm=hashes.SHA256(),
-                                label=None
-                            )
-                        )
-                        plaintext_chunks.append(decrypted_chunk)
-                    
-                    plaintext = b''.join(plaintext_chunks).decode('utf-8')
-                    print("✓ Mesaj RSA ile çözüldü")
-                    
-                else:
-                    # Simetrik şifreleme (AES/DES)
-                    key_data = first_message
-                    print(f"\nAlgoritma: {key_data['algorithm']}")
-                    print("Sifrelenmis simetrik anahtar alindi, cozuluyor...")
-                    
-                    # Simetrik anahtarı çöz
-                    try:
-                        symmetric_key = self.decrypt_symmetric_key(key_data['encrypted_key'])
-                        print(f"[OK] Simetrik anahtar cozuldu: {symmetric_key.hex()[:32]}...")
-                    except Exception as e:
-                        print(f"Hata: Simetrik anahtar cozulurken hata: {str(e)}")
-                        import traceback
-                        traceback.print_exc()
-                        client_socket.close()
-                        continue
-                    
-                    # Şifrelenmiş mesajı al
-                    # Eğer kalan veri varsa onu kullan, yoksa yeni veri al
-                    print(f"Kalan veri kontrolu: {len(remaining_data) if remaining_data else 0} karakter")
-                    if remaining_data:
-                        # Kalan veriden ikinci JSON'u parse et
-                        print(f"Kalan veriden mesaj parse ediliyor... ({len(remaining_data)} karakter)")
-                        try:
-                            message_data = json.loads(remaining_data)
-                            print("[OK] Mesaj kalan veriden parse edildi")
-                        except json.JSONDecodeError as e:
-                            print(f"Kalan veri parse edilemedi: {str(e)}, daha fazla veri aliniyor...")
-                            # Kalan veri yeterli değil, daha fazla veri al
-                            encrypted_message_data = remaining_data.encode('utf-8')
-                            client_socket.settimeout(5.0)
-                            while True:
-                                try:
-                                    chunk = client_socket.recv(4096)
-                                    if not chunk:
-                                        break
-                                    encrypted_message_data += chunk
-                                    try:
-                                        decoded = encrypted_message_data.decode('utf-8')
-                                        message_data = json.loads(decoded)
-                                        break
-                                    except (json.JSONDecodeError, UnicodeDecodeError):
-                                        continue
-                                except socket.timeout:
-                                    break
-                            message_data = json.loads(encrypted_message_data.decode('utf-8'))
-                    else:
-                        # Yeni veri al
-                        print("Yeni mesaj verisi aliniyor...")
-                        encrypted_message_data = b''
-                        client_socket.settimeout(5.0)
-                        while True:
-                            try:
-                                chunk = client_socket.recv(4096)
-                                if not chunk:
-                                    break
-                                encrypted_message_data += chunk
-                                try:
-                                    decoded = encrypted_message_data.decode('utf-8')
-                                    message_data = json.loads(decoded)
-                                    break
-                                except (json.JSONDecodeError, UnicodeDecodeError):
-                                    continue
-                            except socket.timeout:
-                                if encrypted_message_data:
-                                    try:
-                                        message_data = json.loads(encrypted_message_data.decode('utf-8'))
-                                        break
-                                    except:
-                                        pass
-                                break
-                        
-                        if not encrypted_message_data:
-                            print("Hata: Şifrelenmiş mesaj alınamadı")
-                            client_socket.close()
-                            continue
-                        
-                        message_data = json.loads(encrypted_message_data.decode('utf-8'))
-                    
-                    iv = base64.b64decode(message_data['iv'])
-                    ciphertext = base64.b64decode(message_data['ciphertext'])
-                    
-                    print("\nSifrelenmis mesaj alindi, cozuluyor...")
-                    
-                    # Mesajı çöz
-                    try:
-                        if key_data['algorithm'] == 'AES':
-                            plaintext = aes_decrypt(iv, ciphertext, symmetric_key)
-                        elif key_data['algorithm'] == 'DES':
-                            plaintext = des_decrypt(iv, ciphertext, symmetric_key)
-                        else:
-                            plaintext = "Bilinmeyen algoritma"
-                    except Exception as e:
-                        print(f"Hata: Mesaj cozulurken hata olustu: {str(e)}")
-                        import traceback
-                        traceback.print_exc()
-                        client_socket.close()
-                        continue
-                
-                # Çözülmüş mesajı göster
-                try:
-                    print(f"\n{'='*60}")
-                    print("COZULMUS MESAJ:")
-                    print(f"{'='*60}")
-                    print(plaintext)
-                    print(f"{'='*60}\n")
-                except Exception as e:
-                    print(f"Hata: Mesaj gosterilirken hata: {str(e)}")
-                
-                # Onay gönder
-                response = {
-                    'type': 'ack',
-                    'message': 'Mesaj başarıyla alındı ve çözüldü'
-                }
-                response_json = json.dumps(response)
-                client_socket.sendall(response_json.encode('utf-8'))
-                
-                client_socket.close()
-                print("İstemci bağlantısı kapatıldı\n")
-                
             except KeyboardInterrupt:
                 print("\n\nSunucu kapatılıyor...")
                 break
-            except Exception as e:
-                print(f"Hata: {str(e)}")
-                if client_socket:
-                    client_socket.close()
+            except OSError:
+                # stop() ile dinleme soketi kapatıldı
+                break
+            
+            handler = ConnectionHandler(self, client_socket, client_address)
+            if self.connection_pool is not None:
+                self._dispatch(handler)
+                continue
+            try:
+                self._run_handler(handler, queued=False)
+            except KeyboardInterrupt:
+                print("\n\nSunucu kapatılıyor...")
+                break
     
     def stop(self):
         """Sunucuyu durdurur."""
         if self.socket:
             self.socket.close()
             print("Sunucu kapatıldı")
+        if self.connection_pool is not None:
+            self.connection_pool.shutdown(wait=False)
+            # Henüz başlamamış bağlantılar iptal edilip ERROR ile kapatılır;
+            # çalışanlar istemci ayrılana veya zaman aşımına kadar sürer
+            with self._stats_lock:
+                pending = list(self._pending.items())
+            for future, handler in pending:
+                if future.cancel():
+                    with self._stats_lock:
+                        self.stats['queued'] -= 1
+                    handler.reject("Sunucu kapatılıyor")
+        self.rsa_pool.shutdown()
+
+
+class ConnectionHandler:
+    """
+    Tek bir istemci bağlantısının durumu (anahtar anlaşması, simetrik
+    anahtar) ve işlenmesi. Sunucu bunu accept döngüsünde (sıralı mod) veya
+    bir iş parçacığı havuzunda çalıştırır; client_timeout sadece bu
+    bağlantıyı bekletir.
+    
+    Args:
+        server: Anahtarları, biletleri ve sayaçları tutan Server
+        client_socket, client_address: accept() sonucu
+    """
+    
+    def __init__(self, server, client_socket, client_address):
+        self.server = server
+        self.socket = client_socket
+        self.address = client_address
+        self.key_share = None
+        self.algorithm = None
+        self.symmetric_key = None
+    
+    def reject(self, reason):
+        """Bağlantıyı işlemeden ERROR mesajıyla kapatır."""
+        try:
+            self.socket.settimeout(1.0)
+            protocol.send_frame(self.socket, protocol.MSG_ERROR, reason.encode('utf-8'))
+        except OSError:
+            pass
+        self.socket.close()
+    
+    def handle(self):
+        """
+        Bağlantıyı baştan sona işler ve kapatır.
+        
+        Returns:
+            Başarılıysa True
+        """
+        try:
+            self._serve()
+            return True
+        except Exception as e:
+            print(f"Hata: {str(e)}")
+            try:
+                # İstemci onay beklerken takılı kalmasın
+                protocol.send_frame(self.socket, protocol.MSG_ERROR, str(e).encode('utf-8'))
+            except OSError:
+                pass
+            return False
+        finally:
+            self.socket.close()
+    
+    def _establish_key(self, msg_type, payload):
+        """KEY_EXCHANGE (X25519) veya ENCRYPTED_KEY (RSA) ile simetrik anahtarı kurar."""
+        if msg_type == protocol.MSG_KEY_EXCHANGE:
+            self.algorithm, self.symmetric_key = self.server.agree_session_key(payload, self.key_share)
+            print(f"\nAlgoritma: {self.algorithm}")
+            print(f"[OK] X25519 ile anahtar türetildi: {self.symmetric_key.hex()[:32]}...")
+        else:
+            self.algorithm, encrypted_key = protocol.unpack_encrypted_key(payload)
+            print(f"\nAlgoritma: {self.algorithm}")
+            print("Sifrelenmis simetrik anahtar alindi, cozuluyor...")
+            
+            # Simetrik anahtarı çöz
+            self.symmetric_key = self.server.decrypt_symmetric_key(encrypted_key)
+            print(f"[OK] Simetrik anahtar cozuldu: {self.symmetric_key.hex()[:32]}...")
+        self.server._count_handshake('full')
+    
+    def _serve_session(self, session):
+        count = self.server.serve_session(self.socket, session)
+        print(f"Oturum kapatıldı ({count} mesaj), istemci bağlantısı kapatıldı\n")
+    
+    def _serve(self):
+        server = self.server
+        client_socket = self.socket
+        client_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        client_socket.settimeout(server.client_timeout)
+        print(f"\n✓ İstemci bağlandı: {self.address}")
+        
+        # Açık anahtarı (ve X25519 payını) gönder; lazy_key ise anahtar hazır olana kadar bekler
+        greeting, self.key_share = server.new_greeting()
+        client_socket.sendall(greeting)
+        print("✓ Açık anahtar gönderildi")
+        
+        # İlk mesajı al (encrypted_key, key_exchange, hybrid_key, rsa_encrypted_message veya resume)
+        first_types = (protocol.MSG_ENCRYPTED_KEY, protocol.MSG_KEY_EXCHANGE,
+                       protocol.MSG_HYBRID_KEY, protocol.MSG_RSA_MESSAGE)
+        msg_type, flags, payload = protocol.recv_frame(
+            client_socket, first_types + (protocol.MSG_RESUME,)
+        )
+        if msg_type == protocol.MSG_RESUME:
+            session, reply = server.try_resume(payload)
+            client_socket.sendall(reply)
+            if session is not None:
+                print(f"✓ Oturum biletle devam ettirildi ({session.algorithm}, RSA yok)")
+                self._serve_session(session)
+                return
+            # Bilet reddedildi: istemci tam el sıkışmaya döner
+            print("Bilet reddedildi, tam el sıkışma bekleniyor...")
+            msg_type, flags, payload = protocol.recv_frame(client_socket, first_types)
+        
+        if msg_type == protocol.MSG_HYBRID_KEY:
+            # RSA ile sarılmış anahtar + AES-GCM parçaları
+            print("\nAlgoritma: RSA (hibrit)")
+            plaintext = server.receive_hybrid_message(client_socket, payload)
+            print("✓ Mesaj çözüldü")
+            
+        elif msg_type == protocol.MSG_RSA_MESSAGE:
+            # Eski biçim: RSA ile parça parça şifrelenmiş mesaj
+            print("\nAlgoritma: RSA")
+            print("RSA ile şifrelenmiş mesaj alındı, çözülüyor...")
+            
+            plaintext = server.decrypt_rsa_message(protocol.unpack_rsa_chunks(payload))
+            print("✓ Mesaj RSA ile çözüldü")
+            
+        else:
+            # Simetrik şifreleme (AES/DES)
+            self._establish_key(msg_type, payload)
+            
+            if flags & protocol.FLAG_SESSION:
+                # Oturum modu: aynı anahtarla çok sayıda mesaj
+                if flags & protocol.FLAG_TICKET_REQUEST:
+                    client_socket.sendall(server.issue_ticket_frame(self.algorithm, self.symmetric_key))
+                self._serve_session(ServerSession(self.algorithm, self.symmetric_key))
+                return
+            
+            # Şifrelenmiş mesajı al
+            _, _, payload = protocol.recv_frame(client_socket, protocol.MSG_ENCRYPTED_MESSAGE)
+            iv, ciphertext = protocol.unpack_encrypted_message(payload)
+            
+            print("\nSifrelenmis mesaj alindi, cozuluyor...")
+            plaintext = server.decrypt_message(self.algorithm, self.symmetric_key, iv, ciphertext)
+        
+        # Çözülmüş mesajı göster
+        print(f"\n{'='*60}")
+        print("COZULMUS MESAJ:")
+        print(f"{'='*60}")
+        print(plaintext)
+        print(f"{'='*60}\n")
+        
+        # Onay gönder
+        client_socket.sendall(server._ack_frame)
+        print("İstemci bağlantısı kapatıldı\n")
 
 
 if __name__ == "__main__":
-    server = Server()
+    # --key PATH: RSA anahtarını dosyadan yükle (yoksa üretip kaydet);
+    # parola SERVER_KEY_PASSPHRASE ortam değişkeninden okunur.
+    # --lazy: anahtar arka planda yüklenirken dinlemeye başla
+    # --workers N: bağlantıları N iş parçacıklı havuzda işle
+    key_options = {
+        'key_path': sys.argv[sys.argv.index('--key') + 1] if '--key' in sys.argv else None,
+        'key_passphrase': os.environ.get('SERVER_KEY_PASSPHRASE'),
+        'lazy_key': '--lazy' in sys.argv,
+    }
+    if '--async' in sys.argv:
+        # Eşzamanlı (asyncio) sunucu modu
+        from client_server.async_server import AsyncServer
+        AsyncServer(**key_options).start()
+        sys.exit(0)
+    workers = int(sys.argv[sys.argv.index('--workers') + 1]) if '--workers' in sys.argv else None
+    server = Server(connection_workers=workers, **key_options)
     try:
         server.start()
     except KeyboardInterrupt:
         server.stop()
-
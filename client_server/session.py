@@ -0,0 +1,145 @@
+"""
+Kriptoloji Projesi - Kalıcı Oturumlar
+Tek el sıkışmayla aynı bağlantı üzerinden çok sayıda şifreli mesaj
+
+Oturum modunda istemci ENCRYPTED_KEY mesajını FLAG_SESSION bayrağıyla
+gönderir. RSA ile çözülen simetrik anahtar bağlantı boyunca kullanılır ve
+sonraki her SESSION_MESSAGE yalnızca AES/DES ile çözülür:
+
+    SESSION_MESSAGE: sıra numarası (8) | IV uzunluğu (1) | IV | şifreli metin | MAC (16)
+    SESSION_ACK:     alınan mesaj sayısı (8), yani beklenen sıra numarası
+    CLOSE:           boş; sunucu son SESSION_ACK ile cevap verir
+
+Sıra numaraları 0'dan başlar ve birer artar; atlanan, tekrarlanan veya
+yeri değişen mesaj reddedilir. MAC, oturum anahtarından HKDF ile türetilen
+ayrı bir anahtarla sıra numarası, IV ve şifreli metin üzerinden hesaplanan
+HMAC-SHA256'dır (encrypt-then-MAC); sıra numarası değiştirilmiş veya
+şifreli metni kurcalanmış mesaj çözülmeden reddedilir, böylece sıra
+kontrolü aktif bir saldırgana karşı da tekrar ve yer değiştirmeyi önler.
+
+Sunucu her mesaja onay göndermez: sadece FLAG_ACK_REQUEST bayraklı
+mesajlara (istemcide her ack_every mesajda bir) ve CLOSE'a toplu
+(kümülatif) onay verir. SESSION_ACK ve CLOSE çerçeveleri MAC ile
+korunmaz; onaylar kimlik doğrulamalı değildir ve sadece akış kontrolü
+için kullanılmalıdır (aktif bir saldırgan onay sayısını değiştirebilir).
+"""
+
+import hashlib
+import hmac
+import struct
+
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
+
+from modern_ciphers import AESContext, DESContext
+from client_server import protocol
+
+DEFAULT_ACK_EVERY = 32
+MAC_SIZE = 16
+
+SESSION_CONTEXTS = {'AES': AESContext, 'DES': DESContext}
+
+_SEQUENCE = struct.Struct('>Q')
+
+
+def session_context(algorithm, symmetric_key):
+    """Oturum anahtarı için kalıcı AES/DES bağlamı oluşturur."""
+    if algorithm not in SESSION_CONTEXTS:
+        raise ValueError("Oturum algoritması 'AES' veya 'DES' olmalıdır")
+    return SESSION_CONTEXTS[algorithm](symmetric_key)
+
+def derive_mac_key(symmetric_key):
+    """Oturum anahtarından mesaj doğrulama (HMAC) anahtarını türetir."""
+    return HKDF(
+        algorithm=hashes.SHA256(),
+        length=32,
+        salt=None,
+        info=b'client_server session mac',
+    ).derive(symmetric_key)
+
+def _mac(mac_key, data):
+    return hmac.new(mac_key, data, hashlib.sha256).digest()[:MAC_SIZE]
+
+def pack_session_message(sequence, iv, ciphertext, mac_key):
+    """SESSION_MESSAGE yükü: sıra numarası, şifreli mesaj ve ikisini kapsayan MAC."""
+    body = _SEQUENCE.pack(sequence) + protocol.pack_encrypted_message(iv, ciphertext)
+    return body + _mac(mac_key, body)
+
+def unpack_session_message(payload, mac_key):
+    """
+    MAC'i doğrular ve yükü çözümler.
+
+    Returns:
+        (sıra numarası, iv, şifreli metin) tuple'ı
+
+    Raises:
+        ValueError: Yük bozuksa veya MAC doğrulanamazsa
+    """
+    if len(payload) < _SEQUENCE.size + 1 + MAC_SIZE:
+        raise ValueError("Geçersiz oturum mesajı!")
+    body = memoryview(payload)[:-MAC_SIZE]
+    if not hmac.compare_digest(_mac(mac_key, body), bytes(payload[-MAC_SIZE:])):
+        raise ValueError("Oturum mesajı doğrulanamadı: değiştirilmiş veya yanlış anahtar!")
+    (sequence,) = _SEQUENCE.unpack_from(body)
+    iv, ciphertext = protocol.unpack_encrypted_message(body[_SEQUENCE.size:])
+    return sequence, iv, ciphertext
+
+def pack_ack(count):
+    """SESSION_ACK yükü."""
+    return _SEQUENCE.pack(count)
+
+def unpack_ack(payload):
+    """SESSION_ACK yükünden onaylanan mesaj sayısını döndürür."""
+    if len(payload) != _SEQUENCE.size:
+        raise ValueError("Geçersiz onay mesajı!")
+    return _SEQUENCE.unpack(payload)[0]
+
+
+class ServerSession:
+    """
+    Sunucu tarafında bir oturumun durumu.
+
+    Args:
+        algorithm: 'AES' veya 'DES'
+        symmetric_key: RSA ile çözülmüş oturum anahtarı
+    """
+
+    def __init__(self, algorithm, symmetric_key):
+        self.algorithm = algorithm
+        self.context = session_context(algorithm, symmetric_key)
+        self.mac_key = derive_mac_key(symmetric_key)
+        self.next_sequence = 0
+
+    def open(self, payload):
+        """
+        Mesajın MAC'ini ve sıra numarasını doğrular, sırayı ilerletir.
+
+        Returns:
+            (iv, şifreli metin) tuple'ı
+
+        Raises:
+            ValueError: MAC doğrulanamazsa veya sıra numarası beklenen değer değilse
+        """
+        sequence, iv, ciphertext = unpack_session_message(payload, self.mac_key)
+        if sequence != self.next_sequence:
+            raise ValueError(f"Beklenmeyen sıra numarası: {sequence} (beklenen {self.next_sequence})")
+        self.next_sequence += 1
+        return iv, ciphertext
+
+    def decrypt(self, iv, ciphertext):
+        """Oturum anahtarıyla çözer."""
+        return self.context.decrypt(iv, ciphertext).decode('utf-8')
+
+    def receive(self, flags, payload):
+        """
+        Bir SESSION_MESSAGE yükünü doğrulayıp çözer.
+
+        Returns:
+            (düz metin, gönderilecek onay çerçevesi veya None) tuple'ı
+        """
+        plaintext = self.decrypt(*self.open(payload))
+        return plaintext, self.ack_frame() if flags & protocol.FLAG_ACK_REQUEST else None
+
+    def ack_frame(self):
+        """Şu ana kadar alınan mesajları onaylayan çerçeve."""
+        return protocol.pack_frame(protocol.MSG_SESSION_ACK, pack_ack(self.next_sequence))
@@ -0,0 +1,580 @@
+"""
+İstemci-Sunucu Test Scripti
+Terminal üzerinden test için: python -m pytest client_server
+"""
+
+import sys
+import os
+
+# Proje root'unu Python path'ine ekle
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+import asyncio
+import socket
+import threading
+import time
+
+import pytest
+
+from modern_ciphers import AEADContext
+from modern_ciphers.aead import _STREAM_PREFIX_SIZE, _chunk_nonce
+from client_server import protocol
+from client_server.client import Client
+from client_server.hybrid import HYBRID_ALGORITHM, HybridReceiver, hybrid_frames
+from client_server.async_server import AsyncServer
+from client_server.server import Server
+from client_server.rsa_pool import RSADecryptPool
+from client_server.session import ServerSession, derive_mac_key, pack_session_message, session_context
+from client_server.tickets import TicketManager
+from client_server.keystore import load_or_generate_private_key, load_private_key
+
+
+class _RecordingAsyncServer(AsyncServer):
+    """Çözülen mesajları kaydeden test sunucusu."""
+
+    def __init__(self, **kwargs):
+        super().__init__(port=0, verbose=False, **kwargs)
+        self.received = []
+
+    def on_message(self, peer, algorithm, plaintext):
+        self.received.append((algorithm, plaintext))
+
+
+@pytest.fixture
+def async_server(request):
+    """
+    Sunucuyu ayrı bir iş parçacığındaki olay döngüsünde çalıştırır.
+    Yapıcı argümanları indirect parametrize ile verilebilir.
+    """
+    server = _RecordingAsyncServer(**{'max_connections': 2, **getattr(request, 'param', {})})
+    loop = asyncio.new_event_loop()
+    ready = threading.Event()
+
+    def run():
+        asyncio.set_event_loop(loop)
+        loop.run_until_complete(server.start_serving())
+        ready.set()
+        loop.run_forever()
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    ready.wait(10)
+    yield server
+    _wait_until_idle(server)
+    loop.call_soon_threadsafe(server.stop)
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join(10)
+
+
+@pytest.fixture
+def blocking_server(request):
+    """
+    Server.start'ı boş bir portta ayrı bir iş parçacığında çalıştırır.
+    Yapıcı argümanları indirect parametrize ile verilebilir.
+    """
+    server = Server(**getattr(request, 'param', {}))
+    server.port = _free_port()
+    threading.Thread(target=server.start, daemon=True).start()
+    yield server
+    server.stop()
+
+
+def _free_port():
+    """Boş bir yerel port seçer (Server.start port 0'ın gerçek değerini bildirmez)."""
+    with socket.socket() as probe:
+        probe.bind(('localhost', 0))
+        return probe.getsockname()[1]
+
+
+def _wait_until_idle(server, timeout=5):
+    """İstemci onayı aldıktan sonra sunucunun bağlantıyı kapatmasını bekler."""
+    deadline = time.monotonic() + timeout
+    while server.stats['active'] and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+def _wait_for(server, condition, timeout=5):
+    """Koşul sağlanana kadar bekler; sağlanmazsa sunucu sayaçlarıyla başarısız olur."""
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert condition(), server.stats
+
+
+def _stalled_client(port):
+    """Bağlanıp hiçbir şey göndermeyen (işçiyi meşgul eden) istemci soketi."""
+    for _ in range(100):
+        try:
+            return socket.create_connection(('localhost', port), timeout=5)
+        except OSError:
+            time.sleep(0.05)
+
+
+def test_protocol_frames_round_trip():
+    """Çerçeveler ve yük biçimleri kayıpsız çözülmeli; hatalı başlık reddedilmeli."""
+    left, right = socket.socketpair()
+    with left, right:
+        iv, ciphertext = b'\x00' * 16, bytes(range(256)) * 3
+        left.sendall(
+            protocol.pack_frame(protocol.MSG_ENCRYPTED_KEY, protocol.pack_encrypted_key('DES', b'k' * 256))
+            + protocol.pack_frame(protocol.MSG_ENCRYPTED_MESSAGE, protocol.pack_encrypted_message(iv, ciphertext))
+            + protocol.pack_frame(protocol.MSG_RSA_MESSAGE, protocol.pack_rsa_chunks([b'a' * 256, b'b']))
+        )
+        msg_type, _, payload = protocol.recv_frame(right, protocol.MSG_ENCRYPTED_KEY)
+        assert protocol.unpack_encrypted_key(payload) == ('DES', b'k' * 256)
+        _, _, payload = protocol.recv_frame(right, protocol.MSG_ENCRYPTED_MESSAGE)
+        assert protocol.unpack_encrypted_message(payload) == (iv, ciphertext)
+        _, _, payload = protocol.recv_frame(right)
+        assert protocol.unpack_rsa_chunks(payload) == [b'a' * 256, b'b']
+
+        protocol.send_frame(left, protocol.MSG_ERROR, 'bozuk'.encode('utf-8'))
+        with pytest.raises(ValueError, match="bozuk"):
+            protocol.recv_frame(right, protocol.MSG_ACK)
+
+    with pytest.raises(ValueError):
+        protocol.parse_header(b'\x05\x09\x00\x00\x00\x00\x00\x00')
+    with pytest.raises(ValueError):
+        protocol.parse_header(protocol.pack_frame(protocol.MSG_ACK, b'xx')[:protocol.HEADER_SIZE], max_size=1)
+
+
+def test_blocking_server_with_client(blocking_server):
+    """Çerçeveli protokolde Server.start ve Client uyumlu olmalı."""
+    server = blocking_server
+
+    for algorithm in ("AES", "DES", "RSA"):
+        client = Client(port=server.port)
+        for _ in range(100):
+            if client.connect():
+                break
+            time.sleep(0.05)
+        assert client.receive_public_key()
+        assert client.send_encrypted_message("Merhaba {dünya}", algorithm)
+        client.disconnect()
+
+    client = Client(port=server.port)
+    assert client.connect() and client.receive_public_key()
+    assert client.send_legacy_rsa_message("ş" * 200)
+    client.disconnect()
+
+    client = Client(port=server.port, key_exchange='X25519')
+    assert client.connect() and client.receive_public_key()
+    client.start_session('DES', ack_every=4)
+    for i in range(10):
+        client.send_session_message(f"oturum {i}")
+    assert client.end_session() == 10
+    client.disconnect()
+    assert server.handshakes['full'] == 3 and server.handshakes['x25519'] == 1
+
+
+def test_async_server_with_blocking_client(async_server):
+    """Mevcut istemci AsyncServer ile AES, DES ve RSA mesajlarını gönderebilmeli."""
+    messages = [("AES", "Merhaba {dünya}"), ("DES", "Kriptoloji"), ("RSA", "ş" * 40)]
+    for algorithm, message in messages:
+        client = Client(port=async_server.port)
+        assert client.connect()
+        assert client.receive_public_key()
+        assert client.send_encrypted_message(message, algorithm)
+        client.disconnect()
+
+    assert async_server.received == messages
+    _wait_until_idle(async_server)
+    assert async_server.stats['served'] == 3 and async_server.stats['failed'] == 0
+
+
+def test_async_server_handles_concurrent_clients(async_server):
+    """Slot sayısından fazla eşzamanlı istemci sırayla slot alıp hizmet görmeli."""
+    results = []
+
+    def run_client(i):
+        client = Client(port=async_server.port)
+        client.connect()
+        client.receive_public_key()
+        results.append(client.send_encrypted_message(f"mesaj {i}", "AES"))
+        client.disconnect()
+
+    threads = [threading.Thread(target=run_client, args=(i,)) for i in range(6)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(30)
+
+    assert results == [True] * 6
+    assert sorted(m for _, m in async_server.received) == sorted(f"mesaj {i}" for i in range(6))
+
+
+def test_session_many_messages_one_handshake(async_server):
+    """Oturumda tek el sıkışmayla çok sayıda mesaj gitmeli, onaylar toplu gelmeli."""
+    client = Client(port=async_server.port)
+    assert client.connect()
+    assert client.receive_public_key()
+    client.start_session('AES', ack_every=8)
+    sequences = [client.send_session_message(f"oturum {i}") for i in range(50)]
+    assert sequences == list(range(50))
+    assert client.acked == 48  # 8'in katlarında onay istendi
+    assert client.send_session_message("son", wait_ack=True) == 50 and client.acked == 51
+    assert client.end_session() == 51
+    client.disconnect()
+
+    assert [m for _, m in async_server.received] == [f"oturum {i}" for i in range(50)] + ["son"]
+    _wait_until_idle(async_server)
+    assert async_server.stats['sessions'] == 1 and async_server.stats['messages'] == 51
+    assert async_server.stats['served'] == 1 and async_server.stats['failed'] == 0
+
+
+def test_session_rejects_out_of_order_sequence(async_server):
+    """Atlanan/tekrarlanan sıra numarası hata çerçevesiyle reddedilmeli."""
+    client = Client(port=async_server.port)
+    assert client.connect()
+    assert client.receive_public_key()
+    client.start_session('DES')
+    client.send_session_message("ilk")
+    client.next_sequence = 0  # tekrar oynatma (replay)
+    with pytest.raises(ValueError, match="sıra numarası"):
+        client.send_session_message("tekrar", wait_ack=True)
+    client.disconnect()
+    _wait_until_idle(async_server)
+    assert async_server.stats['failed'] == 1
+
+
+def test_session_sequence_is_authenticated():
+    """Yol üzerindeki saldırgan sıra numarasını değiştirip mesajı tekrar oynatamamalı."""
+    key = bytes(range(16))
+    context, mac_key = session_context('AES', key), derive_mac_key(key)
+    server = ServerSession('AES', key)
+    first = pack_session_message(0, *context.encrypt("ilk".encode('utf-8')), mac_key)
+    assert server.receive(0, first)[0] == "ilk"
+
+    replayed = bytearray(first)
+    replayed[:8] = (1).to_bytes(8, 'big')   # tekrar için sıra numarası 1 yapılır
+    with pytest.raises(ValueError, match="doğrulanamadı"):
+        server.receive(0, replayed)
+    tampered = bytearray(pack_session_message(1, *context.encrypt("ikinci".encode('utf-8')), mac_key))
+    tampered[12] ^= 1
+    with pytest.raises(ValueError, match="doğrulanamadı"):
+        server.receive(0, tampered)
+    assert server.next_sequence == 1
+    with pytest.raises(ValueError, match="doğrulanamadı"):
+        ServerSession('AES', bytes(16)).receive(0, first)
+
+
+def _session_round(server, client, messages, algorithm='AES'):
+    """Bağlanıp oturum açar, mesajları gönderir; oturumun biletle sürdürülüp sürdürülmediğini döndürür."""
+    assert client.connect()
+    assert client.receive_public_key()
+    resumed = client.start_session(algorithm)
+    for message in messages:
+        client.send_session_message(message)
+    assert client.end_session() == len(messages)
+    client.disconnect()
+    return resumed
+
+
+def test_session_ticket_resumption(async_server):
+    """Yeniden bağlanan istemci bileti sunup RSA olmadan oturum açmalı; geçersiz bilette tam el sıkışmaya dönmeli."""
+    client = Client(port=async_server.port)
+    assert _session_round(async_server, client, ["bir", "iki"]) is False
+    assert client.ticket is not None
+    assert _session_round(async_server, client, ["üç"]) is True
+    assert _session_round(async_server, client, ["dört"]) is True
+    assert async_server.handshakes == {'full': 1, 'resumed': 2, 'rejected_tickets': 0, 'x25519': 0}
+
+    # Sunucu bilet anahtarlarını kaybederse (ör. yeniden başlatma) bilet reddedilir
+    async_server.tickets = TicketManager()
+    assert _session_round(async_server, client, ["beş"]) is False
+    assert _session_round(async_server, client, ["altı"]) is True
+    assert async_server.handshakes == {'full': 2, 'resumed': 3, 'rejected_tickets': 1, 'x25519': 0}
+    assert [m for _, m in async_server.received] == ["bir", "iki", "üç", "dört", "beş", "altı"]
+
+
+def test_ticket_manager_lifetime_and_rotation():
+    """Biletler süre dolunca ve anahtarları atılınca reddedilmeli, değiştirilen bilet açılmamalı."""
+    now = [1000.0]
+    manager = TicketManager(lifetime=60, rotation_interval=30, clock=lambda: now[0])
+    ticket = manager.issue('AES', b'k' * 16)
+    assert manager.open(ticket) == ('AES', b'k' * 16)
+
+    tampered = bytearray(ticket)
+    tampered[-1] ^= 1
+    with pytest.raises(ValueError):
+        manager.open(bytes(tampered))
+
+    now[0] += 31  # anahtar döner, eski anahtarla verilen bilet hâlâ geçerli
+    second = manager.issue('DES', b'd' * 8)
+    assert second[:4] != ticket[:4]
+    assert manager.open(ticket) == ('AES', b'k' * 16)
+
+    now[0] += 30  # ilk biletin süresi doldu
+    with pytest.raises(ValueError, match="süresi"):
+        manager.open(ticket)
+    assert manager.open(second) == ('DES', b'd' * 8)
+
+    now[0] += 200  # tüm eski anahtarlar atılır
+    manager.rotate()
+    with pytest.raises(ValueError, match="bilinmiyor"):
+        manager.open(second)
+
+    # Eşzamanlı döndürme sırasında verilen biletler kendi anahtarlarıyla açılmalı
+    manager = TicketManager(lifetime=3600, rotation_interval=1800, clock=lambda: now[0])
+    errors = []
+
+    def issue_and_open(i):
+        try:
+            for _ in range(200):
+                assert manager.open(manager.issue('AES', bytes([i]) * 16)) == ('AES', bytes([i]) * 16)
+        except Exception as e:  # pragma: no cover - hata ana iş parçacığında raporlanır
+            errors.append(e)
+
+    threads = [threading.Thread(target=issue_and_open, args=(i,)) for i in range(4)]
+    for t in threads:
+        t.start()
+    for _ in range(200):
+        manager.rotate()
+    for t in threads:
+        t.join(10)
+    assert errors == []
+
+
+def test_persisted_key_passphrase_and_rotation(tmp_path):
+    """Anahtar ilk çalıştırmada üretilip kaydedilmeli, sonra aynen yüklenmeli; döndürmede eski anahtar çözmeye devam etmeli."""
+    path = str(tmp_path / "server_key.pem")
+    key, generated = load_or_generate_private_key(path, "gizli")
+    assert generated and oct(os.stat(path).st_mode & 0o777) == '0o600'
+    loaded, generated = load_or_generate_private_key(path, "gizli")
+    assert not generated and loaded.private_numbers() == key.private_numbers()
+    with pytest.raises(ValueError):
+        load_private_key(path, "yanlış")
+    with pytest.raises(ValueError):
+        load_private_key(path)
+
+    server = Server(port=0, key_path=path, key_passphrase="gizli")
+    assert server.get_public_key_der() == Server(port=0, key_path=path, key_passphrase="gizli").get_public_key_der()
+
+    client = Client(port=0)
+    client.public_key = server.public_key
+    old_encrypted = client.encrypt_symmetric_key(b'k' * 16)
+    server.rotate_key()
+    assert server.public_key.public_numbers() != key.public_key().public_numbers()
+    assert load_private_key(path, "gizli").private_numbers() == server.private_key.private_numbers()
+    assert len([f for f in os.listdir(tmp_path) if f.endswith('.old')]) == 1
+    assert server.decrypt_symmetric_key(old_encrypted) == b'k' * 16
+
+
+def test_lazy_key_loading(tmp_path):
+    """lazy_key ile sunucu anahtar hazır olmadan dinlemeye başlamalı ve ilk istemciye hizmet vermeli."""
+    server = _RecordingAsyncServer(key_path=str(tmp_path / "key.pem"), lazy_key=True)
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(server.start_serving())
+        thread = threading.Thread(target=loop.run_forever, daemon=True)
+        thread.start()
+        client = Client(port=server.port)
+        assert client.connect() and client.receive_public_key()
+        assert server.key_ready
+        assert client.send_encrypted_message("ilk mesaj", "AES")
+        client.disconnect()
+        assert server.received == [("AES", "ilk mesaj")]
+        _wait_until_idle(server)
+    finally:
+        loop.call_soon_threadsafe(server.stop)
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(10)
+
+
+def test_x25519_key_exchange(async_server):
+    """X25519 seçen istemci RSA'sız anahtar kurmalı; tek mesaj, oturum ve bilet yolları çalışmalı."""
+    client = Client(port=async_server.port, key_exchange='X25519')
+    assert client.connect() and client.receive_public_key()
+    assert client.server_key_share is not None
+    assert client.send_encrypted_message("ecdh tek mesaj", "DES")
+    client.disconnect()
+
+    assert _session_round(async_server, client, ["ecdh oturum"]) is False
+    assert _session_round(async_server, client, ["bilet"]) is True
+    assert async_server.handshakes == {'full': 2, 'resumed': 1, 'rejected_tickets': 0, 'x25519': 2}
+    assert [m for _, m in async_server.received] == ["ecdh tek mesaj", "ecdh oturum", "bilet"]
+
+
+def test_x25519_falls_back_to_rsa_when_not_offered():
+    """Sunucu X25519 sunmazsa istemci RSA ile anahtar taşımaya dönmeli."""
+    server = _RecordingAsyncServer(enable_x25519=False)
+    loop = asyncio.new_event_loop()
+    loop.run_until_complete(server.start_serving())
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    try:
+        client = Client(port=server.port, key_exchange='X25519')
+        assert client.connect() and client.receive_public_key()
+        assert client.server_key_share is None
+        assert client.send_encrypted_message("rsa ile", "AES")
+        client.disconnect()
+        _wait_until_idle(server)
+        assert server.handshakes['full'] == 1 and server.handshakes['x25519'] == 0
+    finally:
+        loop.call_soon_threadsafe(server.stop)
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(10)
+
+
+def test_hybrid_rsa_message_streaming(async_server):
+    """RSA mesajı tek RSA işlemi ve AEAD parçalarıyla gitmeli; eski biçim de çalışmalı."""
+    large = "çok parçalı " * 20000   # ~260 KB -> 64 KB'lık birkaç parça
+    for message in ("", "kısa mesaj", large):
+        client = Client(port=async_server.port)
+        assert client.connect() and client.receive_public_key()
+        assert client.send_encrypted_message(message, 'RSA')
+        client.disconnect()
+    client = Client(port=async_server.port)
+    assert client.connect() and client.receive_public_key()
+    assert client.send_legacy_rsa_message("eski " * 100)
+    client.disconnect()
+    _wait_until_idle(async_server)
+    assert async_server.received == [('RSA', ""), ('RSA', "kısa mesaj"), ('RSA', large), ('RSA', "eski " * 100)]
+
+    # Değiştirilmiş, yeniden sıralanmış veya eksik parçalar reddedilmeli
+    frames = [bytearray(frame) for frame in hybrid_frames(b'x' * 100, lambda key: key, chunk_size=40)]
+    payloads = [(protocol.parse_header(frame[:protocol.HEADER_SIZE])[1], frame[protocol.HEADER_SIZE:])
+                for frame in frames]
+    receiver = HybridReceiver(payloads[0][1], lambda wrapped: wrapped)
+    assert b''.join(receiver.receive(*chunk) for chunk in payloads[1:]) == b'x' * 100
+    assert receiver.finished
+    for chunks in (payloads[2:], [payloads[1], (payloads[2][0] | protocol.FLAG_LAST_CHUNK, payloads[2][1])]):
+        receiver = HybridReceiver(payloads[0][1], lambda wrapped: wrapped)
+        with pytest.raises(ValueError):
+            for chunk in chunks:
+                receiver.receive(*chunk)
+    tampered = bytearray(payloads[1][1])
+    tampered[0] ^= 1
+    with pytest.raises(ValueError):
+        HybridReceiver(payloads[0][1], lambda wrapped: wrapped).receive(payloads[1][0], tampered)
+
+    # Toplam boyut sınırı (tag'ler dahil): iki parça (2 * 56 byte) kabul edilir, üçüncüsü aşar
+    receiver = HybridReceiver(payloads[0][1], lambda wrapped: wrapped, max_message_size=120)
+    receiver.receive(*payloads[1])
+    receiver.receive(*payloads[2])
+    with pytest.raises(ValueError, match="sınırı"):
+        receiver.receive(*payloads[3])
+
+    # Sadece tag'den oluşan boş parçalar sınırsız gönderilemez
+    context = AEADContext(payloads[0][1][_STREAM_PREFIX_SIZE:], HYBRID_ALGORITHM)
+    prefix = payloads[0][1][:_STREAM_PREFIX_SIZE]
+    receiver = HybridReceiver(payloads[0][1], lambda wrapped: wrapped)
+    with pytest.raises(ValueError, match="Boş"):
+        for index in range(1000):
+            receiver.receive(0, context.encrypt(b'', nonce=_chunk_nonce(prefix, index, False))[1])
+    assert receiver.index == 0 and not receiver._parts
+
+
+@pytest.mark.parametrize('blocking_server, async_server',
+                         [({'max_message_size': 100000}, {'max_message_size': 100000})], indirect=True)
+def test_hybrid_message_size_limit(blocking_server, async_server):
+    """Sınırı aşan hibrit akış her iki sunucuda da reddedilmeli."""
+    message = "x" * 150000   # 64 KB'lık üç parça
+    assert async_server.max_message_size == 100000
+    for port in (blocking_server.port, async_server.port):
+        client = Client(port=port)
+        for _ in range(100):
+            if client.connect():
+                break
+            time.sleep(0.05)
+        assert client.receive_public_key()
+        # Sunucu hata çerçevesini gönderip bağlantıyı kapatır; okunmamış veri RST'ye yol açabilir
+        with pytest.raises((ValueError, ConnectionError)):
+            client.send_encrypted_message(message, 'RSA')
+        client.disconnect()
+        client = Client(port=port)
+        assert client.connect() and client.receive_public_key()
+        assert client.send_encrypted_message("x" * 90000, 'RSA')
+        client.disconnect()
+    _wait_until_idle(async_server)
+    _wait_until_idle(blocking_server)
+    assert blocking_server.stats['failed'] == 1 and blocking_server.stats['served'] == 1
+    assert async_server.stats['failed'] == 1 and async_server.received == [('RSA', "x" * 90000)]
+
+
+@pytest.mark.parametrize('async_server', [{'rsa_workers': 3, 'rsa_max_pending': 4}], indirect=True)
+def test_rsa_pool_order_and_back_pressure(async_server):
+    """Parçalar sırayla birleşmeli, bekleyen parça sayısı sınırı aşılmamalı, hata iletilmeli."""
+    active, peak, lock = [0], [0], threading.Lock()
+
+    def decrypt(chunk):
+        with lock:
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+        time.sleep(0.002 * (chunk[0] % 3))
+        with lock:
+            active[0] -= 1
+        if chunk == b'\xff':
+            raise ValueError("bozuk parça")
+        return chunk * 2
+
+    pool = RSADecryptPool(decrypt, workers=4, max_pending=2)
+    chunks = [bytes([i]) for i in range(40)]
+    assert pool.map(chunks) == [chunk * 2 for chunk in chunks]
+    assert 1 <= peak[0] <= 2
+    with pytest.raises(ValueError, match="bozuk"):
+        pool.map(chunks[:5] + [b'\xff'] + chunks[5:])
+    pool.shutdown()
+
+    # Sunucu: eski biçimdeki çok parçalı mesaj havuzda çözülmeli
+    message = "eski biçim ş " * 300
+    client = Client(port=async_server.port)
+    assert client.connect() and client.receive_public_key()
+    assert client.send_legacy_rsa_message(message)
+    client.disconnect()
+    _wait_until_idle(async_server)
+    assert async_server.received == [('RSA', message)]
+    assert async_server.rsa_pool.workers == 3 and async_server.rsa_pool._executor is not None
+
+
+@pytest.mark.parametrize('blocking_server', [{'connection_workers': 2, 'max_queued_connections': 1,
+                                              'client_timeout': 5.0}], indirect=True)
+def test_blocking_server_thread_pool_mode(blocking_server):
+    """Havuz modunda yavaş istemci diğerlerini bekletmemeli; dolu havuz bağlantıyı reddetmeli."""
+    server = blocking_server
+    stalled = [_stalled_client(server.port)]
+    _wait_for(server, lambda: server.stats['active'] == 1)
+    client = Client(port=server.port)
+    assert client.connect() and client.receive_public_key()
+    assert client.send_encrypted_message("yavaş istemci beklerken", 'AES')
+    client.disconnect()
+    _wait_for(server, lambda: server.stats['served'] == 1)
+
+    # İkinci işçi ve tek kuyruk yeri dolunca yeni bağlantı hemen reddedilir
+    stalled.append(_stalled_client(server.port))
+    _wait_for(server, lambda: server.stats['active'] == 2)
+    stalled.append(_stalled_client(server.port))
+    _wait_for(server, lambda: server.stats['queued'] == 1)
+    with socket.create_connection(('localhost', server.port), timeout=5) as rejected:
+        with pytest.raises(ValueError, match="meşgul"):
+            protocol.recv_frame(rejected, protocol.MSG_PUBLIC_KEY)
+    assert server.stats['rejected'] == 1
+
+    for sock in stalled:
+        sock.close()
+    _wait_for(server, lambda: server.stats['active'] == 0 and server.stats['queued'] == 0)
+    assert server.stats['served'] == 1 and server.stats['failed'] == 3
+
+
+@pytest.mark.parametrize('blocking_server', [{'connection_workers': 1, 'max_queued_connections': 2,
+                                              'client_timeout': 5.0}], indirect=True)
+def test_blocking_server_stop_rejects_queued_connections(blocking_server):
+    """stop() kuyruktaki bağlantıları ERROR ile kapatmalı ve kuyruk sayacını sıfırlamalı."""
+    server = blocking_server
+    active = _stalled_client(server.port)
+    _wait_for(server, lambda: server.stats['active'] == 1)
+    queued = [_stalled_client(server.port), _stalled_client(server.port)]
+    _wait_for(server, lambda: server.stats['queued'] == 2)
+
+    server.stop()
+    assert server.stats['queued'] == 0
+    for sock in queued:
+        with sock:
+            with pytest.raises(ValueError, match="kapatılıyor"):
+                protocol.recv_frame(sock, protocol.MSG_PUBLIC_KEY)
+            assert sock.recv(1) == b''
+
+    active.close()
+    _wait_for(server, lambda: server.stats['active'] == 0)
+    assert server.stats['queued'] == 0 and server.stats['failed'] == 1
@@ -0,0 +1,166 @@
+"""
+Kriptoloji Projesi - Oturum Biletleri (Session Tickets)
+Yeniden bağlanan istemcinin RSA işlemi olmadan oturum açması
+
+Tam el sıkışmada (FLAG_SESSION | FLAG_TICKET_REQUEST) sunucu, oturum
+anahtarını kendi bilet anahtarıyla AES-256-GCM ile mühürleyip istemciye
+verir (TICKET). Sunucu bilet için durum tutmaz; istemci sonraki
+bağlantıda bileti RESUME ile sunar:
+
+    TICKET:  geçerlilik süresi (4, saniye) | bilet
+    RESUME:  istemci rastgele değeri (16) | bilet
+    RESUMED: sunucu rastgele değeri (16)
+    RESUME_REJECTED: UTF-8 sebep; istemci aynı bağlantıda tam el sıkışmaya döner
+
+Bilet biçimi:
+    anahtar kimliği (4) | nonce (12) | AES-GCM(verilme zamanı (8) | algoritma (1) | anahtar)
+
+Devam eden oturumun anahtarı biletteki anahtardan iki tarafın rastgele
+değerleriyle HKDF ile türetilir; böylece her bağlantı farklı bir anahtar
+kullanır ve eski bir bağlantının mesajları yenisine oynatılamaz.
+
+Bilet anahtarı rotation_interval saniyede bir yenilenir. Eski anahtarlar,
+onlarla verilmiş biletlerin süresi dolana kadar (lifetime) çözme için
+saklanır, sonra atılır.
+"""
+
+import os
+import struct
+import threading
+import time
+
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
+
+from modern_ciphers import AEADContext, generate_aead_key
+from modern_ciphers.aead import NONCE_SIZE
+from client_server import protocol
+
+DEFAULT_TICKET_LIFETIME = 3600
+RANDOM_SIZE = 16
+
+_TICKET_ALGORITHM = 'AES-256-GCM'
+_KEY_ID = struct.Struct('>I')
+_TICKET_BODY = struct.Struct('>QB')
+_LIFETIME = struct.Struct('>I')
+_ALGORITHM_BY_ID = {v: k for k, v in protocol.ALGORITHM_IDS.items()}
+
+
+def derive_resumption_key(secret, client_random, server_random):
+    """Biletteki anahtardan bu bağlantıya özel oturum anahtarını türetir."""
+    return HKDF(
+        algorithm=hashes.SHA256(),
+        length=len(secret),
+        salt=client_random + server_random,
+        info=b'client_server resumption',
+    ).derive(secret)
+
+def pack_ticket_message(lifetime, ticket):
+    """TICKET yükü."""
+    return _LIFETIME.pack(lifetime) + ticket
+
+def unpack_ticket_message(payload):
+    """
+    Returns:
+        (geçerlilik süresi, bilet) tuple'ı
+    """
+    if len(payload) <= _LIFETIME.size:
+        raise ValueError("Geçersiz bilet mesajı!")
+    return _LIFETIME.unpack_from(payload)[0], bytes(payload[_LIFETIME.size:])
+
+def pack_resume(client_random, ticket):
+    """RESUME yükü."""
+    return client_random + ticket
+
+def unpack_resume(payload):
+    """
+    Returns:
+        (istemci rastgele değeri, bilet) tuple'ı
+    """
+    if len(payload) <= RANDOM_SIZE:
+        raise ValueError("Geçersiz devam (resume) mesajı!")
+    return bytes(payload[:RANDOM_SIZE]), bytes(payload[RANDOM_SIZE:])
+
+
+class TicketManager:
+    """
+    Bilet anahtarlarını döndüren (rotation) ve biletleri mühürleyip açan yönetici.
+
+    Args:
+        lifetime: Biletin geçerlilik süresi (saniye)
+        rotation_interval: Bilet anahtarının yenilenme aralığı (None ise lifetime)
+        clock: Zaman kaynağı (test için değiştirilebilir)
+    """
+
+    def __init__(self, lifetime=DEFAULT_TICKET_LIFETIME, rotation_interval=None, clock=time.time):
+        if lifetime <= 0:
+            raise ValueError("Bilet süresi pozitif olmalıdır!")
+        self.lifetime = lifetime
+        self.rotation_interval = rotation_interval or lifetime
+        self.clock = clock
+        self._keys = {}   # anahtar kimliği -> (oluşturulma zamanı, AEADContext)
+        self._current_id = int.from_bytes(os.urandom(_KEY_ID.size), 'big')
+        self._lock = threading.Lock()
+        self.rotate()
+
+    def rotate(self):
+        """Yeni bilet anahtarına geçer ve artık bilet çözemeyecek eski anahtarları atar."""
+        with self._lock:
+            self._rotate_locked()
+
+    def _rotate_locked(self):
+        """rotate(); çağıran self._lock'u tutmalıdır."""
+        now = self.clock()
+        self._current_id = (self._current_id + 1) % (1 << 32)
+        self._keys[self._current_id] = (now, AEADContext(generate_aead_key(_TICKET_ALGORITHM),
+                                                         _TICKET_ALGORITHM))
+        # Bir anahtar en geç created + rotation_interval'da bilet verir;
+        # o biletler de lifetime sonra geçersizdir
+        horizon = now - self.rotation_interval - self.lifetime
+        for key_id in [k for k, (created, _) in self._keys.items() if created < horizon]:
+            del self._keys[key_id]
+
+    def issue(self, algorithm, secret):
+        """
+        Oturum anahtarını mevcut bilet anahtarıyla mühürler.
+
+        Returns:
+            Bilet (bytes)
+        """
+        # Süre kontrolü, döndürme ve (kimlik, anahtar) okuması tek kilit altında
+        with self._lock:
+            if self.clock() - self._keys[self._current_id][0] >= self.rotation_interval:
+                self._rotate_locked()
+            key_id = self._current_id
+            context = self._keys[key_id][1]
+        header = _KEY_ID.pack(key_id)
+        body = _TICKET_BODY.pack(int(self.clock()), protocol.ALGORITHM_IDS[algorithm]) + secret
+        nonce, sealed = context.encrypt(body, associated_data=header)
+        return header + nonce + sealed
+
+    def open(self, ticket):
+        """
+        Bileti doğrular ve açar.
+
+        Returns:
+            (algoritma, anahtar) tuple'ı
+
+        Raises:
+            ValueError: Bilet bozuk, anahtarı atılmış veya süresi dolmuşsa
+        """
+        if len(ticket) <= _KEY_ID.size + NONCE_SIZE:
+            raise ValueError("Geçersiz bilet!")
+        header = ticket[:_KEY_ID.size]
+        with self._lock:
+            entry = self._keys.get(_KEY_ID.unpack(header)[0])
+        if entry is None:
+            raise ValueError("Bilet anahtarı bilinmiyor veya süresi dolmuş!")
+        body = entry[1].decrypt(ticket[_KEY_ID.size:_KEY_ID.size + NONCE_SIZE],
+                                ticket[_KEY_ID.size + NONCE_SIZE:], associated_data=header)
+        issued_at, algorithm_id = _TICKET_BODY.unpack_from(body)
+        if self.clock() - issued_at > self.lifetime:
+            raise ValueError("Biletin süresi dolmuş!")
+        algorithm = _ALGORITHM_BY_ID.get(algorithm_id)
+        if algorithm not in ('AES', 'DES'):
+            raise ValueError("Geçersiz bilet!")
+        return algorithm, body[_TICKET_BODY.size:]
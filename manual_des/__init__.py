@@ -2,7 +2,26 @@
 Manuel DES Implementasyonu
 """
 
-from .manual_des import manual_des_encrypt, manual_des_decrypt
+from .manual_des import (
+    manual_des_encrypt, manual_des_decrypt, encrypt_bytes, decrypt_bytes
+)
+from .bitslice_des import manual_des_encrypt_blocks, manual_des_decrypt_blocks
+from .numpy_des import manual_des_encrypt_array, manual_des_decrypt_array
+from .modes import des_encrypt_mode, des_decrypt_mode, des_ctr_decrypt_range
+from .parallel import ParallelDES, parallel_des_encrypt, parallel_des_decrypt
+from .stream import encrypt_stream, decrypt_stream
+from .triple_des import triple_des_encrypt_mode, triple_des_decrypt_mode
+from .brute_force import SuffixKeyspace, CharsetKeyspace, brute_force
+from .mitm import double_des_encrypt_block, meet_in_the_middle
 
-__all__ = ['manual_des_encrypt', 'manual_des_decrypt']
+__all__ = ['manual_des_encrypt', 'manual_des_decrypt',
+           'encrypt_bytes', 'decrypt_bytes',
+           'manual_des_encrypt_blocks', 'manual_des_decrypt_blocks',
+           'manual_des_encrypt_array', 'manual_des_decrypt_array',
+           'des_encrypt_mode', 'des_decrypt_mode', 'des_ctr_decrypt_range',
+           'ParallelDES', 'parallel_des_encrypt', 'parallel_des_decrypt',
+           'encrypt_stream', 'decrypt_stream',
+           'triple_des_encrypt_mode', 'triple_des_decrypt_mode',
+           'SuffixKeyspace', 'CharsetKeyspace', 'brute_force',
+           'double_des_encrypt_block', 'meet_in_the_middle']
 
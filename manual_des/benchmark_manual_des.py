@@ -0,0 +1,299 @@
+"""
+Manuel DES Performans Ölçümleri
+Terminal üzerinden çalıştırmak için: python manual_des/benchmark_manual_des.py
+"""
+
+import sys
+import os
+import time
+import tempfile
+import tracemalloc
+
+import numpy as np
+
+# Proje root'unu Python path'ine ekle
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from manual_des.manual_des import (
+    generate_round_keys, des_block_encrypt, des_block_encrypt_int,
+    round_keys_to_int, str_to_bit_array, bit_array_to_bytes,
+    manual_des_encrypt, manual_des_decrypt, invalidate_key_cache, key_cache_info,
+    encrypt_bytes, decrypt_bytes
+)
+from manual_des.bitslice_des import (
+    blocks_to_planes, planes_to_blocks, des_crypt_blocks_bitsliced
+)
+from manual_des.numpy_des import des_encrypt_array, des_ctr_array
+from manual_des.parallel import ParallelDES
+from manual_des.stream import encrypt_stream
+from manual_des.triple_des import TripleDESBlockCipher
+from manual_des.brute_force import SuffixKeyspace, brute_force
+from manual_des.mitm import double_des_encrypt_block, meet_in_the_middle
+
+
+def _report(name, n_bytes, elapsed):
+    """Ölçüm sonucunu KB/s olarak yazdırır."""
+    print(f"{name:<32} {n_bytes / 1024 / elapsed:10.1f} KB/s  ({elapsed:.3f} s)")
+
+
+def benchmark_int_engine(n_blocks=2000, key="MyKey123"):
+    """Bit listesi motoru ile tamsayı motorunun hızını karşılaştırır."""
+    data = os.urandom(n_blocks * 8)
+    round_keys = generate_round_keys(key)
+    subkeys = round_keys_to_int(round_keys)
+
+    print(f"\n--- Blok motoru ({n_blocks} blok) ---")
+
+    start = time.perf_counter()
+    bit_out = bytearray()
+    for i in range(0, len(data), 8):
+        block_bits = str_to_bit_array(data[i:i+8])
+        bit_out += bit_array_to_bytes(des_block_encrypt(block_bits, round_keys))
+    bit_time = time.perf_counter() - start
+    _report("Bit listesi (des_block_encrypt)", len(data), bit_time)
+
+    start = time.perf_counter()
+    int_out = bytearray()
+    for i in range(0, len(data), 8):
+        block = int.from_bytes(data[i:i+8], 'big')
+        int_out += des_block_encrypt_int(block, subkeys).to_bytes(8, 'big')
+    int_time = time.perf_counter() - start
+    _report("Tamsayı + SP tabloları", len(data), int_time)
+
+    assert bit_out == int_out, "Motor çıktıları farklı!"
+    print(f"Hızlanma: {bit_time / int_time:.1f}x")
+
+
+def benchmark_transpose(lanes_list=(64, 1024, 4096), total_blocks=8192):
+    """Blok <-> bit düzlemi transpozesinin maliyetini ölçer."""
+    print(f"\n--- Transpoze ({total_blocks} blok) ---")
+    for lanes in lanes_list:
+        data = os.urandom(lanes * 8)
+        passes = total_blocks // lanes
+
+        start = time.perf_counter()
+        for _ in range(passes):
+            planes = blocks_to_planes(data, lanes)
+            assert planes_to_blocks(planes, lanes) == data
+        _report(f"Transpoze gidiş-dönüş, {lanes} şerit", passes * len(data),
+                time.perf_counter() - start)
+
+
+def benchmark_bitslice(lanes_list=(64, 1024, 4096), total_blocks=8192, key="MyKey123"):
+    """Bitsliced motoru farklı şerit sayılarıyla tamsayı motoruna karşı ölçer."""
+    data = os.urandom(total_blocks * 8)
+    round_keys = generate_round_keys(key)
+    subkeys = round_keys_to_int(round_keys)
+
+    print(f"\n--- Bitsliced DES ({total_blocks} blok) ---")
+
+    start = time.perf_counter()
+    expected = bytearray()
+    for i in range(0, len(data), 8):
+        block = int.from_bytes(data[i:i+8], 'big')
+        expected += des_block_encrypt_int(block, subkeys).to_bytes(8, 'big')
+    _report("Tamsayı motoru", len(data), time.perf_counter() - start)
+
+    for lanes in lanes_list:
+        start = time.perf_counter()
+        output = des_crypt_blocks_bitsliced(data, round_keys, lanes)
+        _report(f"Bitsliced, {lanes} şerit", len(data), time.perf_counter() - start)
+        assert output == expected, "Bitsliced çıktı farklı!"
+
+
+def benchmark_numpy(sizes=(8 * 1024, 1024 * 1024, 8 * 1024 * 1024), key="MyKey123"):
+    """NumPy vektörleştirilmiş motorun ECB ve CTR hızını ölçer."""
+    round_keys = generate_round_keys(key)
+
+    print("\n--- NumPy vektörleştirilmiş DES ---")
+    for size in sizes:
+        data = os.urandom(size)
+        blocks = np.frombuffer(data, dtype=np.uint8).reshape(-1, 8)
+
+        start = time.perf_counter()
+        des_encrypt_array(blocks, round_keys)
+        _report(f"ECB, {size // 1024} KB", size, time.perf_counter() - start)
+
+        start = time.perf_counter()
+        des_ctr_array(data, round_keys, 0)
+        _report(f"CTR, {size // 1024} KB", size, time.perf_counter() - start)
+
+
+def benchmark_key_cache(n_messages=5000, keys=("Anahtar1", "Anahtar2", "Anahtar3")):
+    """Birçok kısa mesajı önbellekli ve önbelleksiz anahtar üretimiyle şifreler."""
+    messages = [f"Kısa mesaj #{i}" for i in range(n_messages)]
+    n_bytes = sum(len(m.encode('utf-8')) for m in messages)
+
+    print(f"\n--- Round key önbelleği ({n_messages} kısa mesaj) ---")
+
+    start = time.perf_counter()
+    for i, message in enumerate(messages):
+        invalidate_key_cache()
+        manual_des_encrypt(message, keys[i % len(keys)])
+    _report("Önbelleksiz", n_bytes, time.perf_counter() - start)
+
+    invalidate_key_cache()
+    start = time.perf_counter()
+    for i, message in enumerate(messages):
+        manual_des_encrypt(message, keys[i % len(keys)])
+    _report("LRU önbellekli", n_bytes, time.perf_counter() - start)
+    print(f"Önbellek: {key_cache_info()}")
+
+
+def benchmark_parallel(size=16 * 1024 * 1024, key="MyKey123"):
+    """Paralel CTR şifrelemeyi 1'den çekirdek sayısına kadar worker ile ölçer."""
+    data = os.urandom(size)
+    cores = os.cpu_count() or 1
+    worker_counts = sorted({1, 2, 4, 8, 16, 32, cores} & set(range(1, cores + 1)))
+
+    print(f"\n--- Paralel CTR ({size // (1024 * 1024)} MB, {cores} çekirdek) ---")
+    baseline = None
+    for workers in worker_counts:
+        with ParallelDES(key, workers=workers) as engine:
+            engine.encrypt(data[:engine.chunk_size * workers], 'CTR')  # havuzu ısıt
+            start = time.perf_counter()
+            engine.encrypt(data, 'CTR')
+            elapsed = time.perf_counter() - start
+        baseline = baseline or elapsed
+        _report(f"{workers} worker (x{baseline / elapsed:.1f})", size, elapsed)
+
+
+def benchmark_stream_memory(sizes=(64 * 1024, 256 * 1024), chunk_size=8 * 1024, key="MyKey123"):
+    """
+    manual_des_encrypt ile encrypt_stream'in en yüksek bellek kullanımını karşılaştırır.
+
+    tracemalloc her bellek ayırmayı izlediği için bu ölçümde hızlar anlamlı değildir.
+    """
+    print(f"\n--- Bellek kullanımı (tracemalloc tepe değeri, parça {chunk_size // 1024} KB) ---")
+    for size in sizes:
+        text = 'a' * size
+        tracemalloc.start()
+        manual_des_encrypt(text, key)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del text
+        print(f"manual_des_encrypt, {size // 1024:5d} KB girdi: {peak / 1024:10.1f} KB")
+
+        with tempfile.TemporaryFile() as src, tempfile.TemporaryFile() as dst:
+            src.write(b'a' * size)
+            src.seek(0)
+            tracemalloc.start()
+            encrypt_stream(src, dst, key, mode='CBC', chunk_size=chunk_size)
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+        print(f"encrypt_stream,     {size // 1024:5d} KB girdi: {peak / 1024:10.1f} KB")
+
+
+def benchmark_bytes_api(n_messages=2000, size=256, key="MyKey123"):
+    """Metin/hex API'si ile byte API'sini (hazır çıktı tamponuyla) karşılaştırır."""
+    text = 'x' * size
+    data = text.encode('utf-8')
+    out = bytearray(size + 8)
+    restored = bytearray(size)
+    n_bytes = n_messages * size
+
+    print(f"\n--- Byte API ({n_messages} x {size} byte, şifrele + çöz) ---")
+
+    start = time.perf_counter()
+    for _ in range(n_messages):
+        manual_des_decrypt(manual_des_encrypt(text, key), key)
+    _report("Metin + hex (str)", n_bytes, time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for _ in range(n_messages):
+        encrypt_bytes(data, key, out)
+        decrypt_bytes(out, key, restored)
+    _report("Byte + çıktı tamponu", n_bytes, time.perf_counter() - start)
+    print(f"Şifreli boyut: hex {len(manual_des_encrypt(text, key))} karakter, "
+          f"ikili {encrypt_bytes(data, key, out)} byte")
+
+
+def benchmark_triple_des(n_blocks=4000, key=b"Anahtar1Anahtar2Anahtar3"):
+    """Birleşik 3DES'i üç bağımsız DES çağrısıyla karşılaştırır."""
+    blocks = [int.from_bytes(os.urandom(8), 'big') for _ in range(n_blocks)]
+    k1 = round_keys_to_int(generate_round_keys(key[:8]))
+    k2 = round_keys_to_int(generate_round_keys(key[8:16]))[::-1]
+    k3 = round_keys_to_int(generate_round_keys(key[16:]))
+    cipher = TripleDESBlockCipher(key)
+
+    print(f"\n--- 3DES-EDE ({n_blocks} blok) ---")
+
+    start = time.perf_counter()
+    expected = [des_block_encrypt_int(des_block_encrypt_int(des_block_encrypt_int(b, k1), k2), k3)
+                for b in blocks]
+    _report("3 x des_block_encrypt_int", n_blocks * 8, time.perf_counter() - start)
+
+    start = time.perf_counter()
+    fused = [cipher.encrypt_block(b) for b in blocks]
+    _report("Birleşik (ara FP/IP yok)", n_blocks * 8, time.perf_counter() - start)
+    assert fused == expected, "3DES çıktıları farklı!"
+
+
+def benchmark_brute_force(unknown_bits=14, key=b"MyKey123"):
+    """Artımlı anahtar üretimli aramayı her aday için tam anahtar üretimiyle karşılaştırır."""
+    plaintext = "Kriptoloji Final Sunumu"
+    keyspace = SuffixKeyspace(key, unknown_bits)
+    ciphertext = manual_des_encrypt(plaintext, keyspace.key_at(keyspace.size - 1))
+
+    print(f"\n--- Kaba kuvvet arama (2^{unknown_bits} aday) ---")
+
+    n_naive = 2000
+    start = time.perf_counter()
+    for key_id in range(n_naive):
+        manual_des_encrypt(plaintext, keyspace.key_at(key_id))
+    elapsed = time.perf_counter() - start
+    print(f"{'Aday başına tam anahtar üretimi':<40} {n_naive / elapsed:>12,.0f} anahtar/s")
+
+    for workers in sorted({1, os.cpu_count() or 1}):
+        result = brute_force(plaintext, ciphertext, keyspace, workers=workers,
+                             stop_on_first=False, verbose=False)
+        assert keyspace.key_at(keyspace.size - 1) in result['keys'], "Anahtar bulunamadı!"
+        print(f"{f'Artımlı arama ({workers} süreç)':<40} {result['keys_per_second']:>12,.0f} anahtar/s")
+
+
+def benchmark_mitm(unknown_bits_list=(16, 20), key=b"MyKey123"):
+    """2DES ortadaki adam saldırısının hızını ve tablo belleğini ölçer."""
+    for unknown_bits in unknown_bits_list:
+        keyspace = SuffixKeyspace(key, unknown_bits)
+        key1, key2 = keyspace.key_at(1), keyspace.key_at(keyspace.size - 1)
+        pairs = [(p, double_des_encrypt_block(p, key1, key2)) for p in (b"Kriptolo", b"ji Final")]
+
+        print(f"\n--- 2DES ortadaki adam (2 x 2^{unknown_bits} anahtar) ---")
+        with tempfile.TemporaryDirectory() as tmp:
+            # memmap: 2^16 kayıtlık parçalar sıralanıp birleştirilir (parça ~0.8 MB)
+            for label, path in (("RAM", None), ("memmap", os.path.join(tmp, "table"))):
+                tracemalloc.start()
+                result = meet_in_the_middle(pairs, keyspace, table_path=path, verbose=False,
+                                            run_size=1 << 16)
+                measured_peak = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+                assert result['pairs'] == [(key1, key2)], "Anahtar çifti bulunamadı!"
+                print(f"{label:<8} tablo {result['table_bytes'] / (1024 * 1024):>7.1f} MB, "
+                      f"tablo RAM tepe {result['table_peak_bytes'] / (1024 * 1024):>7.1f} MB, "
+                      f"ölçülen RAM tepe {measured_peak / (1024 * 1024):>7.1f} MB, "
+                      f"ileri {result['forward_keys_per_second']:>10,.0f} anahtar/s, "
+                      f"geri {result['backward_keys_per_second']:>10,.0f} anahtar/s, "
+                      f"aday {result['candidates']}")
+
+
+def main():
+    print("="*60)
+    print("MANUEL DES PERFORMANS ÖLÇÜMÜ")
+    print("="*60)
+    benchmark_int_engine()
+    benchmark_transpose()
+    benchmark_bitslice()
+    benchmark_numpy()
+    benchmark_key_cache()
+    benchmark_bytes_api()
+    benchmark_triple_des()
+    benchmark_parallel()
+    benchmark_stream_memory()
+    benchmark_brute_force()
+    benchmark_mitm()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,193 @@
+"""
+Bitsliced DES (Toplu Blok Şifreleme)
+
+Bağımsız bloklar "bit düzlemlerine" (bit plane) çevrilir: i. düzlem, her
+bloğun i. bitini ayrı bir şeritte (lane) tutan tek bir tamsayıdır. Böylece
+permütasyonlar sadece liste yeniden sıralamasına dönüşür, her S-Box ise
+tüm bloklar üzerinde aynı anda çalışan sabit bir boolean devre olur.
+"""
+
+import numpy as np
+
+from .manual_des import (
+    IP_TABLE, FP_TABLE, E_TABLE, P_TABLE, S_BOXES, get_key_schedule
+)
+
+# Python tamsayıları 64 bitle sınırlı olmadığı için bir geçişte 64'ten fazla
+# blok işlenebilir; geniş şeritlerde devre maliyeti bloklar arasında paylaşılır.
+DEFAULT_LANES = 1024
+
+
+# --- 1. S-BOX DEVRELERİ ---
+
+def _sbox_anf(box):
+    """
+    S-Box'ın 4 çıkış bitini cebirsel normal form (ANF) olarak çıkarır.
+
+    Her çıkış biti, girdi bitlerinin AND'lenmiş terimlerinin (monom) XOR'u
+    olarak yazılır. Monomlar 6 bitlik maske ile gösterilir; maskenin en
+    anlamlı biti S-Box'ın ilk girdi bitidir.
+
+    Returns:
+        4 elemanlı liste; her eleman o çıkış bitinin monom maskeleri
+    """
+    anf = []
+    for j in range(4):
+        # Doğruluk tablosu
+        coeffs = []
+        for value in range(64):
+            row = ((value >> 4) & 2) | (value & 1)
+            col = (value >> 1) & 0xF
+            coeffs.append((S_BOXES[box][row][col] >> (3 - j)) & 1)
+
+        # Möbius dönüşümü: doğruluk tablosu -> ANF katsayıları
+        step = 1
+        while step < 64:
+            for value in range(64):
+                if value & step:
+                    coeffs[value] ^= coeffs[value ^ step]
+            step <<= 1
+        anf.append([mask for mask in range(64) if coeffs[mask]])
+    return anf
+
+_SBOX_ANF = [_sbox_anf(i) for i in range(8)]
+
+# Monom maskesinin en düşük biti -> girdi indeksi (0 = ilk girdi biti)
+_LOW_BIT_INPUT = {1 << b: 5 - b for b in range(6)}
+
+def _sbox_circuit(anf, inputs, ones):
+    """6 bit düzlemini S-Box devresinden geçirip 4 bit düzlemi döndürür."""
+    monomials = [ones] * 64
+    for mask in range(1, 64):
+        low = mask & -mask
+        monomials[mask] = monomials[mask ^ low] & inputs[_LOW_BIT_INPUT[low]]
+
+    outputs = []
+    for terms in anf:
+        acc = 0
+        for mask in terms:
+            acc ^= monomials[mask]
+        outputs.append(acc)
+    return outputs
+
+
+# --- 2. TRANSPOZE (Blok <-> Bit Düzlemi) ---
+
+def blocks_to_planes(data, lanes):
+    """
+    lanes adet 8 byte'lık bloğu 64 bit düzlemine çevirir.
+
+    Args:
+        data: lanes * 8 byte uzunluğunda veri
+        lanes: Şerit sayısı (8'in katı)
+
+    Returns:
+        64 tamsayılık liste; i. düzlemin en anlamlı biti ilk bloğa aittir
+    """
+    blocks = np.frombuffer(data, dtype=np.uint8).reshape(lanes, 8)
+    bits = np.unpackbits(blocks, axis=1)
+    rows = np.packbits(bits.T, axis=1)
+    return [int.from_bytes(row.tobytes(), 'big') for row in rows]
+
+def planes_to_blocks(planes, lanes):
+    """blocks_to_planes işleminin tersi; lanes * 8 byte döndürür."""
+    row_bytes = lanes // 8
+    rows = np.frombuffer(
+        b''.join(plane.to_bytes(row_bytes, 'big') for plane in planes),
+        dtype=np.uint8
+    ).reshape(64, row_bytes)
+    bits = np.unpackbits(rows, axis=1)
+    return np.packbits(bits.T, axis=1).tobytes()
+
+
+# --- 3. BITSLICED DES ---
+
+def des_encrypt_planes(planes, round_keys, lanes):
+    """
+    Bit düzlemleri üzerinde 16 turluk DES uygular.
+
+    Args:
+        planes: 64 bit düzlemi (blocks_to_planes çıktısı)
+        round_keys: generate_round_keys çıktısı (çözme için ters sırada)
+        lanes: Şerit sayısı
+
+    Returns:
+        Şifrelenmiş 64 bit düzlemi
+    """
+    ones = (1 << lanes) - 1
+
+    # Initial Permutation sadece düzlemlerin yeniden sıralanmasıdır
+    block = [planes[pos - 1] for pos in IP_TABLE]
+    L = block[:32]
+    R = block[32:]
+
+    for r_key in round_keys:
+        # Expansion + round key XOR (anahtar biti 1 ise düzlem tersine çevrilir)
+        inputs = [R[pos - 1] ^ ones if k_bit else R[pos - 1]
+                  for pos, k_bit in zip(E_TABLE, r_key)]
+
+        substituted = []
+        for i in range(8):
+            substituted.extend(_sbox_circuit(_SBOX_ANF[i], inputs[i*6:(i+1)*6], ones))
+
+        f_result = [substituted[pos - 1] for pos in P_TABLE]
+        L, R = R, [l ^ f for l, f in zip(L, f_result)]
+
+    final_block = R + L
+    return [final_block[pos - 1] for pos in FP_TABLE]
+
+def des_crypt_blocks_bitsliced(data, round_keys, lanes=DEFAULT_LANES):
+    """
+    8'in katı uzunluktaki veriyi lanes bloklu geçişlerle şifreler (ECB).
+
+    Args:
+        data: Uzunluğu 8'in katı olan byte dizisi
+        round_keys: generate_round_keys çıktısı (çözme için ters sırada)
+        lanes: Bir geçişte işlenecek blok sayısı (8'in katı)
+
+    Returns:
+        Şifrelenmiş veri (bytes)
+    """
+    if len(data) % 8 != 0:
+        raise ValueError("Veri uzunluğu 8'in katı olmalıdır!")
+    if lanes <= 0 or lanes % 8 != 0:
+        raise ValueError("Şerit sayısı 8'in pozitif katı olmalıdır!")
+
+    pass_size = lanes * 8
+    output = bytearray()
+    for i in range(0, len(data), pass_size):
+        chunk = bytes(data[i:i + pass_size])
+        n_bytes = len(chunk)
+        # Son geçişte eksik şeritler sıfırla doldurulur
+        chunk = chunk.ljust(pass_size, b'\x00')
+
+        planes = blocks_to_planes(chunk, lanes)
+        planes = des_encrypt_planes(planes, round_keys, lanes)
+        output += planes_to_blocks(planes, lanes)[:n_bytes]
+    return bytes(output)
+
+def manual_des_encrypt_blocks(blocks, key, lanes=DEFAULT_LANES):
+    """
+    Birçok 8 byte'lık bloğu bitsliced motorla şifreler.
+
+    Args:
+        blocks: 8 byte'lık blokların listesi
+        key: Anahtar metni (generate_round_keys ile aynı kurallar)
+        lanes: Bir geçişte işlenecek blok sayısı (8'in katı, örn. 64)
+
+    Returns:
+        Şifrelenmiş 8 byte'lık blokların listesi
+    """
+    if any(len(block) != 8 for block in blocks):
+        raise ValueError("Her blok 8 byte olmalıdır!")
+    round_keys = get_key_schedule(key).round_keys
+    output = des_crypt_blocks_bitsliced(b''.join(blocks), round_keys, lanes)
+    return [output[i:i+8] for i in range(0, len(output), 8)]
+
+def manual_des_decrypt_blocks(blocks, key, lanes=DEFAULT_LANES):
+    """manual_des_encrypt_blocks ile şifrelenmiş blokları çözer."""
+    if any(len(block) != 8 for block in blocks):
+        raise ValueError("Her blok 8 byte olmalıdır!")
+    round_keys = get_key_schedule(key).decrypt_round_keys
+    output = des_crypt_blocks_bitsliced(b''.join(blocks), round_keys, lanes)
+    return [output[i:i+8] for i in range(0, len(output), 8)]
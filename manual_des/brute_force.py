@@ -0,0 +1,369 @@
+"""
+DES Kaba Kuvvet (Exhaustive Key Search) Motoru - Kriptanaliz Laboratuvarı
+
+manual_des_encrypt ile üretilmiş bilinen bir düz metin / şifreli metin
+çifti için, küçültülmüş bir anahtar uzayını tüm çekirdeklere bölerek tarar.
+
+Artımlı anahtar üretimi: DES anahtar üretimi (PC-1, kaydırmalar, PC-2)
+sadece bit seçimlerinden oluşur, yani doğrusaldır. Her anahtar bitinin 16
+round key'e katkısı bir kez hesaplanır; bir adayın round key'leri bir
+önceki adayınkilerle sadece değişen bitlerin katkısı XOR'lanarak bulunur.
+Ayrıca düz metnin IP'si bir kez hesaplanır ve şifreli blok IP ile
+(FP'nin tersi) hedefe çevrilir; aday başına sadece 16 Feistel turu çalışır.
+"""
+
+import json
+import multiprocessing
+import os
+import string
+import time
+
+import numpy as np
+
+from .manual_des import (
+    _IP_BYTE_TABLES, _permute64, _feistel_int,
+    generate_round_keys, round_keys_to_int, pkcs7_pad, manual_des_decrypt
+)
+
+PRINTABLE_CHARSET = string.ascii_letters + string.digits + string.punctuation + ' '
+DEFAULT_UNIT_SIZE = 1 << 15
+
+
+# --- 1. DOĞRUSAL ANAHTAR ÜRETİMİ ---
+
+def _key_bytes(key):
+    """Anahtarı generate_round_keys ile aynı kurallarla 8 byte'a çevirir."""
+    if isinstance(key, str):
+        key = key.encode('utf-8')
+    return bytes(key)[:8].ljust(8, b'\x00')
+
+def _schedule(key_bytes):
+    """8 byte anahtarın round key'lerini (48 bitlik tamsayılar) döndürür."""
+    return round_keys_to_int(generate_round_keys(key_bytes))
+
+def _xor_schedules(a, b):
+    return [x ^ y for x, y in zip(a, b)]
+
+# Her anahtar bitinin (0 = en anlamlı bit) round key'lere katkısı
+_BIT_CONTRIB = [_schedule((1 << (63 - pos)).to_bytes(8, 'big')) for pos in range(64)]
+
+# Parite bitleri (her byte'ın en düşük biti) DES tarafından kullanılmaz
+EFFECTIVE_BIT_POSITIONS = [pos for pos in range(64) if pos % 8 != 7]
+
+
+# --- 2. ANAHTAR UZAYLARI ---
+# Her uzay, aday kimliklerini (key id) artımlı round key'lerle birlikte üretir.
+
+class SuffixKeyspace:
+    """
+    Temel anahtarın son N etkin (parite dışı) biti bilinmeyen anahtarlar.
+
+    Adaylar Gray kodu sırasında gezilir: ardışık iki aday sadece bir bitte
+    farklıdır, round key'ler tek bir katkı XOR'lanarak güncellenir.
+    """
+
+    def __init__(self, base_key, unknown_bits):
+        if not 1 <= unknown_bits <= 56:
+            raise ValueError("Bilinmeyen bit sayısı 1 ile 56 arasında olmalıdır!")
+        self.unknown_bits = unknown_bits
+        # Aday kimliğinin j. biti -> anahtardaki bit konumu (j = 0 son etkin bit)
+        self._positions = EFFECTIVE_BIT_POSITIONS[::-1][:unknown_bits]
+
+        base = int.from_bytes(_key_bytes(base_key), 'big')
+        for pos in self._positions:
+            base &= ~(1 << (63 - pos))
+        self._base = base
+        self._base_schedule = _schedule(base.to_bytes(8, 'big'))
+        self.size = 1 << unknown_bits
+
+    def describe(self):
+        return {'type': 'suffix', 'base': self._base.to_bytes(8, 'big').hex(),
+                'unknown_bits': self.unknown_bits}
+
+    def key_at(self, key_id):
+        """Aday kimliğinden 8 byte anahtarı üretir."""
+        key = self._base
+        for j, pos in enumerate(self._positions):
+            if (key_id >> j) & 1:
+                key |= 1 << (63 - pos)
+        return key.to_bytes(8, 'big')
+
+    def schedule_array(self, key_ids):
+        """Aday kimliği dizisi için (16, N) uint64 round key dizisi döndürür."""
+        key_ids = np.asarray(key_ids, dtype=np.uint64)
+        out = np.empty((16, len(key_ids)), dtype=np.uint64)
+        out[:] = np.array(self._base_schedule, dtype=np.uint64)[:, None]
+        for j, pos in enumerate(self._positions):
+            # Bit set ise tüm bitleri 1 olan maske
+            mask = np.uint64(0) - ((key_ids >> np.uint64(j)) & np.uint64(1))
+            out ^= np.array(_BIT_CONTRIB[pos], dtype=np.uint64)[:, None] & mask
+        return out
+
+    def walk(self, start, stop):
+        """[start, stop) sıra numaralarındaki adayları (key_id, round key'ler) olarak üretir."""
+        if start >= stop:
+            return
+        key_id = start ^ (start >> 1)
+        subkeys = self._base_schedule
+        for j, pos in enumerate(self._positions):
+            if (key_id >> j) & 1:
+                subkeys = _xor_schedules(subkeys, _BIT_CONTRIB[pos])
+        yield key_id, subkeys
+
+        contribs = [_BIT_CONTRIB[pos] for pos in self._positions]
+        for index in range(start + 1, stop):
+            # gray(i) ^ gray(i-1) = i'nin en düşük set biti
+            j = (index & -index).bit_length() - 1
+            key_id ^= 1 << j
+            subkeys = _xor_schedules(subkeys, contribs[j])
+            yield key_id, subkeys
+
+
+class CharsetKeyspace:
+    """
+    Bilinen ön ek + karakter kümesinden length adet bilinmeyen karakter.
+
+    Metin anahtarları generate_round_keys'teki gibi 8 byte'a sıfırla
+    tamamlanır. Adaylar kilometre sayacı (odometer) gibi gezilir; her adımda
+    sadece değişen konumların katkısı güncellenir.
+    """
+
+    def __init__(self, prefix, length, charset=PRINTABLE_CHARSET):
+        prefix_bytes = prefix.encode('utf-8')
+        if any(len(c.encode('utf-8')) != 1 for c in charset):
+            raise ValueError("Karakter kümesi tek byte'lık karakterlerden oluşmalıdır!")
+        if length < 1 or len(prefix_bytes) + length > 8:
+            raise ValueError("Ön ek + bilinmeyen karakterler 8 byte'ı geçemez!")
+        self.prefix = prefix
+        self.length = length
+        self.charset = charset
+        self.size = len(charset) ** length
+
+        self._base_schedule = _schedule(_key_bytes(prefix_bytes))
+        offset = len(prefix_bytes)
+        # Konum başına her karakterin round key katkısı
+        self._contribs = []
+        for i in range(length):
+            shift = 8 * (7 - offset - i)
+            self._contribs.append([_schedule((ord(c) << shift).to_bytes(8, 'big'))
+                                   for c in charset])
+
+    def describe(self):
+        return {'type': 'charset', 'prefix': self.prefix,
+                'length': self.length, 'charset': self.charset}
+
+    def _digits(self, key_id):
+        digits = []
+        for _ in range(self.length):
+            key_id, d = divmod(key_id, len(self.charset))
+            digits.append(d)
+        return digits[::-1]
+
+    def key_at(self, key_id):
+        """Aday kimliğinden anahtar metnini üretir."""
+        return self.prefix + ''.join(self.charset[d] for d in self._digits(key_id))
+
+    def schedule_array(self, key_ids):
+        """Aday kimliği dizisi için (16, N) uint64 round key dizisi döndürür."""
+        key_ids = np.asarray(key_ids, dtype=np.uint64)
+        radix = np.uint64(len(self.charset))
+        out = np.empty((16, len(key_ids)), dtype=np.uint64)
+        out[:] = np.array(self._base_schedule, dtype=np.uint64)[:, None]
+        for i in range(self.length - 1, -1, -1):
+            key_ids, digits = np.divmod(key_ids, radix)
+            out ^= np.array(self._contribs[i], dtype=np.uint64)[digits.astype(np.intp)].T
+        return out
+
+    def walk(self, start, stop):
+        """[start, stop) aralığındaki adayları (key_id, round key'ler) olarak üretir."""
+        if start >= stop:
+            return
+        radix = len(self.charset)
+        digits = self._digits(start)
+        subkeys = self._base_schedule
+        for i, d in enumerate(digits):
+            subkeys = _xor_schedules(subkeys, self._contribs[i][d])
+        yield start, subkeys
+
+        last = self.length - 1
+        for key_id in range(start + 1, stop):
+            i = last
+            while True:
+                old = digits[i]
+                new = old + 1 if old + 1 < radix else 0
+                digits[i] = new
+                subkeys = _xor_schedules(subkeys, _xor_schedules(self._contribs[i][old],
+                                                                 self._contribs[i][new]))
+                if new != 0:
+                    break
+                i -= 1
+            yield key_id, subkeys
+
+
+# --- 3. TARAMA ---
+
+def _known_block_target(plaintext, ciphertext_hex):
+    """İlk bloğun IP'li düz metin yarılarını ve IP'li şifreli blok hedefini döndürür."""
+    first_plain = pkcs7_pad(plaintext.encode('utf-8'))[:8]
+    first_cipher = bytes.fromhex(ciphertext_hex)[:8]
+    if len(first_cipher) != 8:
+        raise ValueError("Şifreli metin en az bir blok (16 hex karakter) olmalıdır!")
+    block = _permute64(int.from_bytes(first_plain, 'big'), _IP_BYTE_TABLES)
+    # FP'nin tersi IP'dir: hedef = (R16 << 32) | L16
+    target = _permute64(int.from_bytes(first_cipher, 'big'), _IP_BYTE_TABLES)
+    return block >> 32, block & 0xFFFFFFFF, target
+
+def _scan(keyspace, start, stop, left0, right0, target, stop_event, check_every=4096):
+    """
+    Bir aralığı tarar.
+
+    Returns:
+        (bulunan key_id listesi, denenen aday sayısı, aralık tamamlandı mı)
+    """
+    found = []
+    tested = 0
+    for key_id, subkeys in keyspace.walk(start, stop):
+        left, right = _feistel_int(left0, right0, subkeys)
+        if (right << 32) | left == target:
+            found.append(key_id)
+        tested += 1
+        if stop_event is not None and tested % check_every == 0 and stop_event.is_set():
+            return found, tested, False
+    return found, tested, True
+
+_worker_state = None
+
+def _init_worker(keyspace, left0, right0, target, stop_event):
+    global _worker_state
+    _worker_state = (keyspace, left0, right0, target, stop_event)
+
+def _worker_scan(unit):
+    unit_index, start, stop = unit
+    keyspace, left0, right0, target, stop_event = _worker_state
+    found, tested, complete = _scan(keyspace, start, stop, left0, right0, target, stop_event)
+    return unit_index, found, tested, complete
+
+
+def _pending_units(keyspace, unit_size, n_units, done_units):
+    """Bitmemiş iş birimlerini tembel (lazy) üretir; tam liste bellekte tutulmaz."""
+    for u in range(n_units):
+        if u not in done_units:
+            yield u, u * unit_size, min((u + 1) * unit_size, keyspace.size)
+
+
+# --- 4. CHECKPOINT ---
+
+def _load_checkpoint(path, keyspace, unit_size):
+    if not path or not os.path.exists(path):
+        return set(), set(), 0
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    if data.get('keyspace') != keyspace.describe() or data.get('unit_size') != unit_size:
+        raise ValueError("Checkpoint dosyası bu anahtar uzayına ait değil!")
+    return set(data['done_units']), set(data['found']), data['tested']
+
+def _save_checkpoint(path, keyspace, unit_size, done_units, found, tested):
+    """Checkpoint'i önce geçici dosyaya yazıp atomik olarak değiştirir."""
+    data = {
+        'keyspace': keyspace.describe(),
+        'unit_size': unit_size,
+        'done_units': sorted(done_units),
+        'found': sorted(found),
+        'tested': tested
+    }
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f)
+    os.replace(tmp_path, path)
+
+
+# --- 5. ANA FONKSİYON ---
+
+def brute_force(plaintext, ciphertext_hex, keyspace, workers=None,
+                unit_size=DEFAULT_UNIT_SIZE, checkpoint_path=None,
+                stop_on_first=True, verbose=False):
+    """
+    Bilinen düz metin / şifreli metin çifti için anahtar uzayını tarar.
+
+    Args:
+        plaintext: manual_des_encrypt'e verilen metin
+        ciphertext_hex: manual_des_encrypt çıktısı (hex)
+        keyspace: SuffixKeyspace veya CharsetKeyspace
+        workers: Süreç sayısı (None ise çekirdek sayısı, 1 ise aynı süreçte)
+        unit_size: Bir iş biriminin aday sayısı (checkpoint ayrıntı düzeyi)
+        checkpoint_path: JSON checkpoint dosyası; varsa kaldığı yerden devam eder
+        stop_on_first: İlk doğrulanmış anahtarda tüm worker'ları durdurur
+        verbose: İlerlemeyi ve anahtar/saniye hızını yazdırır
+
+    Returns:
+        {'keys', 'tested', 'elapsed', 'keys_per_second', 'completed'} sözlüğü
+    """
+    workers = workers or os.cpu_count() or 1
+    left0, right0, target = _known_block_target(plaintext, ciphertext_hex)
+
+    done_units, found_ids, previously_tested = _load_checkpoint(checkpoint_path, keyspace, unit_size)
+    n_units = (keyspace.size + unit_size - 1) // unit_size
+    pending = _pending_units(keyspace, unit_size, n_units, done_units)
+    has_pending = len(done_units) < n_units
+
+    def confirmed(key_id):
+        # İlk blok eşleşmesi tüm şifreli metin çözülerek doğrulanır
+        return manual_des_decrypt(ciphertext_hex, keyspace.key_at(key_id)) == plaintext
+
+    found_ids = {k for k in found_ids if confirmed(k)}
+    tested = 0
+    completed = True
+    start_time = time.perf_counter()
+    last_report = start_time
+
+    if stop_on_first and found_ids:
+        pending, has_pending = iter(()), False
+
+    stop_event = multiprocessing.Event() if workers > 1 else None
+    pool = None
+    if workers > 1 and has_pending:
+        pool = multiprocessing.Pool(workers, initializer=_init_worker,
+                                    initargs=(keyspace, left0, right0, target, stop_event))
+        results = pool.imap_unordered(_worker_scan, pending)
+    else:
+        _init_worker(keyspace, left0, right0, target, None)
+        results = (_worker_scan(unit) for unit in pending)
+
+    try:
+        for unit_index, unit_found, unit_tested, unit_complete in results:
+            tested += unit_tested
+            found_ids.update(k for k in unit_found if confirmed(k))
+            if unit_complete:
+                done_units.add(unit_index)
+            if checkpoint_path:
+                _save_checkpoint(checkpoint_path, keyspace, unit_size, done_units,
+                                 found_ids, previously_tested + tested)
+
+            now = time.perf_counter()
+            if verbose and now - last_report >= 1.0:
+                last_report = now
+                print(f"{len(done_units)}/{n_units} birim, "
+                      f"{tested / (now - start_time):,.0f} anahtar/s")
+
+            if stop_on_first and found_ids:
+                if stop_event is not None:
+                    stop_event.set()
+                break
+    finally:
+        if pool is not None:
+            pool.terminate()
+            pool.join()
+
+    completed = len(done_units) == n_units
+    elapsed = time.perf_counter() - start_time
+    result = {
+        'keys': [keyspace.key_at(k) for k in sorted(found_ids)],
+        'tested': previously_tested + tested,
+        'elapsed': elapsed,
+        'keys_per_second': tested / elapsed if elapsed > 0 else 0.0,
+        'completed': completed
+    }
+    if verbose:
+        print(f"Denenen: {result['tested']:,} anahtar, "
+              f"{result['keys_per_second']:,.0f} anahtar/s, bulunan: {result['keys']}")
+    return result
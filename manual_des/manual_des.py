@@ -1,4 +1,6 @@
 import struct
+import threading
+from collections import OrderedDict
 
 # --- 1. STANDART DES TABLOLARI (Sabitler) ---
 
@@ -129,8 +131,13 @@ def left_shift(bits, n):
 # --- 3. ANAHTAR ÜRETİMİ (Standard Key Schedule) ---
 
 def generate_round_keys(key_text):
+    # Anahtar metin (str) veya ham byte dizisi olabilir
+    if isinstance(key_text, str):
+        key_bytes = key_text.encode('utf-8')
+    else:
+        key_bytes = bytes(key_text)
+    
     # Anahtarı 8 byte'a tamamla veya kırp
-    key_bytes = key_text.encode('utf-8')
     key_bytes = key_bytes[:8].ljust(8, b'\x00')
     
     key_bits = str_to_bit_array(key_bytes)
@@ -216,7 +223,204 @@ def des_block_encrypt(block_bits, round_keys):
     
     return final_block
 
-# --- 5. ANA FONKSİYONLAR (Padding & Main) ---
+# --- 5. TAMSAYI TABANLI HIZLI MOTOR ---
+# Bloklar 64 bitlik tamsayı olarak tutulur. IP/FP ve E genişletmesi byte
+# indeksli tablolarla, S-Box + P permütasyonu ise 8 adet 64 girdili SP
+# tablosuyla yapılır. Çıktı des_block_encrypt ile bit-bit aynıdır.
+
+def _build_byte_tables(table, in_bits):
+    """
+    Bit permütasyon tablosunu byte indeksli arama tablolarına çevirir.
+    
+    Girdinin her byte'ı için 256 girdilik bir tablo üretilir; tablolardan
+    okunan değerler OR'lanınca permütasyonun sonucu elde edilir.
+    """
+    out_bits = len(table)
+    tables = []
+    for byte_index in range(in_bits // 8):
+        # Bu byte'taki her bitin çıktıda hangi bitleri set ettiği
+        masks = [0] * 8
+        for out_pos, in_pos in enumerate(table):
+            in_pos -= 1
+            if in_pos // 8 == byte_index:
+                masks[in_pos % 8] |= 1 << (out_bits - 1 - out_pos)
+        
+        entries = []
+        for value in range(256):
+            out = 0
+            for bit in range(8):
+                if (value >> (7 - bit)) & 1:
+                    out |= masks[bit]
+            entries.append(out)
+        tables.append(entries)
+    return tables
+
+def _build_sp_tables():
+    """S-Box'ları P permütasyonu ile birleştirip 8 adet 64 girdili tablo üretir."""
+    # S-Box çıkışındaki bit konumu -> P sonrası bit konumu
+    p_position = [0] * 32
+    for out_pos, in_pos in enumerate(P_TABLE):
+        p_position[in_pos - 1] = out_pos
+    
+    tables = []
+    for i in range(8):
+        entries = []
+        for value in range(64):
+            row = ((value >> 4) & 2) | (value & 1)
+            col = (value >> 1) & 0xF
+            val = S_BOXES[i][row][col]
+            out = 0
+            for j in range(4):
+                if (val >> (3 - j)) & 1:
+                    out |= 1 << (31 - p_position[i*4 + j])
+            entries.append(out)
+        tables.append(entries)
+    return tables
+
+_IP_BYTE_TABLES = _build_byte_tables(IP_TABLE, 64)
+_FP_BYTE_TABLES = _build_byte_tables(FP_TABLE, 64)
+_E_BYTE_TABLES = _build_byte_tables(E_TABLE, 32)
+_SP_TABLES = _build_sp_tables()
+
+def bits_to_int(bits):
+    """Bit dizisini tamsayıya çevirir (ilk bit en anlamlı bittir)."""
+    value = 0
+    for bit in bits:
+        value = (value << 1) | bit
+    return value
+
+def round_keys_to_int(round_keys):
+    """generate_round_keys çıktısını 48 bitlik tamsayı listesine çevirir."""
+    return [bits_to_int(r_key) for r_key in round_keys]
+
+def _permute64(value, tables):
+    """64 bitlik değere byte tablolarıyla permütasyon uygular."""
+    t0, t1, t2, t3, t4, t5, t6, t7 = tables
+    return (t0[value >> 56] | t1[(value >> 48) & 0xFF] |
+            t2[(value >> 40) & 0xFF] | t3[(value >> 32) & 0xFF] |
+            t4[(value >> 24) & 0xFF] | t5[(value >> 16) & 0xFF] |
+            t6[(value >> 8) & 0xFF] | t7[value & 0xFF])
+
+def _feistel_int(left, right, subkeys):
+    """Feistel turlarını 32 bitlik yarılar üzerinde çalıştırır, (L, R) döndürür."""
+    e0, e1, e2, e3 = _E_BYTE_TABLES
+    s0, s1, s2, s3, s4, s5, s6, s7 = _SP_TABLES
+    for r_key in subkeys:
+        # Expansion + round key XOR (48 bit)
+        x = (e0[right >> 24] | e1[(right >> 16) & 0xFF] |
+             e2[(right >> 8) & 0xFF] | e3[right & 0xFF]) ^ r_key
+        # S-Box + P tek adımda
+        f_result = (s0[x >> 42] | s1[(x >> 36) & 0x3F] |
+                    s2[(x >> 30) & 0x3F] | s3[(x >> 24) & 0x3F] |
+                    s4[(x >> 18) & 0x3F] | s5[(x >> 12) & 0x3F] |
+                    s6[(x >> 6) & 0x3F] | s7[x & 0x3F])
+        left, right = right, left ^ f_result
+    return left, right
+
+def des_block_encrypt_int(block, subkeys):
+    """
+    64 bitlik tamsayı bloğu şifreler.
+    
+    Args:
+        block: 64 bitlik blok (int)
+        subkeys: round_keys_to_int ile üretilmiş 16 round key
+                 (çözme için ters sırada verilir)
+    
+    Returns:
+        64 bitlik şifreli blok (int)
+    """
+    block = _permute64(block, _IP_BYTE_TABLES)
+    left, right = _feistel_int(block >> 32, block & 0xFFFFFFFF, subkeys)
+    # Son turdan sonra R16 L16 olarak birleşir
+    return _permute64((right << 32) | left, _FP_BYTE_TABLES)
+
+# --- 6. ROUND KEY ÖNBELLEĞİ (LRU) ---
+
+class KeySchedule:
+    """Bir anahtar için derlenmiş round key'ler (şifreleme ve çözme sırası)."""
+    
+    __slots__ = ('round_keys', 'decrypt_round_keys', 'subkeys', 'decrypt_subkeys')
+    
+    def __init__(self, key):
+        round_keys = generate_round_keys(key)
+        # Önbellekte paylaşıldığı için değiştirilemez (tuple) tutulur
+        self.round_keys = tuple(tuple(r_key) for r_key in round_keys)
+        self.decrypt_round_keys = self.round_keys[::-1]
+        self.subkeys = tuple(round_keys_to_int(round_keys))
+        self.decrypt_subkeys = self.subkeys[::-1]
+
+class KeyScheduleCache:
+    """
+    Anahtar -> KeySchedule eşlemesi tutan, boyutu sınırlı ve thread-safe
+    LRU önbellek. Sınır aşılınca en uzun süredir kullanılmayan anahtar atılır.
+    """
+    
+    def __init__(self, maxsize=128):
+        if maxsize <= 0:
+            raise ValueError("Önbellek boyutu pozitif olmalıdır!")
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+    
+    def get(self, key):
+        """Anahtarın derlenmiş round key'lerini döndürür, yoksa üretip saklar."""
+        if not isinstance(key, str):
+            key = bytes(key)  # bytearray/memoryview hash'lenebilir olsun
+        with self._lock:
+            schedule = self._entries.get(key)
+            if schedule is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return schedule
+            self.misses += 1
+        
+        # Anahtar üretimi kilit dışında yapılır; diğer thread'ler beklemez
+        schedule = KeySchedule(key)
+        
+        with self._lock:
+            self._entries[key] = schedule
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return schedule
+    
+    def invalidate(self, key=None):
+        """Verilen anahtarı (key None ise tüm önbelleği) siler."""
+        if key is not None and not isinstance(key, str):
+            key = bytes(key)  # get() ile aynı normalleştirme
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+    
+    def info(self):
+        """İzleme için önbellek istatistiklerini döndürür."""
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'size': len(self._entries),
+                'maxsize': self.maxsize
+            }
+
+_key_cache = KeyScheduleCache()
+
+def get_key_schedule(key):
+    """Anahtarın round key'lerini paylaşılan LRU önbellekten döndürür."""
+    return _key_cache.get(key)
+
+def key_cache_info():
+    """Paylaşılan önbelleğin hit/miss sayaçlarını ve boyutunu döndürür."""
+    return _key_cache.info()
+
+def invalidate_key_cache(key=None):
+    """Paylaşılan önbellekten bir anahtarı (key None ise hepsini) siler."""
+    _key_cache.invalidate(key)
+
+# --- 7. ANA FONKSİYONLAR (Padding & Main) ---
 
 def pkcs7_pad(data):
     """Standart PKCS7 Padding."""
@@ -225,54 +429,115 @@ def pkcs7_pad(data):
 
 def pkcs7_unpad(data):
     """PKCS7 Padding kaldırma."""
+    if not data:
+        raise ValueError("Padding bozuk: veri boş.")
     pad_len = data[-1]
+    if not 1 <= pad_len <= 8 or data[-pad_len:] != bytes([pad_len] * pad_len):
+        raise ValueError("Padding bozuk veya yanlış anahtar.")
     return data[:-pad_len]
 
-def manual_des_encrypt(plaintext, key):
-    # 1. Padding (PKCS7)
-    plaintext_bytes = plaintext.encode('utf-8')
-    padded_text = pkcs7_pad(plaintext_bytes)
+# 8 byte'lık blok <-> 64 bitlik big-endian tamsayı
+_BLOCK = struct.Struct('>Q')
+
+def padded_length(data_len):
+    """PKCS7 padding sonrası uzunluk (çıktı tamponunu boyutlandırmak için)."""
+    return data_len - data_len % 8 + 8
+
+def _as_byte_view(buffer):
+    """Buffer protocol destekleyen nesneyi (bytes, bytearray, memoryview, mmap) byte görünümüne çevirir."""
+    view = memoryview(buffer)
+    return view if view.format == 'B' and view.ndim == 1 else view.cast('B')
+
+def encrypt_bytes(data, key, out=None):
+    """
+    Ham byte verisini DES ile şifreler (PKCS7, blok blok - ECB).
     
-    # 2. Anahtarları Hazırla (16 adet)
-    round_keys = generate_round_keys(key)
+    Args:
+        data: Buffer protocol destekleyen herhangi bir nesne
+        key: Anahtar (str veya bytes)
+        out: Yazılabilir çıktı tamponu (en az padded_length(len(data)) byte);
+             verilirse ara kopya oluşturulmadan doğrudan buraya yazılır
     
-    encrypted_bits = []
+    Returns:
+        out None ise şifreli veri (yeni bytearray, ek kopya yapılmaz),
+        değilse yazılan byte sayısı
+    """
+    src = _as_byte_view(data)
+    total = padded_length(len(src))
+    if out is None:
+        dst = bytearray(total)
+    else:
+        dst = _as_byte_view(out)
+        if dst.readonly or len(dst) < total:
+            raise ValueError(f"Çıktı tamponu yazılabilir ve en az {total} byte olmalıdır!")
     
-    # 3. Blok Blok Şifrele
-    for i in range(0, len(padded_text), 8):
-        block = padded_text[i:i+8]
-        block_bits = str_to_bit_array(block)
-        
-        enc_block = des_block_encrypt(block_bits, round_keys)
-        encrypted_bits.extend(enc_block)
-        
-    # 4. Sonucu Hex'e çevir
-    encrypted_bytes = bit_array_to_bytes(encrypted_bits)
-    return encrypted_bytes.hex().upper()
+    subkeys = get_key_schedule(key).subkeys
+    
+    # Tam bloklar kaynaktan okunup hedefe yerinde yazılır (ara kopya yok)
+    full = len(src) - len(src) % 8
+    for i, (block,) in enumerate(_BLOCK.iter_unpack(src[:full])):
+        _BLOCK.pack_into(dst, i * 8, des_block_encrypt_int(block, subkeys))
+    
+    # Sadece son blok padding için kopyalanır
+    last_block, = _BLOCK.unpack(pkcs7_pad(bytes(src[full:])))
+    _BLOCK.pack_into(dst, full, des_block_encrypt_int(last_block, subkeys))
+    
+    return dst if out is None else total
 
-def manual_des_decrypt(ciphertext_hex, key):
-    # Hex decode
-    ciphertext = bytes.fromhex(ciphertext_hex)
+def decrypt_bytes(data, key, out=None):
+    """
+    encrypt_bytes ile şifrelenmiş veriyi çözer.
     
-    # Anahtarları Hazırla ve TERS ÇEVİR (16 adet)
-    round_keys = generate_round_keys(key)
-    round_keys = round_keys[::-1] # Decrypt için ters sıra
+    Args:
+        data: Buffer protocol destekleyen şifreli veri (8'in katı uzunlukta)
+        key: Anahtar (str veya bytes)
+        out: Yazılabilir çıktı tamponu (en az düz metin uzunluğu kadar)
     
-    decrypted_bits = []
+    Returns:
+        out None ise çözülmüş veri (yeni bytearray, ek kopya yapılmaz),
+        değilse yazılan byte sayısı
     
-    for i in range(0, len(ciphertext), 8):
-        block = ciphertext[i:i+8]
-        block_bits = str_to_bit_array(block)
-        
-        # Decrypt işlemi Encrypt ile aynıdır, sadece anahtar sırası terstir
-        dec_block = des_block_encrypt(block_bits, round_keys)
-        decrypted_bits.extend(dec_block)
-        
-    decrypted_bytes = bit_array_to_bytes(decrypted_bits)
+    Raises:
+        ValueError: Uzunluk veya padding geçersizse
+    """
+    src = _as_byte_view(data)
+    if len(src) == 0 or len(src) % 8 != 0:
+        raise ValueError("Şifreli veri uzunluğu 8'in katı olmalıdır!")
+    
+    # Decrypt için ters sıra
+    subkeys = get_key_schedule(key).decrypt_subkeys
+    
+    # Düz metin uzunluğunu bilmek için önce son blok çözülür
+    full = len(src) - 8
+    last_block = des_block_encrypt_int(_BLOCK.unpack_from(src, full)[0], subkeys)
+    tail = pkcs7_unpad(_BLOCK.pack(last_block))
+    total = full + len(tail)
+    
+    if out is None:
+        dst = bytearray(total)
+    else:
+        dst = _as_byte_view(out)
+        if dst.readonly or len(dst) < total:
+            raise ValueError(f"Çıktı tamponu yazılabilir ve en az {total} byte olmalıdır!")
+    
+    for i, (block,) in enumerate(_BLOCK.iter_unpack(src[:full])):
+        _BLOCK.pack_into(dst, i * 8, des_block_encrypt_int(block, subkeys))
+    dst[full:total] = tail
+    
+    return dst if out is None else total
+
+def manual_des_encrypt(plaintext, key):
+    """Metni DES ile şifreler, sonucu büyük harfli hex olarak döndürür."""
+    return encrypt_bytes(plaintext.encode('utf-8'), key).hex().upper()
+
+def manual_des_decrypt(ciphertext_hex, key):
+    """manual_des_encrypt çıktısını (hex) çözüp metni döndürür."""
+    # Hex decode
+    ciphertext = bytes.fromhex(ciphertext_hex)
     
-    # Padding kaldır
+    # Çöz ve padding kaldır
     try:
-        return pkcs7_unpad(decrypted_bytes).decode('utf-8')
+        return decrypt_bytes(ciphertext, key).decode('utf-8')
     except:
         return "[Hata] Padding bozuk veya yanlış anahtar."
 
@@ -0,0 +1,269 @@
+"""
+Çift DES (2DES) için Ortadaki Adam (Meet-in-the-Middle) Saldırısı
+
+C = E_K2(E_K1(P)) için bilinen bir düz metin / şifreli metin bloğu verildiğinde:
+
+1. İleri tablo: K1 uzayındaki her anahtar için E_K1(P) hesaplanır ve
+   tek bir kayıt dizisinde (ara değer (8, big-endian) | anahtar kimliği
+   (4 veya 8, big-endian)) tutulur. Python dict yerine dizi kullanıldığı
+   için kayıt başına 12-16 byte yeter. Kayıtlar sabit uzunluklu byte
+   dizisi ('S12') olarak yerinde sıralanır; byte sırası (ara değer,
+   anahtar kimliği) sırasıyla aynıdır ve argsort'un 8 byte/kayıt
+   permütasyonu ile kopyalarına gerek kalmaz. İstenirse tablo np.memmap
+   ile diske yazılır: kayıtlar sınırlı boyutta parçalar (run) halinde
+   RAM'de sıralanıp dosyaya yazılır, sonra parçalar küçük bloklarla
+   birleştirilir (external merge sort); RAM kullanımı tablo boyutundan
+   bağımsızdır.
+2. Geri tarama: K2 uzayı gruplar halinde gezilir, D_K2(C) değerleri
+   np.searchsorted ile tabloda aranır.
+
+FP bir permütasyon olduğu için karşılaştırma FP öncesi değerlerle yapılır:
+ileri tarafta IP(P), geri tarafta IP(C) bir kez hesaplanır ve her aday
+sadece 16 Feistel turundan geçer. Round key'ler, brute_force anahtar
+uzaylarının doğrusal anahtar üretimiyle grup başına vektörel hesaplanır.
+Eşleşen adaylar ek bilinen bloklarla doğrulanır.
+"""
+
+import os
+import time
+
+import numpy as np
+
+from .manual_des import (
+    _IP_BYTE_TABLES, _permute64, des_block_encrypt_int, get_key_schedule
+)
+from .numpy_des import _feistel_array
+
+DEFAULT_BATCH_KEYS = 1 << 16
+# memmap modunda RAM'de sıralanan parça boyutu (12 byte kayıtla 48 MB)
+DEFAULT_RUN_RECORDS = 1 << 22
+
+_SHIFT32 = np.uint64(32)
+
+
+def double_des_encrypt_block(block, key1, key2):
+    """8 byte bloğu C = E_K2(E_K1(P)) ile şifreler."""
+    value = int.from_bytes(block, 'big')
+    value = des_block_encrypt_int(value, get_key_schedule(key1).subkeys)
+    value = des_block_encrypt_int(value, get_key_schedule(key2).subkeys)
+    return value.to_bytes(8, 'big')
+
+def _halves(block):
+    """8 byte bloğun IP sonrası (L0, R0) yarılarını döndürür."""
+    value = _permute64(int.from_bytes(block, 'big'), _IP_BYTE_TABLES)
+    return value >> 32, value & 0xFFFFFFFF
+
+def _middle_values(keyspace, start, stop, left0, right0, decrypt):
+    """[start, stop) anahtarları için FP öncesi (R16 << 32 | L16) değerlerini hesaplar."""
+    key_ids = np.arange(start, stop, dtype=np.uint64)
+    subkeys = keyspace.schedule_array(key_ids)
+    if decrypt:
+        subkeys = subkeys[::-1]
+    n = stop - start
+    L, R = _feistel_array(np.full(n, left0, dtype=np.uint32),
+                          np.full(n, right0, dtype=np.uint32), subkeys)
+    return (R.astype(np.uint64) << _SHIFT32) | L
+
+
+def _pack_records(values, key_ids, key_size):
+    """(ara değer, anahtar kimliği) çiftlerini big-endian kayıt satırlarına yazar."""
+    rows = np.empty((len(values), 8 + key_size), dtype=np.uint8)
+    rows[:, :8] = values.astype('>u8').view(np.uint8).reshape(-1, 8)
+    rows[:, 8:] = key_ids.astype(f'>u{key_size}').view(np.uint8).reshape(-1, key_size)
+    return rows
+
+
+class MeetInTheMiddleTable:
+    """
+    K1 uzayı için sıralı ileri şifreleme tablosu.
+
+    Args:
+        keyspace: K1 anahtar uzayı (SuffixKeyspace veya CharsetKeyspace)
+        plaintext_block: Bilinen 8 byte düz metin bloğu
+        path: Verilirse tablo '<path>.table' memmap dosyasında tutulur
+        batch_size: Tek seferde şifrelenen anahtar sayısı
+        run_size: memmap modunda RAM'de sıralanan parça boyutu (kayıt)
+
+    peak_bytes, tablo kurulurken RAM'de tutulan tablo/parça/birleştirme
+    tamponlarının en büyük toplamıdır; buna grup başına şifreleme çalışma
+    alanı (batch_size ile orantılı) eklenir.
+    """
+
+    def __init__(self, keyspace, plaintext_block, path=None, batch_size=DEFAULT_BATCH_KEYS,
+                 run_size=DEFAULT_RUN_RECORDS):
+        self.keyspace = keyspace
+        self.batch_size = batch_size
+        self.path = path
+        size = keyspace.size
+        self.key_size = 4 if size <= 1 << 32 else 8
+        self.record_size = 8 + self.key_size
+        self._record_dtype = np.dtype(f'S{self.record_size}')
+        self._key_dtype = np.uint32 if self.key_size == 4 else np.uint64
+
+        start_time = time.perf_counter()
+        self._left0, self._right0 = _halves(plaintext_block)
+        if path is None:
+            # Tüm tablo RAM'de: doldur ve yerinde sırala
+            self.table = np.empty(size, dtype=self._record_dtype)
+            self._fill(self.table, 0, size)
+            self.build_seconds = time.perf_counter() - start_time
+            self.table.sort()
+            self.peak_bytes = self.table.nbytes
+        else:
+            run_size = max(1, min(run_size, size))
+            runs = [(start, min(start + run_size, size)) for start in range(0, size, run_size)]
+            table_path = path + '.table'
+            runs_path = table_path if len(runs) == 1 else path + '.runs'
+            sorted_runs = np.memmap(runs_path, dtype=self._record_dtype, mode='w+', shape=(size,))
+            buffer = np.empty(run_size, dtype=self._record_dtype)
+            for start, stop in runs:
+                run = buffer[:stop - start]
+                self._fill(run, start, stop)
+                run.sort()
+                sorted_runs[start:stop] = run
+            del buffer
+            self.peak_bytes = run_size * self.record_size
+            self.build_seconds = time.perf_counter() - start_time
+            if len(runs) == 1:
+                self.table = sorted_runs
+            else:
+                self.table = np.memmap(table_path, dtype=self._record_dtype, mode='w+', shape=(size,))
+                merge_bytes = self._merge(sorted_runs, runs, max(1, run_size // len(runs)))
+                self.peak_bytes = max(self.peak_bytes, merge_bytes)
+                del sorted_runs
+                os.remove(runs_path)
+            self.table.flush()
+        self._rows = self.table.view(np.uint8).reshape(size, self.record_size)
+        self.sort_seconds = time.perf_counter() - start_time - self.build_seconds
+
+    def _fill(self, out, start, stop):
+        """[start, stop) anahtarlarının kayıtlarını out dizisine gruplar halinde yazar."""
+        rows = out.view(np.uint8).reshape(-1, self.record_size)
+        for batch_start in range(start, stop, self.batch_size):
+            batch_stop = min(batch_start + self.batch_size, stop)
+            values = _middle_values(self.keyspace, batch_start, batch_stop,
+                                    self._left0, self._right0, False)
+            key_ids = np.arange(batch_start, batch_stop, dtype=self._key_dtype)
+            rows[batch_start - start:batch_stop - start] = _pack_records(values, key_ids, self.key_size)
+
+    def _merge(self, sorted_runs, runs, chunk):
+        """
+        Sıralı parçaları self.table'a bloklar halinde birleştirir.
+
+        Returns:
+            Birleştirme sırasında RAM'de tutulan en büyük tampon boyutu (byte)
+        """
+        heads = [start for start, _ in runs]
+        out = 0
+        peak = 0
+        while out < len(self.table):
+            blocks, limits = [], []
+            for i, (_, stop) in enumerate(runs):
+                if heads[i] < stop:
+                    block = np.array(sorted_runs[heads[i]:min(heads[i] + chunk, stop)])
+                    blocks.append((i, block))
+                    if heads[i] + len(block) < stop:
+                        limits.append(block[-1])
+            # Parçasının tamamı yüklenmemiş koşuların son elemanlarının en küçüğüne
+            # kadar olan kayıtlar kesin olarak sıradadır
+            cutoff = min(limits) if limits else None
+            taken = []
+            for i, block in blocks:
+                count = len(block) if cutoff is None else int(np.searchsorted(block, cutoff, side='right'))
+                taken.append(block[:count])
+                heads[i] += count
+            merged = np.concatenate(taken)
+            merged.sort()
+            peak = max(peak, sum(block.nbytes for _, block in blocks) + merged.nbytes)
+            self.table[out:out + len(merged)] = merged
+            out += len(merged)
+        return peak
+
+    @property
+    def nbytes(self):
+        """Tablonun bellek (veya memmap dosya) boyutu."""
+        return self.table.nbytes
+
+    def lookup(self, middle):
+        """
+        Ara değer dizisini tabloda arar.
+
+        Returns:
+            (sorgu indeksleri, K1 kimlikleri) dizi çifti; aynı ara değere sahip
+            birden fazla K1 (ör. parite eşdeğerleri) için sorgu tekrarlanır.
+        """
+        # (ara değer, en küçük kimlik) ve (ara değer, en büyük kimlik) sınırları
+        bounds = _pack_records(middle, np.zeros(len(middle), dtype=self._key_dtype), self.key_size)
+        lo = np.searchsorted(self.table, bounds.view(self._record_dtype).ravel(), side='left')
+        bounds[:, 8:] = 0xFF
+        hi = np.searchsorted(self.table, bounds.view(self._record_dtype).ravel(), side='right')
+        counts = hi - lo
+        hits = np.nonzero(counts)[0]
+        if len(hits) == 0:
+            return hits, np.empty(0, dtype=self._key_dtype)
+        query = np.repeat(hits, counts[hits])
+        # Her eşleşme aralığının elemanlarını sırayla topla
+        offsets = np.arange(len(query)) - np.repeat(np.cumsum(counts[hits]) - counts[hits], counts[hits])
+        rows = self._rows[lo[query] + offsets, 8:]
+        return query, rows.view(f'>u{self.key_size}').ravel().astype(self._key_dtype)
+
+
+def meet_in_the_middle(known_pairs, keyspace1, keyspace2=None, table_path=None,
+                       batch_size=DEFAULT_BATCH_KEYS, verbose=False, run_size=DEFAULT_RUN_RECORDS):
+    """
+    2DES için bilinen blok çiftlerinden (K1, K2) adaylarını bulur.
+
+    Args:
+        known_pairs: [(düz metin bloğu, şifreli metin bloğu), ...] 8'er byte;
+                     ilki tablo için, kalanlar adayları elemek için kullanılır
+        keyspace1: K1 anahtar uzayı
+        keyspace2: K2 anahtar uzayı (None ise keyspace1)
+        table_path: İleri tablo için memmap dosya ön eki (None ise RAM)
+        batch_size: Tek seferde işlenen anahtar sayısı
+        verbose: Ölçümleri yazdırır
+        run_size: memmap modunda RAM'de sıralanan parça boyutu (kayıt)
+
+    Returns:
+        {'pairs', 'candidates', 'table_bytes', 'table_peak_bytes',
+         'forward_keys_per_second', 'backward_keys_per_second', 'elapsed'} sözlüğü
+    """
+    if not known_pairs or any(len(p) != 8 or len(c) != 8 for p, c in known_pairs):
+        raise ValueError("En az bir adet 8 byte'lık (düz metin, şifreli metin) çifti gerekir!")
+    keyspace2 = keyspace2 or keyspace1
+    plaintext_block, ciphertext_block = known_pairs[0]
+
+    start_time = time.perf_counter()
+    table = MeetInTheMiddleTable(keyspace1, plaintext_block, table_path, batch_size, run_size)
+
+    backward_start = time.perf_counter()
+    left0, right0 = _halves(ciphertext_block)
+    candidates = []
+    for start in range(0, keyspace2.size, batch_size):
+        stop = min(start + batch_size, keyspace2.size)
+        middle = _middle_values(keyspace2, start, stop, left0, right0, True)
+        query, key1_ids = table.lookup(middle)
+        candidates.extend(zip(key1_ids.tolist(), (query + start).tolist()))
+    backward_seconds = time.perf_counter() - backward_start
+
+    pairs = []
+    for key1_id, key2_id in candidates:
+        key1, key2 = keyspace1.key_at(key1_id), keyspace2.key_at(key2_id)
+        if all(double_des_encrypt_block(p, key1, key2) == c for p, c in known_pairs[1:]):
+            pairs.append((key1, key2))
+
+    result = {
+        'pairs': pairs,
+        'candidates': len(candidates),
+        'table_bytes': table.nbytes,
+        'table_peak_bytes': table.peak_bytes,
+        'forward_keys_per_second': keyspace1.size / table.build_seconds if table.build_seconds else 0.0,
+        'backward_keys_per_second': keyspace2.size / backward_seconds if backward_seconds else 0.0,
+        'elapsed': time.perf_counter() - start_time
+    }
+    if verbose:
+        print(f"Tablo: {keyspace1.size:,} kayıt, {table.nbytes / (1024 * 1024):.1f} MB, "
+              f"RAM tepe {table.peak_bytes / (1024 * 1024):.1f} MB (sıralama {table.sort_seconds:.2f} s)")
+        print(f"İleri: {result['forward_keys_per_second']:,.0f} anahtar/s, "
+              f"geri: {result['backward_keys_per_second']:,.0f} anahtar/s")
+        print(f"Aday: {len(candidates)}, doğrulanan çift: {len(pairs)}")
+    return result
@@ -0,0 +1,240 @@
+"""
+Manuel DES için Blok Şifre Modları (ECB, CBC, CTR, CFB, OFB)
+
+Modlar blok fonksiyonlarından bağımsızdır: encrypt_block/decrypt_block
+metotları olan her nesneyle (DESBlockCipher gibi) çalışır. ECB ve CBC
+PKCS7 padding kullanır; CTR, CFB ve OFB akış modlarıdır ve padding
+gerektirmez. CTR sayaç bloğu, cryptography kütüphanesindeki gibi 64 bitlik
+big-endian bir tamsayı olarak artırılır.
+"""
+
+import os
+
+from .manual_des import (
+    des_block_encrypt_int, get_key_schedule, pkcs7_pad, pkcs7_unpad
+)
+
+BLOCK_SIZE = 8
+MODES = ('ECB', 'CBC', 'CTR', 'CFB', 'OFB')
+PADDED_MODES = ('ECB', 'CBC')
+
+_MASK64 = (1 << 64) - 1
+
+
+class DESBlockCipher:
+    """Tek anahtarlı DES blok fonksiyonları (64 bitlik tamsayı giriş/çıkış)."""
+
+    def __init__(self, key):
+        schedule = get_key_schedule(key)
+        self._subkeys = schedule.subkeys
+        self._decrypt_subkeys = schedule.decrypt_subkeys
+
+    def encrypt_block(self, block):
+        return des_block_encrypt_int(block, self._subkeys)
+
+    def decrypt_block(self, block):
+        return des_block_encrypt_int(block, self._decrypt_subkeys)
+
+
+# --- 1. MOD DÖNÜŞÜMLERİ ---
+# Her fonksiyon (çıktı, yeni_durum) döndürür; durum CBC/CFB için son şifreli
+# blok, OFB için son keystream bloğu, CTR için sıradaki sayaçtır. Böylece
+# uzun veriler parça parça işlenebilir (son parça hariç parçalar 8'in katı).
+
+def _xor_tail(chunk, keystream):
+    """8 byte'tan kısa son parçayı keystream bloğunun baş kısmıyla XOR'lar."""
+    n = len(chunk)
+    return (int.from_bytes(chunk, 'big') ^ (keystream >> (8 * (BLOCK_SIZE - n)))).to_bytes(n, 'big')
+
+def _ecb(data, block_fn, state):
+    out = bytearray(len(data))
+    for i in range(0, len(data), BLOCK_SIZE):
+        out[i:i+8] = block_fn(int.from_bytes(data[i:i+8], 'big')).to_bytes(8, 'big')
+    return out, state
+
+def _cbc_encrypt(data, block_fn, prev):
+    out = bytearray(len(data))
+    for i in range(0, len(data), BLOCK_SIZE):
+        prev = block_fn(int.from_bytes(data[i:i+8], 'big') ^ prev)
+        out[i:i+8] = prev.to_bytes(8, 'big')
+    return out, prev
+
+def _cbc_decrypt(data, block_fn, prev):
+    out = bytearray(len(data))
+    for i in range(0, len(data), BLOCK_SIZE):
+        block = int.from_bytes(data[i:i+8], 'big')
+        out[i:i+8] = (block_fn(block) ^ prev).to_bytes(8, 'big')
+        prev = block
+    return out, prev
+
+def _ctr(data, block_fn, counter):
+    out = bytearray(len(data))
+    full = len(data) - len(data) % BLOCK_SIZE
+    for i in range(0, full, BLOCK_SIZE):
+        out[i:i+8] = (int.from_bytes(data[i:i+8], 'big') ^ block_fn(counter)).to_bytes(8, 'big')
+        counter = (counter + 1) & _MASK64
+    if full < len(data):
+        out[full:] = _xor_tail(data[full:], block_fn(counter))
+        counter = (counter + 1) & _MASK64
+    return out, counter
+
+def _cfb_encrypt(data, block_fn, prev):
+    out = bytearray(len(data))
+    full = len(data) - len(data) % BLOCK_SIZE
+    for i in range(0, full, BLOCK_SIZE):
+        prev = int.from_bytes(data[i:i+8], 'big') ^ block_fn(prev)
+        out[i:i+8] = prev.to_bytes(8, 'big')
+    if full < len(data):
+        out[full:] = _xor_tail(data[full:], block_fn(prev))
+    return out, prev
+
+def _cfb_decrypt(data, block_fn, prev):
+    out = bytearray(len(data))
+    full = len(data) - len(data) % BLOCK_SIZE
+    for i in range(0, full, BLOCK_SIZE):
+        block = int.from_bytes(data[i:i+8], 'big')
+        out[i:i+8] = (block ^ block_fn(prev)).to_bytes(8, 'big')
+        prev = block
+    if full < len(data):
+        out[full:] = _xor_tail(data[full:], block_fn(prev))
+    return out, prev
+
+def _ofb(data, block_fn, state):
+    out = bytearray(len(data))
+    full = len(data) - len(data) % BLOCK_SIZE
+    for i in range(0, full, BLOCK_SIZE):
+        state = block_fn(state)
+        out[i:i+8] = (int.from_bytes(data[i:i+8], 'big') ^ state).to_bytes(8, 'big')
+    if full < len(data):
+        state = block_fn(state)
+        out[full:] = _xor_tail(data[full:], state)
+    return out, state
+
+# mod -> (şifreleme dönüşümü, çözme dönüşümü, çözmede blok çözme fonksiyonu mu?)
+_MODE_TABLE = {
+    'ECB': (_ecb, _ecb, True),
+    'CBC': (_cbc_encrypt, _cbc_decrypt, True),
+    'CTR': (_ctr, _ctr, False),
+    'CFB': (_cfb_encrypt, _cfb_decrypt, False),
+    'OFB': (_ofb, _ofb, False),
+}
+
+def check_mode(mode):
+    """Mod adını doğrular ve büyük harfe çevirir."""
+    mode = mode.upper()
+    if mode not in _MODE_TABLE:
+        raise ValueError(f"Mod {', '.join(MODES)} değerlerinden biri olmalıdır!")
+    return mode
+
+def mode_transform(cipher, data, mode, state, decrypt=False):
+    """
+    Veriyi seçilen modda padding uygulamadan işler.
+
+    Args:
+        cipher: encrypt_block/decrypt_block metotları olan blok şifre
+        data: Byte dizisi (ECB/CBC'de 8'in katı; diğerlerinde son parça kısa olabilir)
+        mode: 'ECB', 'CBC', 'CTR', 'CFB' veya 'OFB'
+        state: Mod durumu (ilk çağrıda IV/sayaç int olarak, ECB'de None)
+        decrypt: True ise çözme yapılır
+
+    Returns:
+        (çıktı bytearray, yeni durum) tuple'ı
+    """
+    encrypt_fn, decrypt_fn, uses_inverse = _MODE_TABLE[check_mode(mode)]
+    data = memoryview(data).cast('B')
+    if decrypt:
+        block_fn = cipher.decrypt_block if uses_inverse else cipher.encrypt_block
+        return decrypt_fn(data, block_fn, state)
+    return encrypt_fn(data, cipher.encrypt_block, state)
+
+
+# --- 2. ANA FONKSİYONLAR ---
+
+def _initial_state(mode, iv):
+    """IV/nonce'u doğrulayıp modun başlangıç durumuna çevirir."""
+    if mode == 'ECB':
+        return None
+    if iv is None or len(iv) != BLOCK_SIZE:
+        raise ValueError("IV/nonce 8 byte olmalıdır!")
+    return int.from_bytes(iv, 'big')
+
+def encrypt_mode(cipher, plaintext, mode='CBC', iv=None):
+    """
+    Blok şifre ile veriyi seçilen modda şifreler.
+
+    Args:
+        cipher: encrypt_block/decrypt_block metotları olan blok şifre
+        plaintext: Şifrelenecek veri (bytes)
+        mode: 'ECB', 'CBC', 'CTR', 'CFB' veya 'OFB'
+        iv: 8 byte IV (CTR'de ilk sayaç bloğu); None ise rastgele oluşturulur
+
+    Returns:
+        (iv, ciphertext) tuple'ı (ECB'de iv None)
+    """
+    mode = check_mode(mode)
+    if mode != 'ECB' and iv is None:
+        iv = os.urandom(BLOCK_SIZE)
+    state = _initial_state(mode, iv)
+
+    if mode in PADDED_MODES:
+        plaintext = pkcs7_pad(bytes(plaintext))
+    ciphertext, _ = mode_transform(cipher, plaintext, mode, state)
+    return (iv if mode != 'ECB' else None), bytes(ciphertext)
+
+def decrypt_mode(cipher, iv, ciphertext, mode='CBC'):
+    """
+    encrypt_mode ile şifrelenmiş veriyi çözer.
+
+    Returns:
+        Çözülmüş veri (bytes)
+
+    Raises:
+        ValueError: Uzunluk veya padding geçersizse
+    """
+    mode = check_mode(mode)
+    state = _initial_state(mode, iv)
+    if mode in PADDED_MODES and (len(ciphertext) == 0 or len(ciphertext) % BLOCK_SIZE):
+        raise ValueError("Şifreli veri uzunluğu 8'in katı olmalıdır!")
+
+    plaintext, _ = mode_transform(cipher, ciphertext, mode, state, decrypt=True)
+    if mode in PADDED_MODES:
+        return pkcs7_unpad(bytes(plaintext))
+    return bytes(plaintext)
+
+def des_encrypt_mode(plaintext, key, mode='CBC', iv=None):
+    """
+    Manuel DES ile veriyi seçilen modda şifreler.
+
+    Args:
+        plaintext: Şifrelenecek veri (bytes)
+        key: Anahtar (str veya bytes, ilk 8 byte kullanılır)
+        mode: 'ECB', 'CBC', 'CTR', 'CFB' veya 'OFB'
+        iv: 8 byte IV/nonce (None ise rastgele oluşturulur)
+
+    Returns:
+        (iv, ciphertext) tuple'ı
+    """
+    return encrypt_mode(DESBlockCipher(key), plaintext, mode, iv)
+
+def des_decrypt_mode(iv, ciphertext, key, mode='CBC'):
+    """Manuel DES ile seçilen modda şifrelenmiş veriyi çözer."""
+    return decrypt_mode(DESBlockCipher(key), iv, ciphertext, mode)
+
+def des_ctr_decrypt_range(ciphertext, key, nonce, start_block):
+    """
+    CTR şifreli verinin herhangi bir bölümünü baştan işlemeden çözer.
+
+    Args:
+        ciphertext: start_block. bloktan başlayan şifreli dilim
+        key: Anahtar
+        nonce: Şifrelemede kullanılan 8 byte ilk sayaç bloğu
+        start_block: Dilimin ilk bloğunun indeksi (0 tabanlı)
+
+    Returns:
+        Çözülmüş dilim (bytes)
+    """
+    if start_block < 0:
+        raise ValueError("Blok indeksi negatif olamaz!")
+    counter = (_initial_state('CTR', nonce) + start_block) & _MASK64
+    plaintext, _ = mode_transform(DESBlockCipher(key), ciphertext, 'CTR', counter, decrypt=True)
+    return bytes(plaintext)
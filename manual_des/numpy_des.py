@@ -0,0 +1,146 @@
+"""
+NumPy ile Vektörleştirilmiş DES
+
+(N, 8) boyutlu uint8 blok dizisi tek seferde işlenir. Tamsayı motorunun
+byte indeksli IP/FP ve E tabloları ile birleşik S-Box/P (SP) tabloları
+NumPy dizilerine çevrilir; her adım tüm N blok üzerinde fancy-indexing
+ile tablo toplama (gather) olarak yapılır. Böylece 16 tur blok başına
+değil dizi başına çalışır.
+"""
+
+import numpy as np
+
+from .manual_des import (
+    _IP_BYTE_TABLES, _FP_BYTE_TABLES, _E_BYTE_TABLES, _SP_TABLES,
+    get_key_schedule, round_keys_to_int
+)
+
+_IP_TABLES = np.array(_IP_BYTE_TABLES, dtype=np.uint64)   # (8, 256)
+_FP_TABLES = np.array(_FP_BYTE_TABLES, dtype=np.uint64)   # (8, 256)
+_E_TABLES = np.array(_E_BYTE_TABLES, dtype=np.uint64)     # (4, 256), 48 bit
+_SP_ARRAYS = np.array(_SP_TABLES, dtype=np.uint32)        # (8, 64)
+
+# Her S-Box'ın 48 bitlik girdideki kaydırma miktarı
+_SBOX_SHIFTS = [np.uint64(42 - 6 * i) for i in range(8)]
+_MASK6 = np.uint64(0x3F)
+_SHIFT32 = np.uint64(32)
+
+# Bellek kullanımını sınırlamak için tek seferde işlenecek en fazla blok
+BATCH_BLOCKS = 1 << 16
+
+
+def _permute_array(blocks, tables):
+    """(N, 8) uint8 bloklara byte tablolarıyla permütasyon uygular, uint64 döndürür."""
+    out = tables[0][blocks[:, 0]]
+    for j in range(1, 8):
+        out |= tables[j][blocks[:, j]]
+    return out
+
+def _to_byte_array(values):
+    """uint64 diziyi (N, 8) big-endian uint8 diziye çevirir."""
+    return values.astype('>u8').view(np.uint8).reshape(-1, 8)
+
+def _feistel_array(L, R, subkeys):
+    """
+    16 Feistel turunu uint32 L/R dizileri üzerinde çalıştırır.
+
+    Round key'ler np.uint64 skaler ya da blok başına farklı anahtarlar için
+    N elemanlı uint64 dizi olabilir. Son turdan sonraki (L16, R16) döner.
+    """
+    e0, e1, e2, e3 = _E_TABLES
+    for r_key in subkeys:
+        # Expansion + round key XOR
+        x = (e0[R >> 24] | e1[(R >> 16) & 0xFF] |
+             e2[(R >> 8) & 0xFF] | e3[R & 0xFF]) ^ r_key
+        # S-Box + P: her S-Box için 64 girdili tablodan toplama
+        f_result = _SP_ARRAYS[0][x >> _SBOX_SHIFTS[0]]
+        for i in range(1, 8):
+            f_result |= _SP_ARRAYS[i][(x >> _SBOX_SHIFTS[i]) & _MASK6]
+        L, R = R, L ^ f_result
+    return L, R
+
+def _des_encrypt_batch(blocks, subkeys):
+    """(N, 8) uint8 blokları 48 bitlik round key'lerle (np.uint64) şifreler."""
+    block = _permute_array(blocks, _IP_TABLES)
+    L, R = _feistel_array((block >> _SHIFT32).astype(np.uint32), block.astype(np.uint32), subkeys)
+
+    # Son turdan sonra R16 L16 olarak birleşir
+    final_block = (R.astype(np.uint64) << _SHIFT32) | L
+    return _to_byte_array(_permute_array(_to_byte_array(final_block), _FP_TABLES))
+
+def des_encrypt_array_int(blocks, subkeys):
+    """
+    Blok dizisini round_keys_to_int çıktısı ile şifreler (ECB).
+
+    Args:
+        blocks: (N, 8) boyutlu uint8 dizisi
+        subkeys: 16 adet 48 bitlik round key (çözme için ters sırada)
+
+    Returns:
+        (N, 8) boyutlu şifreli uint8 dizisi
+    """
+    blocks = np.asarray(blocks, dtype=np.uint8)
+    if blocks.ndim != 2 or blocks.shape[1] != 8:
+        raise ValueError("Blok dizisi (N, 8) boyutunda olmalıdır!")
+
+    subkeys = [np.uint64(r_key) for r_key in subkeys]
+    output = np.empty_like(blocks)
+    for i in range(0, blocks.shape[0], BATCH_BLOCKS):
+        output[i:i + BATCH_BLOCKS] = _des_encrypt_batch(blocks[i:i + BATCH_BLOCKS], subkeys)
+    return output
+
+def des_encrypt_array(blocks, round_keys):
+    """
+    Blok dizisini vektörleştirilmiş DES ile şifreler (ECB).
+
+    Args:
+        blocks: (N, 8) boyutlu uint8 dizisi
+        round_keys: generate_round_keys çıktısı (çözme için ters sırada)
+
+    Returns:
+        (N, 8) boyutlu şifreli uint8 dizisi
+    """
+    return des_encrypt_array_int(blocks, round_keys_to_int(round_keys))
+
+def manual_des_encrypt_array(blocks, key):
+    """(N, 8) uint8 blok dizisini anahtar metniyle şifreler."""
+    return des_encrypt_array_int(blocks, get_key_schedule(key).subkeys)
+
+def manual_des_decrypt_array(blocks, key):
+    """manual_des_encrypt_array ile şifrelenmiş blok dizisini çözer."""
+    return des_encrypt_array_int(blocks, get_key_schedule(key).decrypt_subkeys)
+
+def counter_blocks(counter, n_blocks):
+    """
+    CTR modu için ardışık sayaç bloklarını üretir.
+
+    Args:
+        counter: İlk sayaç değeri (64 bit int); 2^64'te başa sarar
+        n_blocks: Blok sayısı
+
+    Returns:
+        (n_blocks, 8) boyutlu uint8 dizisi (big-endian sayaçlar)
+    """
+    counters = np.arange(n_blocks, dtype=np.uint64) + np.uint64(counter)
+    return _to_byte_array(counters)
+
+def des_ctr_array_int(data, subkeys, counter):
+    """des_ctr_array ile aynı; round key'ler round_keys_to_int biçiminde verilir."""
+    data = np.frombuffer(data, dtype=np.uint8)
+    n_blocks = (len(data) + 7) // 8
+    keystream = des_encrypt_array_int(counter_blocks(counter, n_blocks), subkeys)
+    return (data ^ keystream.reshape(-1)[:len(data)]).tobytes()
+
+def des_ctr_array(data, round_keys, counter):
+    """
+    Veriyi CTR modunda vektörleştirilmiş DES ile şifreler/çözer.
+
+    Args:
+        data: Herhangi uzunlukta byte dizisi
+        round_keys: generate_round_keys çıktısı (CTR'de her iki yön için aynı)
+        counter: İlk sayaç bloğu (64 bit int)
+
+    Returns:
+        Sonuç (bytes)
+    """
+    return des_ctr_array_int(data, round_keys_to_int(round_keys), counter)
@@ -0,0 +1,194 @@
+"""
+Manuel DES için Çok Çekirdekli Paralel Şifreleme
+
+ECB, CTR ve CBC çözme işlemlerinde bloklar birbirinden bağımsızdır. Veri
+büyük parçalara bölünür, parçalar ProcessPoolExecutor ile çekirdeklere
+dağıtılır ve sonuçlar sırasıyla birleştirilir. Round key'ler her worker'a
+havuz oluşturulurken bir kez gönderilir; worker'lar parçaları NumPy
+motoruyla işler. Küçük girdiler havuz maliyetine değmeyeceği için aynı
+süreçte (seri) işlenir.
+
+Çıktılar modes.des_encrypt_mode ile birebir aynıdır (ECB/CBC'de PKCS7).
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .manual_des import get_key_schedule, pkcs7_pad, pkcs7_unpad
+from .modes import BLOCK_SIZE, PADDED_MODES, check_mode, des_encrypt_mode
+from .numpy_des import des_encrypt_array_int, des_ctr_array_int
+
+DEFAULT_CHUNK_SIZE = 1 << 20          # 1 MB
+DEFAULT_MIN_PARALLEL_SIZE = 1 << 20   # Bunun altındaki girdiler seri işlenir
+
+_MASK64 = (1 << 64) - 1
+
+
+# --- 1. WORKER TARAFI ---
+
+_worker_subkeys = None
+
+def _init_worker(subkeys):
+    """Worker başlarken round key'leri bir kez alır."""
+    global _worker_subkeys
+    _worker_subkeys = subkeys
+
+def _crypt_chunk(subkeys, mode, decrypt, chunk, state):
+    """
+    Tek bir parçayı işler.
+
+    state: CTR'de parçanın ilk sayaç değeri, CBC çözmede bir önceki şifreli
+    blok (int), ECB'de None.
+    """
+    if mode == 'CTR':
+        return des_ctr_array_int(chunk, subkeys, state)
+
+    blocks = np.frombuffer(chunk, dtype=np.uint8).reshape(-1, 8)
+    keys = subkeys[::-1] if decrypt else subkeys
+    output = des_encrypt_array_int(blocks, keys)
+    if mode == 'CBC':
+        # P_i = D(C_i) XOR C_(i-1); ilk blok için bir önceki parçanın son bloğu
+        previous = np.empty_like(blocks)
+        previous[0] = np.frombuffer(state.to_bytes(8, 'big'), dtype=np.uint8)
+        previous[1:] = blocks[:-1]
+        output ^= previous
+    return output.tobytes()
+
+def _worker_task(args):
+    return _crypt_chunk(_worker_subkeys, *args)
+
+
+# --- 2. PARALEL ŞİFRELEYİCİ ---
+
+class ParallelDES:
+    """
+    Bir anahtar için worker havuzunu açık tutan paralel DES şifreleyici.
+
+    Args:
+        key: Anahtar (str veya bytes)
+        workers: Worker süreç sayısı (None ise çekirdek sayısı)
+        chunk_size: Bir worker'a gönderilen parça boyutu (8'in katına yuvarlanır)
+        min_parallel_size: Bu boyutun altındaki girdiler seri işlenir
+
+    Kullanım:
+        with ParallelDES("MyKey123", workers=8) as engine:
+            iv, ciphertext = engine.encrypt(data, mode='CTR')
+    """
+
+    def __init__(self, key, workers=None, chunk_size=DEFAULT_CHUNK_SIZE,
+                 min_parallel_size=DEFAULT_MIN_PARALLEL_SIZE):
+        if chunk_size < BLOCK_SIZE:
+            raise ValueError("Parça boyutu en az 8 byte olmalıdır!")
+        self.key = key
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size - chunk_size % BLOCK_SIZE
+        self.min_parallel_size = min_parallel_size
+        self._subkeys = get_key_schedule(key).subkeys
+        self._executor = None
+
+    def _get_executor(self):
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=_init_worker,
+                initargs=(self._subkeys,)
+            )
+        return self._executor
+
+    def _tasks(self, mode, decrypt, data, state, copy):
+        """
+        Parçaları ve başlangıç durumlarını tembel üretir. Seri yolda parçalar
+        kopyalanmadan görünüm (memoryview) olarak verilir; sadece havuza
+        gönderilecek (pickle edilecek) parçalar bytes'a kopyalanır.
+        """
+        for offset in range(0, len(data), self.chunk_size):
+            chunk = data[offset:offset + self.chunk_size]
+            if mode == 'CTR':
+                chunk_state = (state + offset // BLOCK_SIZE) & _MASK64
+            elif mode == 'CBC':
+                chunk_state = state if offset == 0 else int.from_bytes(data[offset - 8:offset], 'big')
+            else:
+                chunk_state = None
+            yield mode, decrypt, bytes(chunk) if copy else chunk, chunk_state
+
+    def _run(self, mode, decrypt, data, state):
+        """Veriyi parçalara böler, paralel (veya seri) işler ve sırayla birleştirir."""
+        data = memoryview(data).cast('B')
+        n_chunks = -(-len(data) // self.chunk_size)
+        if len(data) < self.min_parallel_size or n_chunks < 2 or self.workers < 2:
+            return b''.join(_crypt_chunk(self._subkeys, *task)
+                            for task in self._tasks(mode, decrypt, data, state, copy=False))
+        return b''.join(self._get_executor().map(_worker_task,
+                                                 self._tasks(mode, decrypt, data, state, copy=True)))
+
+    def encrypt(self, plaintext, mode='ECB', iv=None):
+        """
+        Veriyi paralel şifreler.
+
+        CBC şifreleme doğası gereği seridir; bu durumda modes katmanı kullanılır.
+
+        Returns:
+            (iv, ciphertext) tuple'ı (ECB'de iv None)
+        """
+        mode = check_mode(mode)
+        if mode not in ('ECB', 'CTR'):
+            return des_encrypt_mode(plaintext, self.key, mode, iv)
+
+        if mode == 'CTR':
+            if iv is None:
+                iv = os.urandom(BLOCK_SIZE)
+            elif len(iv) != BLOCK_SIZE:
+                raise ValueError("IV/nonce 8 byte olmalıdır!")
+            return iv, self._run('CTR', False, plaintext, int.from_bytes(iv, 'big'))
+
+        return None, self._run('ECB', False, pkcs7_pad(bytes(plaintext)), None)
+
+    def decrypt(self, iv, ciphertext, mode='ECB'):
+        """
+        ECB, CTR veya CBC ile şifrelenmiş veriyi paralel çözer.
+
+        Returns:
+            Çözülmüş veri (bytes)
+        """
+        mode = check_mode(mode)
+        if mode not in ('ECB', 'CTR', 'CBC'):
+            raise ValueError("Paralel çözme sadece ECB, CTR ve CBC için desteklenir!")
+        if mode != 'ECB' and (iv is None or len(iv) != BLOCK_SIZE):
+            raise ValueError("IV/nonce 8 byte olmalıdır!")
+        if mode in PADDED_MODES and (len(ciphertext) == 0 or len(ciphertext) % BLOCK_SIZE):
+            raise ValueError("Şifreli veri uzunluğu 8'in katı olmalıdır!")
+
+        state = int.from_bytes(iv, 'big') if iv is not None else None
+        plaintext = self._run(mode, True, ciphertext, state)
+        if mode in PADDED_MODES:
+            return pkcs7_unpad(plaintext)
+        return plaintext
+
+    def close(self):
+        """Worker havuzunu kapatır."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def parallel_des_encrypt(plaintext, key, mode='ECB', iv=None, workers=None,
+                         chunk_size=DEFAULT_CHUNK_SIZE,
+                         min_parallel_size=DEFAULT_MIN_PARALLEL_SIZE):
+    """Tek seferlik paralel şifreleme; bkz. ParallelDES.encrypt."""
+    with ParallelDES(key, workers, chunk_size, min_parallel_size) as engine:
+        return engine.encrypt(plaintext, mode, iv)
+
+def parallel_des_decrypt(iv, ciphertext, key, mode='ECB', workers=None,
+                         chunk_size=DEFAULT_CHUNK_SIZE,
+                         min_parallel_size=DEFAULT_MIN_PARALLEL_SIZE):
+    """Tek seferlik paralel çözme; bkz. ParallelDES.decrypt."""
+    with ParallelDES(key, workers, chunk_size, min_parallel_size) as engine:
+        return engine.decrypt(iv, ciphertext, mode)
@@ -0,0 +1,127 @@
+"""
+Manuel DES için Akış (Stream) Tabanlı Şifreleme
+
+Veri, okuyucudan (read(n) metodu olan her nesne: dosya, socket.makefile,
+BytesIO...) sabit boyutlu parçalar halinde okunur, mod katmanıyla işlenir
+ve yazıcıya ham byte olarak yazılır. Bellek kullanımı veri boyutundan
+bağımsızdır; PKCS7 padding (ECB/CBC) sadece son parçaya uygulanır.
+
+Çıktı biçimi: ECB dışındaki modlarda önce 8 byte IV/nonce, ardından
+şifreli veri yazılır.
+"""
+
+import os
+
+from .manual_des import pkcs7_pad, pkcs7_unpad
+from .modes import (
+    BLOCK_SIZE, PADDED_MODES, DESBlockCipher, check_mode, mode_transform
+)
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+
+def _read_full(reader, size):
+    """Okuyucudan tam size byte (dosya sonunda daha az) okur."""
+    data = reader.read(size)
+    if not data or len(data) == size:
+        return data
+    parts = [data]
+    remaining = size - len(data)
+    while remaining > 0:
+        part = reader.read(remaining)
+        if not part:
+            break
+        parts.append(part)
+        remaining -= len(part)
+    return b''.join(parts)
+
+def _check_chunk_size(chunk_size):
+    if chunk_size < BLOCK_SIZE or chunk_size % BLOCK_SIZE:
+        raise ValueError("Parça boyutu 8'in pozitif katı olmalıdır!")
+
+def encrypt_stream(reader, writer, key, mode='CBC', iv=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Okuyucudaki veriyi parça parça şifreleyip yazıcıya yazar.
+
+    Args:
+        reader: read(n) metodu olan ikili (binary) kaynak
+        writer: write(b) metodu olan ikili hedef
+        key: Anahtar (str veya bytes)
+        mode: 'ECB', 'CBC', 'CTR', 'CFB' veya 'OFB'
+        iv: 8 byte IV/nonce (None ise rastgele oluşturulur)
+        chunk_size: Okuma parçası boyutu (8'in katı)
+
+    Returns:
+        Yazılan toplam byte sayısı (IV dahil)
+    """
+    mode = check_mode(mode)
+    _check_chunk_size(chunk_size)
+    cipher = DESBlockCipher(key)
+
+    written = 0
+    state = None
+    if mode != 'ECB':
+        if iv is None:
+            iv = os.urandom(BLOCK_SIZE)
+        elif len(iv) != BLOCK_SIZE:
+            raise ValueError("IV/nonce 8 byte olmalıdır!")
+        writer.write(iv)
+        written += BLOCK_SIZE
+        state = int.from_bytes(iv, 'big')
+
+    # Son parçayı tanımak için bir parça önden okunur
+    chunk = _read_full(reader, chunk_size)
+    while True:
+        next_chunk = _read_full(reader, chunk_size) if len(chunk) == chunk_size else b''
+        is_last = not next_chunk
+        if is_last and mode in PADDED_MODES:
+            chunk = pkcs7_pad(chunk)
+
+        if chunk:
+            output, state = mode_transform(cipher, chunk, mode, state)
+            writer.write(output)
+            written += len(output)
+        if is_last:
+            return written
+        chunk = next_chunk
+
+def decrypt_stream(reader, writer, key, mode='CBC', chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    encrypt_stream çıktısını parça parça çözüp yazıcıya yazar.
+
+    Returns:
+        Yazılan toplam byte sayısı
+
+    Raises:
+        ValueError: IV eksikse, uzunluk veya padding geçersizse
+    """
+    mode = check_mode(mode)
+    _check_chunk_size(chunk_size)
+    cipher = DESBlockCipher(key)
+
+    state = None
+    if mode != 'ECB':
+        iv = _read_full(reader, BLOCK_SIZE)
+        if len(iv) != BLOCK_SIZE:
+            raise ValueError("Akışta IV/nonce bulunamadı!")
+        state = int.from_bytes(iv, 'big')
+
+    written = 0
+    chunk = _read_full(reader, chunk_size)
+    if mode in PADDED_MODES and not chunk:
+        raise ValueError("Şifreli veri uzunluğu 8'in katı olmalıdır!")
+    while True:
+        next_chunk = _read_full(reader, chunk_size) if len(chunk) == chunk_size else b''
+        is_last = not next_chunk
+        if mode in PADDED_MODES and len(chunk) % BLOCK_SIZE:
+            raise ValueError("Şifreli veri uzunluğu 8'in katı olmalıdır!")
+
+        if chunk:
+            output, state = mode_transform(cipher, chunk, mode, state, decrypt=True)
+            if is_last and mode in PADDED_MODES:
+                output = pkcs7_unpad(bytes(output))
+            writer.write(output)
+            written += len(output)
+        if is_last:
+            return written
+        chunk = next_chunk
@@ -11,7 +11,36 @@ project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
+import io
+import random
+import tracemalloc
+
+import numpy as np
+from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+from cryptography.hazmat.primitives import padding
+from cryptography.hazmat.backends import default_backend
+
 from manual_des import manual_des_encrypt, manual_des_decrypt
+from manual_des.manual_des import (
+    generate_round_keys, des_block_encrypt, des_block_encrypt_int,
+    round_keys_to_int, str_to_bit_array, bit_array_to_bytes,
+    KeyScheduleCache, encrypt_bytes, decrypt_bytes, padded_length
+)
+from manual_des.bitslice_des import (
+    manual_des_encrypt_blocks, manual_des_decrypt_blocks,
+    blocks_to_planes, planes_to_blocks
+)
+from manual_des.modes import (
+    MODES, des_encrypt_mode, des_decrypt_mode, des_ctr_decrypt_range
+)
+from manual_des.parallel import ParallelDES
+from manual_des.triple_des import triple_des_encrypt_mode, triple_des_decrypt_mode
+from manual_des.stream import encrypt_stream, decrypt_stream
+from manual_des.brute_force import SuffixKeyspace, CharsetKeyspace, brute_force
+from manual_des.mitm import MeetInTheMiddleTable, double_des_encrypt_block, meet_in_the_middle
+from manual_des.numpy_des import (
+    manual_des_encrypt_array, manual_des_decrypt_array, des_ctr_array
+)
 
 
 def test_manual_des():
@@ -48,6 +77,303 @@ def test_manual_des():
     print("="*60)
 
 
+def test_int_engine_matches_bit_engine():
+    """Tamsayı motorunun bit listesi motoruyla aynı çıktıyı verdiğini doğrular."""
+    rng = random.Random(2024)
+    for _ in range(50):
+        key = ''.join(rng.choice('abcdefXYZ0123456789') for _ in range(8))
+        block = bytes(rng.randrange(256) for _ in range(8))
+        round_keys = generate_round_keys(key)
+
+        expected = bit_array_to_bytes(des_block_encrypt(str_to_bit_array(block), round_keys))
+        subkeys = round_keys_to_int(round_keys)
+        actual = des_block_encrypt_int(int.from_bytes(block, 'big'), subkeys)
+        assert actual.to_bytes(8, 'big') == expected
+
+        # Ters sıradaki anahtarlar bloğu geri çözmeli
+        assert des_block_encrypt_int(actual, subkeys[::-1]) == int.from_bytes(block, 'big')
+
+    metin = "Kriptoloji Final Sunumu"
+    assert manual_des_decrypt(manual_des_encrypt(metin, "MyKey123"), "MyKey123") == metin
+
+
+def test_bitslice_matches_block_encrypt():
+    """Bitsliced toplu şifrelemeyi des_block_encrypt ile karşılaştırır."""
+    rng = random.Random(7)
+    key = "BitSlice"
+    round_keys = generate_round_keys(key)
+    # Şerit sayısının katı olmayan blok sayısı: son geçiş doldurulur
+    blocks = [bytes(rng.randrange(256) for _ in range(8)) for _ in range(70)]
+
+    expected = [bit_array_to_bytes(des_block_encrypt(str_to_bit_array(b), round_keys))
+                for b in blocks]
+    encrypted = manual_des_encrypt_blocks(blocks, key, lanes=64)
+    assert encrypted == expected
+    assert manual_des_decrypt_blocks(encrypted, key, lanes=64) == blocks
+
+    data = b''.join(blocks[:64])
+    assert planes_to_blocks(blocks_to_planes(data, 64), 64) == data
+
+
+def test_numpy_engine_matches_block_encrypt():
+    """NumPy motorunu des_block_encrypt ile karşılaştırır."""
+    rng = random.Random(11)
+    key = "NumPyKey"
+    round_keys = generate_round_keys(key)
+    data = bytes(rng.randrange(256) for _ in range(8 * 40))
+    blocks = np.frombuffer(data, dtype=np.uint8).reshape(-1, 8)
+
+    expected = b''.join(
+        bit_array_to_bytes(des_block_encrypt(str_to_bit_array(data[i:i+8]), round_keys))
+        for i in range(0, len(data), 8)
+    )
+    encrypted = manual_des_encrypt_array(blocks, key)
+    assert encrypted.tobytes() == expected
+    assert manual_des_decrypt_array(encrypted, key).tobytes() == data
+
+    # CTR: sayaç 2^64 sınırında başa sarar, şifreleme ve çözme aynı işlemdir
+    ciphertext = des_ctr_array(data[:21], round_keys, 2**64 - 1)
+    assert des_ctr_array(ciphertext, round_keys, 2**64 - 1) == data[:21]
+
+
+def test_key_schedule_cache_lru():
+    """LRU önbelleğinin hit/miss sayaçlarını ve tahliye sırasını doğrular."""
+    cache = KeyScheduleCache(maxsize=2)
+    first = cache.get("anahtar1")
+    assert cache.get("anahtar1") is first
+    cache.get("anahtar2")
+    cache.get("anahtar1")       # anahtar1 en son kullanılan olur
+    cache.get("anahtar3")       # anahtar2 atılır
+    assert cache.info() == {'hits': 2, 'misses': 3, 'size': 2, 'maxsize': 2}
+
+    cache.get("anahtar2")
+    assert cache.info()['misses'] == 4
+
+    schedule = cache.get("anahtar3")
+    assert list(schedule.subkeys) == round_keys_to_int(generate_round_keys("anahtar3"))
+    assert schedule.decrypt_subkeys == schedule.subkeys[::-1]
+
+    cache.invalidate("anahtar3")
+    assert cache.info()['size'] == 1
+    cache.get(bytearray(b'anahtar4'))
+    cache.invalidate(bytearray(b'anahtar4'))
+    assert cache.info()['size'] == 1
+    cache.invalidate()
+    assert cache.info()['size'] == 0
+
+
+def _reference_des(key, mode, iv, data):
+    """cryptography TripleDES ile referans şifreleme yapar (8 byte anahtarda K1=K2=K3)."""
+    algorithm = algorithms.TripleDES(key * 3 if len(key) == 8 else key)
+    if mode == 'CTR':
+        # cryptography 3DES için CTR sunmaz; sayaç blokları ECB ile şifrelenir
+        counter = int.from_bytes(iv, 'big')
+        counters = b''.join(((counter + i) % 2**64).to_bytes(8, 'big')
+                            for i in range((len(data) + 7) // 8))
+        encryptor = Cipher(algorithm, modes.ECB(), backend=default_backend()).encryptor()
+        keystream = encryptor.update(counters) + encryptor.finalize()
+        return bytes(a ^ b for a, b in zip(data, keystream))
+
+    if mode in ('ECB', 'CBC'):
+        padder = padding.PKCS7(64).padder()
+        data = padder.update(data) + padder.finalize()
+    cipher_mode = {'ECB': modes.ECB(), 'CBC': modes.CBC(iv),
+                   'CFB': modes.CFB(iv), 'OFB': modes.OFB(iv)}[mode]
+    encryptor = Cipher(algorithm, cipher_mode, backend=default_backend()).encryptor()
+    return encryptor.update(data) + encryptor.finalize()
+
+
+def test_modes_match_cryptography():
+    """Mod katmanını cryptography TripleDES (K1=K2=K3) ile karşılaştırır."""
+    # Standart DES test vektörü
+    _, ciphertext = des_encrypt_mode(bytes.fromhex("0123456789ABCDEF"),
+                                     bytes.fromhex("133457799BBCDFF1"), 'ECB')
+    assert ciphertext[:8].hex().upper() == "85E813540F0AB405"
+
+    rng = random.Random(5)
+    key = bytes(rng.randrange(256) for _ in range(8))
+    iv = bytes(rng.randrange(256) for _ in range(8))
+    for length in (0, 5, 8, 13, 64):
+        plaintext = bytes(rng.randrange(256) for _ in range(length))
+        for mode in MODES:
+            _, ciphertext = des_encrypt_mode(plaintext, key, mode, iv)
+            assert ciphertext == _reference_des(key, mode, iv, plaintext), mode
+            assert des_decrypt_mode(iv, ciphertext, key, mode) == plaintext
+
+
+def test_ctr_random_access():
+    """CTR dilimlerinin baştan işlemeden çözülebildiğini doğrular."""
+    plaintext = bytes(range(200))
+    nonce = b'\xff' * 7 + b'\xfe'    # sayaç ilk bloklarda başa sarar
+    _, ciphertext = des_encrypt_mode(plaintext, "CtrKey", 'CTR', nonce)
+    assert des_ctr_decrypt_range(ciphertext[24:83], "CtrKey", nonce, 3) == plaintext[24:83]
+
+
+def test_parallel_matches_serial_modes():
+    """Paralel ECB/CTR/CBC çıktılarının seri mod katmanıyla aynı olduğunu doğrular."""
+    rng = random.Random(3)
+    key = "Paralel1"
+    iv = bytes(rng.randrange(256) for _ in range(8))
+    plaintext = bytes(rng.randrange(256) for _ in range(1003))
+
+    # Küçük parça ve sıfır eşik: havuz gerçekten kullanılır
+    with ParallelDES(key, workers=2, chunk_size=128, min_parallel_size=0) as engine:
+        for mode in ('ECB', 'CTR'):
+            used_iv, ciphertext = engine.encrypt(plaintext, mode, iv if mode == 'CTR' else None)
+            assert ciphertext == des_encrypt_mode(plaintext, key, mode, iv)[1]
+            assert engine.decrypt(used_iv, ciphertext, mode) == plaintext
+
+        _, ciphertext = des_encrypt_mode(plaintext, key, 'CBC', iv)
+        assert engine.decrypt(iv, ciphertext, 'CBC') == plaintext
+
+
+def test_stream_matches_modes():
+    """Akış API'sinin parça sınırlarından bağımsız olarak mod katmanıyla aynı çıktıyı verdiğini doğrular."""
+    rng = random.Random(9)
+    iv = bytes(rng.randrange(256) for _ in range(8))
+    for length in (0, 16, 37):
+        plaintext = bytes(rng.randrange(256) for _ in range(length))
+        for mode in MODES:
+            output = io.BytesIO()
+            encrypt_stream(io.BytesIO(plaintext), output, "Akis", mode,
+                           iv if mode != 'ECB' else None, chunk_size=16)
+            expected = des_encrypt_mode(plaintext, "Akis", mode, iv)[1]
+            assert output.getvalue() == (iv if mode != 'ECB' else b'') + expected
+
+            restored = io.BytesIO()
+            decrypt_stream(io.BytesIO(output.getvalue()), restored, "Akis", mode, chunk_size=16)
+            assert restored.getvalue() == plaintext
+
+
+def test_bytes_api_with_buffers():
+    """encrypt_bytes/decrypt_bytes'in tampon nesneleri ve çıktı tamponlarıyla çalıştığını doğrular."""
+    data = bytes(range(29))
+    expected = encrypt_bytes(data, "Tampon")
+    # out verilmezse yeni tampon ek kopya yapılmadan döndürülür
+    assert isinstance(expected, bytearray) and decrypt_bytes(expected, "Tampon") == data
+    assert manual_des_encrypt("Kripto", "Tampon") == encrypt_bytes(b"Kripto", "Tampon").hex().upper()
+
+    out = bytearray(padded_length(len(data)))
+    assert encrypt_bytes(memoryview(bytearray(data)), "Tampon", out) == len(out)
+    assert bytes(out) == expected
+
+    restored = bytearray(len(data))
+    assert decrypt_bytes(memoryview(out), "Tampon", restored) == len(data)
+    assert bytes(restored) == data
+
+    for bad in (b'', b'1234567', expected[:-8] + bytes(8)):
+        try:
+            decrypt_bytes(bad, "Tampon")
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("Geçersiz şifreli veri kabul edildi")
+
+
+def test_triple_des_matches_cryptography():
+    """2 ve 3 anahtarlı manuel 3DES'i cryptography TripleDES ile karşılaştırır."""
+    rng = random.Random(13)
+    iv = bytes(rng.randrange(256) for _ in range(8))
+    plaintext = bytes(rng.randrange(256) for _ in range(45))
+    for key_len in (8, 16, 24):
+        key = bytes(rng.randrange(256) for _ in range(key_len))
+        for mode in MODES:
+            _, ciphertext = triple_des_encrypt_mode(plaintext, key, mode, iv)
+            assert ciphertext == _reference_des(key, mode, iv, plaintext), (key_len, mode)
+            assert triple_des_decrypt_mode(iv, ciphertext, key, mode) == plaintext
+
+
+def test_brute_force_keyspaces(tmp_path):
+    """Artımlı round key'leri ve küçük uzaylarda anahtar aramasını doğrular."""
+    suffix = SuffixKeyspace(b"\x13\x34\x57\x79\x9b\xbc\xdf\xf1", 10)
+    for key_id, subkeys in suffix.walk(100, 300):
+        assert subkeys == round_keys_to_int(generate_round_keys(suffix.key_at(key_id)))
+    charset = CharsetKeyspace("Ke", 2, "abcxyz")
+    walked = [key_id for key_id, _ in charset.walk(0, charset.size)]
+    assert walked == list(range(charset.size))
+    for key_id, subkeys in charset.walk(5, 20):
+        assert subkeys == round_keys_to_int(generate_round_keys(charset.key_at(key_id)))
+
+    plaintext = "Kriptoloji Final Sunumu"
+    secret = suffix.key_at(700)
+    ciphertext = manual_des_encrypt(plaintext, secret)
+    checkpoint = str(tmp_path / "checkpoint.json")
+    result = brute_force(plaintext, ciphertext, suffix, workers=1, unit_size=128,
+                         checkpoint_path=checkpoint, stop_on_first=False, verbose=False)
+    assert result['completed'] and result['tested'] == suffix.size
+    # Parite biti farklı eşdeğer anahtarlar da bulunur
+    assert secret in result['keys']
+    assert all(manual_des_decrypt(ciphertext, k) == plaintext for k in result['keys'])
+
+    # Tamamlanmış checkpoint'ten devam edildiğinde yeniden tarama yapılmaz
+    resumed = brute_force(plaintext, ciphertext, suffix, workers=1, unit_size=128,
+                          checkpoint_path=checkpoint, stop_on_first=False, verbose=False)
+    assert resumed['keys'] == result['keys'] and resumed['tested'] == suffix.size
+
+    # Tam 56 bitlik uzayda iş birimleri tembel üretilir; arama hemen başlar
+    full = SuffixKeyspace(b"\x13\x34\x57\x79\x9b\xbc\xdf\xf1", 56)
+    ciphertext = manual_des_encrypt(plaintext, full.key_at(300))
+    for workers in (1, 2):
+        result = brute_force(plaintext, ciphertext, full, workers=workers, unit_size=128)
+        assert full.key_at(300) in result['keys'] and not result['completed']
+
+    ciphertext = manual_des_encrypt(plaintext, "Keyz")
+    # Karakter kümesinde parite biti dışında aynı olan karakter çifti yok
+    result = brute_force(plaintext, ciphertext, CharsetKeyspace("Ke", 2, "adkwyz"),
+                         workers=2, unit_size=8, verbose=False)
+    assert result['keys'] == ["Keyz"]
+
+
+def test_meet_in_the_middle_double_des(tmp_path):
+    """2DES anahtar çiftini RAM ve memmap tablolarıyla bulur."""
+    keyspace = SuffixKeyspace(b"MyKey123", 12)
+    key1, key2 = keyspace.key_at(1234), keyspace.key_at(4000)
+    pairs = [(p, double_des_encrypt_block(p, key1, key2)) for p in (b"Kriptolo", b"ji Final")]
+    result = meet_in_the_middle(pairs, keyspace, batch_size=1000, verbose=False)
+    assert result['pairs'] == [(key1, key2)]
+    assert result['table_bytes'] == keyspace.size * 12
+    result = meet_in_the_middle(pairs, keyspace, table_path=str(tmp_path / "table"), verbose=False)
+    assert result['pairs'] == [(key1, key2)]
+
+
+def test_mitm_table_memory_bound(tmp_path):
+    """Tablo yerinde sıralanmalı; memmap modunda parçalı birleştirme RAM'i tablo boyutundan bağımsız tutmalı."""
+    keyspace = SuffixKeyspace(b"MyKey123", 17)
+    block = b"Kriptolo"
+    tracemalloc.start()
+    try:
+        ram = MeetInTheMiddleTable(keyspace, block, batch_size=1024)
+        ram_peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.reset_peak()
+        baseline = tracemalloc.get_traced_memory()[0]   # RAM tablosu hâlâ bellekte
+        disk = MeetInTheMiddleTable(keyspace, block, path=str(tmp_path / "table"),
+                                    batch_size=1024, run_size=1 << 12)
+        disk_peak = tracemalloc.get_traced_memory()[1] - baseline
+    finally:
+        tracemalloc.stop()
+    assert ram.nbytes == disk.nbytes == keyspace.size * 12
+    # Grup başına şifreleme çalışma alanı için anahtar başına 512 byte pay
+    batch_allowance = 1024 * 512
+    assert ram.peak_bytes == ram.nbytes and ram_peak < ram.nbytes + batch_allowance
+    assert disk.peak_bytes <= 2 * (1 << 12) * 12 and disk_peak < disk.peak_bytes + batch_allowance
+    assert not os.path.exists(str(tmp_path / "table.runs"))
+    assert np.array_equal(ram.table, disk.table)
+    assert bool(np.all(ram.table[1:] >= ram.table[:-1]))
+
+    middle = np.array([0, 1 << 63], dtype=np.uint64)
+    rows = ram._rows[[0, 5, 5]]
+    middle = np.concatenate([middle, rows[:, :8].copy().view('>u8').ravel().astype(np.uint64)])
+    query, key_ids = disk.lookup(middle)
+    expected = rows[:, 8:].copy().view('>u4').ravel()
+    assert set(zip(query.tolist(), key_ids.tolist())) >= {(2, int(expected[0])), (3, int(expected[1]))}
+
+    # "x"/"y" parite eşdeğeri: tabloda aynı ara değerli kayıtlar birlikte döner
+    charset = CharsetKeyspace("Ke", 2, "axyz")
+    pairs = [(p, double_des_encrypt_block(p, "Keyz", "Keaa")) for p in (b"Kriptolo", b"ji Final")]
+    result = meet_in_the_middle(pairs, charset, verbose=False)
+    assert sorted(result['pairs']) == [("Kexz", "Keaa"), ("Keyz", "Keaa")]
+
+
 if __name__ == "__main__":
     test_manual_des()
 
@@ -0,0 +1,96 @@
+"""
+Manuel Triple DES (3DES-EDE)
+
+C = E_K3(D_K2(E_K1(P))). Üç aşamanın round key'leri paylaşılan LRU
+önbellekten alınır. Aşamalar arasındaki FP ve IP permütasyonları birbirini
+götürdüğü için atlanır: bir aşamanın (R16, L16) çıktısı doğrudan sonraki
+aşamanın (L0, R0) girdisi olur. Böylece blok başına sadece bir IP ve bir FP
+çalışır.
+
+Anahtar seçenekleri (cryptography TripleDES ile aynı):
+    8 byte  -> K1 = K2 = K3 (tek DES ile eşdeğer)
+    16 byte -> 2 anahtarlı: K1, K2, K3 = K1
+    24 byte -> 3 anahtarlı: K1, K2, K3
+"""
+
+from .manual_des import (
+    _IP_BYTE_TABLES, _FP_BYTE_TABLES, _permute64, _feistel_int, get_key_schedule
+)
+from .modes import encrypt_mode, decrypt_mode
+
+
+def split_triple_des_key(key):
+    """
+    3DES anahtarını (K1, K2, K3) parçalarına ayırır.
+
+    Args:
+        key: 8, 16 veya 24 byte anahtar (str ise UTF-8 olarak kodlanır)
+
+    Returns:
+        (k1, k2, k3) bytes tuple'ı
+    """
+    if isinstance(key, str):
+        key = key.encode('utf-8')
+    key = bytes(key)
+    if len(key) == 8:
+        return key, key, key
+    if len(key) == 16:
+        return key[:8], key[8:], key[:8]
+    if len(key) == 24:
+        return key[:8], key[8:16], key[16:]
+    raise ValueError("3DES anahtarı 8, 16 veya 24 byte olmalıdır!")
+
+def triple_des_block_int(block, keys1, keys2, keys3):
+    """
+    64 bitlik bloğu üç Feistel aşamasından tek IP/FP ile geçirir.
+
+    Args:
+        block: 64 bitlik blok (int)
+        keys1, keys2, keys3: Aşamaların round key'leri (round_keys_to_int
+                             biçiminde, her aşama için uygun sırada)
+
+    Returns:
+        64 bitlik sonuç (int)
+    """
+    block = _permute64(block, _IP_BYTE_TABLES)
+    left, right = _feistel_int(block >> 32, block & 0xFFFFFFFF, keys1)
+    # FP + IP birbirini götürür; sadece yarılar yer değiştirir
+    left, right = _feistel_int(right, left, keys2)
+    left, right = _feistel_int(right, left, keys3)
+    return _permute64((right << 32) | left, _FP_BYTE_TABLES)
+
+
+class TripleDESBlockCipher:
+    """3DES-EDE blok fonksiyonları (mod katmanı ile kullanılır)."""
+
+    def __init__(self, key):
+        k1, k2, k3 = (get_key_schedule(k) for k in split_triple_des_key(key))
+        # Şifreleme: E_K1, D_K2, E_K3 / Çözme: D_K3, E_K2, D_K1
+        self._encrypt_keys = (k1.subkeys, k2.decrypt_subkeys, k3.subkeys)
+        self._decrypt_keys = (k3.decrypt_subkeys, k2.subkeys, k1.decrypt_subkeys)
+
+    def encrypt_block(self, block):
+        return triple_des_block_int(block, *self._encrypt_keys)
+
+    def decrypt_block(self, block):
+        return triple_des_block_int(block, *self._decrypt_keys)
+
+
+def triple_des_encrypt_mode(plaintext, key, mode='CBC', iv=None):
+    """
+    Manuel 3DES-EDE ile veriyi seçilen modda şifreler.
+
+    Args:
+        plaintext: Şifrelenecek veri (bytes)
+        key: 8, 16 veya 24 byte anahtar
+        mode: 'ECB', 'CBC', 'CTR', 'CFB' veya 'OFB'
+        iv: 8 byte IV/nonce (None ise rastgele oluşturulur)
+
+    Returns:
+        (iv, ciphertext) tuple'ı
+    """
+    return encrypt_mode(TripleDESBlockCipher(key), plaintext, mode, iv)
+
+def triple_des_decrypt_mode(iv, ciphertext, key, mode='CBC'):
+    """Manuel 3DES-EDE ile seçilen modda şifrelenmiş veriyi çözer."""
+    return decrypt_mode(TripleDESBlockCipher(key), iv, ciphertext, mode)
@@ -2,7 +2,28 @@
 Modern Kriptografi Algoritmaları
 """
 
-from .aes_des import aes_encrypt, aes_decrypt, des_encrypt, des_decrypt
+from .aes_des import (
+    aes_encrypt, aes_decrypt, des_encrypt, des_decrypt, AESContext, DESContext,
+    aes_encrypt_many, aes_decrypt_many
+)
+from .aead import (
+    AEADContext, aead_encrypt, aead_decrypt, aead_encrypt_stream, aead_decrypt_stream,
+    generate_aead_key
+)
+from .file_crypto import (
+    encrypt_file, decrypt_file, aes_encrypt_file, aes_decrypt_file,
+    des_encrypt_file, des_decrypt_file
+)
+from .segmented import (
+    SegmentedCipher, segmented_encrypt, segmented_decrypt, segmented_decrypt_segment
+)
 
-__all__ = ['aes_encrypt', 'aes_decrypt', 'des_encrypt', 'des_decrypt']
+__all__ = ['aes_encrypt', 'aes_decrypt', 'des_encrypt', 'des_decrypt',
+           'AESContext', 'DESContext', 'aes_encrypt_many', 'aes_decrypt_many',
+           'AEADContext', 'aead_encrypt', 'aead_decrypt',
+           'aead_encrypt_stream', 'aead_decrypt_stream', 'generate_aead_key',
+           'encrypt_file', 'decrypt_file', 'aes_encrypt_file', 'aes_decrypt_file',
+           'des_encrypt_file', 'des_decrypt_file',
+           'SegmentedCipher', 'segmented_encrypt', 'segmented_decrypt',
+           'segmented_decrypt_segment']
 
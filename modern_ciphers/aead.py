@@ -0,0 +1,265 @@
+"""
+Kimlik Doğrulamalı Şifreleme (AEAD): AES-GCM ve ChaCha20-Poly1305
+Kütüphane kullanarak implementasyon
+
+CBC'den farklı olarak padding gerekmez ve şifreli veri bir etiket (tag) ile
+korunur: veri veya ek doğrulanmış veri (associated data) değiştirilmişse
+çözme ValueError ile reddedilir.
+
+Desteklenen algoritmalar:
+    'AES-128-GCM'        16 byte anahtar, 12 byte nonce
+    'AES-256-GCM'        32 byte anahtar, 12 byte nonce
+    'CHACHA20-POLY1305'  32 byte anahtar, 12 byte nonce
+
+Akış (stream) biçimi (tüm algoritmalar):
+    nonce öneki (7) || [şifreli parça || tag (16)] ...
+    Veri parçalara bölünür ve her parça ayrı bir tag ile mühürlenir. Parça
+    nonce'u = önek || sayaç (4) || son parça bayrağı (1); her parça yazıcıya
+    yazılmadan önce doğrulanır, böylece çözmede doğrulanmamış veri asla
+    dışarı verilmez. Sıra değiştirme ve kesme (truncation) tespit edilir.
+"""
+
+import os
+import threading
+
+from cryptography.exceptions import InvalidTag
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM, ChaCha20Poly1305
+
+NONCE_SIZE = 12
+TAG_SIZE = 16
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+# algoritma -> (anahtar boyutu, AEAD sınıfı)
+AEAD_ALGORITHMS = {
+    'AES-128-GCM': (16, AESGCM),
+    'AES-256-GCM': (32, AESGCM),
+    'CHACHA20-POLY1305': (32, ChaCha20Poly1305),
+}
+
+_STREAM_PREFIX_SIZE = 7
+_MAX_STREAM_CHUNKS = 1 << 32
+
+
+def check_algorithm(algorithm):
+    """Algoritma adını doğrular ve büyük harfe çevirir."""
+    algorithm = algorithm.upper()
+    if algorithm not in AEAD_ALGORITHMS:
+        raise ValueError(f"Algoritma {', '.join(AEAD_ALGORITHMS)} değerlerinden biri olmalıdır!")
+    return algorithm
+
+def _check_key(key, algorithm):
+    key = bytes(key)
+    key_size = AEAD_ALGORITHMS[algorithm][0]
+    if len(key) != key_size:
+        raise ValueError(f"{algorithm} anahtarı {key_size} byte olmalıdır!")
+    return key
+
+def generate_aead_key(algorithm='AES-128-GCM'):
+    """Seçilen algoritma için rastgele anahtar üretir."""
+    return os.urandom(AEAD_ALGORITHMS[check_algorithm(algorithm)][0])
+
+
+# --- 1. TEK SEFERLİK ŞİFRELEME ---
+
+class AEADContext:
+    """
+    Bir kez anahtarlanan AEAD bağlamı.
+
+    Kullanım:
+        ctx = AEADContext(key, 'CHACHA20-POLY1305')
+        nonce, ciphertext = ctx.encrypt(b"mesaj", associated_data=b"başlık")
+        plaintext = ctx.decrypt(nonce, ciphertext, associated_data=b"başlık")
+    """
+
+    def __init__(self, key, algorithm='AES-128-GCM'):
+        self.algorithm = check_algorithm(algorithm)
+        self.key = _check_key(key, self.algorithm)
+        self._aead = AEAD_ALGORITHMS[self.algorithm][1](self.key)
+
+    def encrypt(self, plaintext, associated_data=None, nonce=None):
+        """
+        Veriyi şifreler.
+
+        Args:
+            plaintext: Şifrelenecek veri (buffer protocol)
+            associated_data: Şifrelenmeyen ama doğrulanan ek veri
+            nonce: 12 byte nonce (None ise rastgele oluşturulur; aynı anahtarla
+                   asla tekrar kullanılmamalıdır)
+
+        Returns:
+            (nonce, ciphertext) tuple'ı; tag ciphertext'in son 16 byte'ıdır
+        """
+        if nonce is None:
+            nonce = os.urandom(NONCE_SIZE)
+        elif len(nonce) != NONCE_SIZE:
+            raise ValueError("Nonce 12 byte olmalıdır!")
+        return nonce, self._aead.encrypt(nonce, bytes(plaintext), associated_data)
+
+    def decrypt(self, nonce, ciphertext, associated_data=None):
+        """
+        Şifreli veriyi doğrular ve çözer.
+
+        Raises:
+            ValueError: Nonce geçersizse veya veri/ek veri doğrulanamazsa
+        """
+        if len(nonce) != NONCE_SIZE:
+            raise ValueError("Nonce 12 byte olmalıdır!")
+        try:
+            return self._aead.decrypt(nonce, bytes(ciphertext), associated_data)
+        except InvalidTag:
+            raise ValueError("Kimlik doğrulama başarısız: veri değiştirilmiş veya anahtar yanlış!") from None
+
+
+_contexts = {}
+_contexts_lock = threading.Lock()
+
+def _get_context(key, algorithm):
+    """Son kullanılan anahtarların bağlamlarını yeniden kullanır."""
+    algorithm = check_algorithm(algorithm)
+    cache_key = (algorithm, bytes(key))
+    with _contexts_lock:
+        ctx = _contexts.get(cache_key)
+    if ctx is None:
+        ctx = AEADContext(key, algorithm)
+        with _contexts_lock:
+            if len(_contexts) >= 128:
+                _contexts.pop(next(iter(_contexts)))
+            _contexts[cache_key] = ctx
+    return ctx
+
+def aead_encrypt(plaintext, key, algorithm='AES-128-GCM', associated_data=None):
+    """
+    Veriyi AEAD ile şifreler.
+
+    Args:
+        plaintext: Şifrelenecek veri (bytes veya str; str ise UTF-8)
+        key: Algoritmaya uygun boyutta anahtar
+        algorithm: 'AES-128-GCM', 'AES-256-GCM' veya 'CHACHA20-POLY1305'
+        associated_data: Şifrelenmeyen ama doğrulanan ek veri
+
+    Returns:
+        (nonce, ciphertext) tuple'ı
+    """
+    if isinstance(plaintext, str):
+        plaintext = plaintext.encode('utf-8')
+    return _get_context(key, algorithm).encrypt(plaintext, associated_data)
+
+def aead_decrypt(nonce, ciphertext, key, algorithm='AES-128-GCM', associated_data=None):
+    """
+    aead_encrypt çıktısını doğrular ve çözer.
+
+    Returns:
+        Çözülmüş veri (bytes)
+
+    Raises:
+        ValueError: Veri veya ek veri doğrulanamazsa
+    """
+    return _get_context(key, algorithm).decrypt(nonce, ciphertext, associated_data)
+
+
+# --- 2. AKIŞ (STREAM) ŞİFRELEME ---
+
+def _read_full(reader, size):
+    """Okuyucudan tam size byte (dosya sonunda daha az) okur."""
+    data = reader.read(size)
+    if not data or len(data) == size:
+        return data
+    parts = [data]
+    remaining = size - len(data)
+    while remaining > 0:
+        part = reader.read(remaining)
+        if not part:
+            break
+        parts.append(part)
+        remaining -= len(part)
+    return b''.join(parts)
+
+def _chunk_nonce(prefix, index, is_last):
+    if index >= _MAX_STREAM_CHUNKS:
+        raise ValueError("Akış çok uzun: parça sayısı sınırı aşıldı!")
+    return prefix + index.to_bytes(4, 'big') + (b'\x01' if is_last else b'\x00')
+
+def _chunked_encrypt_stream(aead, reader, writer, associated_data, chunk_size):
+    prefix = os.urandom(_STREAM_PREFIX_SIZE)
+    writer.write(prefix)
+    written = _STREAM_PREFIX_SIZE
+
+    # Son parçayı tanımak için bir parça önden okunur
+    index = 0
+    chunk = _read_full(reader, chunk_size)
+    while True:
+        next_chunk = _read_full(reader, chunk_size) if len(chunk) == chunk_size else b''
+        is_last = not next_chunk
+        output = aead.encrypt(_chunk_nonce(prefix, index, is_last), chunk, associated_data)
+        writer.write(output)
+        written += len(output)
+        if is_last:
+            return written
+        chunk = next_chunk
+        index += 1
+
+def _chunked_decrypt_stream(aead, reader, writer, associated_data, chunk_size):
+    prefix = _read_full(reader, _STREAM_PREFIX_SIZE)
+    if len(prefix) != _STREAM_PREFIX_SIZE:
+        raise ValueError("Akışta nonce öneki bulunamadı!")
+
+    sealed_size = chunk_size + TAG_SIZE
+    index = 0
+    written = 0
+    chunk = _read_full(reader, sealed_size)
+    while True:
+        next_chunk = _read_full(reader, sealed_size) if len(chunk) == sealed_size else b''
+        is_last = not next_chunk
+        try:
+            output = aead.decrypt(_chunk_nonce(prefix, index, is_last), chunk, associated_data)
+        except InvalidTag:
+            raise ValueError("Kimlik doğrulama başarısız: parça değiştirilmiş, "
+                             "eksik veya anahtar yanlış!") from None
+        writer.write(output)
+        written += len(output)
+        if is_last:
+            return written
+        chunk = next_chunk
+        index += 1
+
+def aead_encrypt_stream(reader, writer, key, algorithm='AES-128-GCM',
+                        associated_data=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Okuyucudaki veriyi parça parça AEAD ile şifreleyip yazıcıya yazar.
+
+    Args:
+        reader: read(n) metodu olan ikili (binary) kaynak
+        writer: write(b) metodu olan ikili hedef
+        key: Algoritmaya uygun boyutta anahtar
+        algorithm: 'AES-128-GCM', 'AES-256-GCM' veya 'CHACHA20-POLY1305'
+        associated_data: Şifrelenmeyen ama doğrulanan ek veri
+        chunk_size: Parça boyutu (çözmede de aynısı verilmeli)
+
+    Returns:
+        Yazılan toplam byte sayısı
+    """
+    algorithm = check_algorithm(algorithm)
+    key = _check_key(key, algorithm)
+    if chunk_size < 1:
+        raise ValueError("Parça boyutu pozitif olmalıdır!")
+    aead = AEAD_ALGORITHMS[algorithm][1](key)
+    return _chunked_encrypt_stream(aead, reader, writer, associated_data, chunk_size)
+
+def aead_decrypt_stream(reader, writer, key, algorithm='AES-128-GCM',
+                        associated_data=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    aead_encrypt_stream çıktısını doğrulayıp çözer; yazıcıya sadece
+    doğrulanmış parçalar yazılır.
+
+    Returns:
+        Yazılan toplam byte sayısı
+
+    Raises:
+        ValueError: Akış eksikse veya doğrulanamazsa
+    """
+    algorithm = check_algorithm(algorithm)
+    key = _check_key(key, algorithm)
+    if chunk_size < 1:
+        raise ValueError("Parça boyutu pozitif olmalıdır!")
+    aead = AEAD_ALGORITHMS[algorithm][1](key)
+    return _chunked_decrypt_stream(aead, reader, writer, associated_data, chunk_size)
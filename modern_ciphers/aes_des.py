@@ -8,6 +8,8 @@ from cryptography.hazmat.primitives import padding
 from cryptography.hazmat.backends import default_backend
 import os
 import base64
+import threading
+from array import array
 
 
 def aes_encrypt(plaintext, key=None):
@@ -136,3 +138,262 @@ def des_decrypt(iv, ciphertext, key):
     
     return plaintext.decode('utf-8')
 
+
+# --- ANAHTARLI ŞİFRELEME BAĞLAMLARI (CBC + PKCS7) ---
+#
+# Yukarıdaki fonksiyonlar her çağrıda Cipher, backend ve padder nesnesi
+# oluşturur. Bağlamlar anahtar başına bir kez oluşturulan kalıcı bir CBC
+# encryptor/decryptor kullanır:
+#
+# - Şifreleme: mesajın önüne rastgele bir R bloğu eklenir. Zincirin o anki
+#   değeri X ile çıktı bloğu E(R XOR X) olur; R rastgele olduğu için bu blok
+#   tahmin edilemez ve mesajın IV'si olarak kullanılır. Kalan çıktı bu IV
+#   ile standart CBC şifreli metnidir (aes_decrypt/des_decrypt ile çözülür).
+# - Çözme: IV + şifreli metin kalıcı decryptor'a verilir; ilk çıktı bloğu
+#   atılır, sonrakiler D(C_i) XOR C_(i-1) olarak doğru düz metindir.
+
+def _normalize_key(key, key_size):
+    """Anahtarı aes_encrypt/des_encrypt ile aynı kurallarla key_size byte'a getirir."""
+    key = bytes(key)
+    if len(key) != key_size:
+        key = key[:key_size].ljust(key_size, b'0')
+    return key
+
+
+class _CBCContext:
+    """AESContext ve DESContext için ortak CBC/PKCS7 bağlamı."""
+
+    block_size = None
+    key_size = None
+
+    def __init__(self, key=None):
+        if key is None:
+            key = os.urandom(self.key_size)
+        key = _normalize_key(key, self.key_size)
+        self.key = key
+        algorithm = self._algorithm(key)
+        # Başlangıç IV'leri zincir durumunu belirler; çıktıyı etkilemez
+        self._encryptor = Cipher(algorithm, modes.CBC(os.urandom(self.block_size)),
+                                 backend=default_backend()).encryptor()
+        self._decryptor = Cipher(algorithm, modes.CBC(os.urandom(self.block_size)),
+                                 backend=default_backend()).decryptor()
+        self._lock = threading.Lock()
+
+    def _algorithm(self, key):
+        raise NotImplementedError
+
+    def _pad_block(self, tail):
+        pad = self.block_size - len(tail)
+        return bytes(tail) + bytes([pad]) * pad
+
+    def _unpad_length(self, last_block):
+        """Son düz metin bloğundaki padding'i doğrular, padding uzunluğunu döndürür."""
+        pad = last_block[-1]
+        if not 1 <= pad <= self.block_size or last_block[-pad:] != bytes([pad]) * pad:
+            raise ValueError("Geçersiz padding!")
+        return pad
+
+    def _check_ciphertext(self, iv, ciphertext):
+        if len(iv) != self.block_size:
+            raise ValueError(f"IV {self.block_size} byte olmalıdır!")
+        if len(ciphertext) == 0 or len(ciphertext) % self.block_size:
+            raise ValueError(f"Şifreli veri uzunluğu {self.block_size}'in katı olmalıdır!")
+
+    def output_size(self, n):
+        """n byte düz metin için encrypt_into'nun ihtiyaç duyduğu tampon boyutu (IV dahil)."""
+        return self.block_size + (n // self.block_size + 1) * self.block_size
+
+    def encrypt(self, plaintext):
+        """
+        Veriyi şifreler.
+
+        Args:
+            plaintext: Şifrelenecek veri (bytes, bytearray, memoryview...)
+
+        Returns:
+            (iv, ciphertext) tuple'ı
+        """
+        data = memoryview(plaintext).cast('B')
+        body = len(data) - len(data) % self.block_size
+        with self._lock:
+            output = self._encryptor.update(b''.join((
+                os.urandom(self.block_size), data[:body], self._pad_block(data[body:])
+            )))
+        return output[:self.block_size], output[self.block_size:]
+
+    def encrypt_into(self, plaintext, out):
+        """
+        Veriyi şifreleyip önceden ayrılmış tampona yazar.
+
+        Args:
+            plaintext: Şifrelenecek veri (buffer protocol)
+            out: Yazılabilir tampon (en az output_size(len(plaintext)) byte)
+
+        Returns:
+            (iv, şifreli metin uzunluğu); şifreli metin out[len(iv):] konumundadır
+        """
+        data = memoryview(plaintext).cast('B')
+        out = memoryview(out).cast('B')
+        bs = self.block_size
+        if len(out) < self.output_size(len(data)):
+            raise ValueError("Çıktı tamponu çok küçük!")
+        body = len(data) - len(data) % bs
+        with self._lock:
+            iv = self._encryptor.update(os.urandom(bs))
+            if body:
+                self._encryptor.update_into(data[:body], out[bs:])
+            out[bs + body:bs + body + bs] = self._encryptor.update(self._pad_block(data[body:]))
+        out[:bs] = iv
+        return iv, body + bs
+
+    def decrypt(self, iv, ciphertext):
+        """
+        encrypt (veya aes_encrypt/des_encrypt) çıktısını çözer.
+
+        Returns:
+            Çözülmüş veri (bytes)
+
+        Raises:
+            ValueError: IV, uzunluk veya padding geçersizse
+        """
+        self._check_ciphertext(iv, ciphertext)
+        with self._lock:
+            output = self._decryptor.update(b''.join((iv, ciphertext)))
+        return output[self.block_size:len(output) - self._unpad_length(output[-self.block_size:])]
+
+    def decrypt_into(self, iv, ciphertext, out):
+        """
+        Şifreli metni çözüp önceden ayrılmış tampona yazar.
+
+        Args:
+            out: Yazılabilir tampon (en az len(ciphertext) byte)
+
+        Returns:
+            Yazılan düz metin uzunluğu
+        """
+        data = memoryview(ciphertext).cast('B')
+        out = memoryview(out).cast('B')
+        self._check_ciphertext(iv, data)
+        if len(out) < len(data):
+            raise ValueError("Çıktı tamponu çok küçük!")
+        bs = self.block_size
+        body = len(data) - bs
+        with self._lock:
+            self._decryptor.update(iv)
+            if body:
+                self._decryptor.update_into(data[:body], out)
+            last = self._decryptor.update(data[body:])
+        n = bs - self._unpad_length(last)
+        out[body:body + n] = last[:n]
+        return body + n
+
+    def encrypt_many(self, records):
+        """
+        Çok sayıda küçük kaydı tek seferde şifreler.
+
+        Tüm rastgele bloklar tek bir os.urandom çağrısıyla alınır ve bütün
+        kayıtlar kalıcı encryptor'a tek bir update çağrısıyla verilir; her
+        kayıt yine kendi IV'siyle bağımsız çözülebilir (standart CBC).
+
+        Args:
+            records: bytes benzeri (veya UTF-8 kodlanacak str) kayıtlar
+
+        Returns:
+            (buffer, offsets): i. kayıt buffer[offsets[i]:offsets[i+1]]
+            aralığındadır ve IV || şifreli metin biçimindedir; offsets
+            array('Q') tipindedir
+        """
+        bs = self.block_size
+        records = [r.encode('utf-8') if isinstance(r, str) else r for r in records]
+        randoms = memoryview(os.urandom(bs * len(records)))
+        pads = [bytes([p]) * p for p in range(bs + 1)]
+
+        parts = []
+        offsets = array('Q', [0])
+        offset = 0
+        for i, record in enumerate(records):
+            pad = bs - len(record) % bs
+            parts.append(randoms[i * bs:(i + 1) * bs])
+            parts.append(record)
+            parts.append(pads[pad])
+            offset += bs + len(record) + pad
+            offsets.append(offset)
+
+        with self._lock:
+            buffer = self._encryptor.update(b''.join(parts))
+        return buffer, offsets
+
+    def decrypt_many(self, buffer, offsets):
+        """
+        encrypt_many çıktısını tek bir update çağrısıyla çözer.
+
+        Returns:
+            (buffer, offsets): çözülmüş kayıtlar aynı paketli biçimde
+
+        Raises:
+            ValueError: Bir kaydın uzunluğu veya padding'i geçersizse
+        """
+        bs = self.block_size
+        if len(offsets) == 0 or offsets[0] != 0 or offsets[-1] != len(buffer):
+            raise ValueError("Ofset dizisi tamponla uyuşmuyor!")
+        with self._lock:
+            # Her kaydın ilk (IV) bloğunun çıktısı anlamsızdır ve atlanır
+            output = memoryview(self._decryptor.update(bytes(buffer)))
+
+        parts = []
+        plain_offsets = array('Q', [0])
+        offset = 0
+        for i in range(len(offsets) - 1):
+            start, end = offsets[i], offsets[i + 1]
+            if end - start < 2 * bs or (end - start) % bs:
+                raise ValueError(f"Kayıt {i}: şifreli veri uzunluğu geçersiz!")
+            end -= self._unpad_length(output[end - bs:end])
+            parts.append(output[start + bs:end])
+            offset += end - start - bs
+            plain_offsets.append(offset)
+        return b''.join(parts), plain_offsets
+
+
+class AESContext(_CBCContext):
+    """
+    Bir kez anahtarlanan AES-128-CBC bağlamı (aes_encrypt ile uyumlu çıktı).
+
+    Kullanım:
+        ctx = AESContext(session_key)
+        iv, ciphertext = ctx.encrypt(b"mesaj")
+        plaintext = ctx.decrypt(iv, ciphertext)
+    """
+
+    block_size = 16
+    key_size = 16
+
+    def _algorithm(self, key):
+        return algorithms.AES(key)
+
+
+class DESContext(_CBCContext):
+    """
+    Bir kez anahtarlanan DES-CBC bağlamı (des_encrypt ile uyumlu çıktı).
+
+    Not: des_encrypt gibi 8 byte anahtarlı TripleDES (EDE) kullanır.
+    """
+
+    block_size = 8
+    key_size = 8
+
+    def _algorithm(self, key):
+        return algorithms.TripleDES(key)
+
+
+def aes_encrypt_many(records, key):
+    """
+    Çok sayıda kaydı AES-128-CBC ile toplu şifreler; bkz. AESContext.encrypt_many.
+
+    Returns:
+        (buffer, offsets) paketli çıktı
+    """
+    return AESContext(key).encrypt_many(records)
+
+def aes_decrypt_many(buffer, offsets, key):
+    """aes_encrypt_many çıktısını toplu çözer; bkz. AESContext.decrypt_many."""
+    return AESContext(key).decrypt_many(buffer, offsets)
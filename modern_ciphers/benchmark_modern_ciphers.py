@@ -0,0 +1,246 @@
+"""
+Modern Şifreleme Performans Ölçümleri
+Terminal üzerinden çalıştırmak için: python modern_ciphers/benchmark_modern_ciphers.py
+"""
+
+import sys
+import os
+import io
+import time
+import tempfile
+import tracemalloc
+
+# Proje root'unu Python path'ine ekle
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from modern_ciphers.aes_des import (
+    aes_encrypt, aes_decrypt, des_encrypt, des_decrypt, AESContext, DESContext,
+    aes_encrypt_many, aes_decrypt_many
+)
+from modern_ciphers.file_crypto import aes_encrypt_file, aes_decrypt_file, des_encrypt_file
+from modern_ciphers.segmented import SegmentedCipher
+from modern_ciphers.aead import (
+    AEAD_ALGORITHMS, AEADContext, aead_encrypt_stream, aead_decrypt_stream, generate_aead_key
+)
+
+
+def _report(name, n_messages, elapsed):
+    """Ölçüm sonucunu mesaj/saniye olarak yazdırır."""
+    print(f"{name:<44} {n_messages / elapsed:>12,.0f} mesaj/s  ({elapsed:.3f} s)")
+
+
+def _report_throughput(name, n_bytes, elapsed):
+    """Ölçüm sonucunu MB/s olarak yazdırır."""
+    print(f"{name:<44} {n_bytes / (1024 * 1024) / elapsed:>10.1f} MB/s  ({elapsed:.3f} s)")
+
+
+def benchmark_contexts(n_messages=20000, sizes=(64, 1024)):
+    """Tek anahtarla çok sayıda küçük mesajda bağlamları eski fonksiyonlarla karşılaştırır."""
+    for name, encrypt_fn, decrypt_fn, context_cls, key in (
+        ("AES", aes_encrypt, aes_decrypt, AESContext, os.urandom(16)),
+        ("DES", des_encrypt, des_decrypt, DESContext, os.urandom(8)),
+    ):
+        ctx = context_cls(key)
+        for size in sizes:
+            text = "a" * size
+            data = text.encode('utf-8')
+            print(f"\n--- {name}-CBC, {n_messages} x {size} byte ---")
+
+            start = time.perf_counter()
+            results = [encrypt_fn(text, key) for _ in range(n_messages)]
+            _report(f"{name.lower()}_encrypt", n_messages, time.perf_counter() - start)
+
+            start = time.perf_counter()
+            for iv, ciphertext in results:
+                decrypt_fn(iv, ciphertext, key)
+            _report(f"{name.lower()}_decrypt", n_messages, time.perf_counter() - start)
+
+            start = time.perf_counter()
+            results = [ctx.encrypt(data) for _ in range(n_messages)]
+            _report(f"{context_cls.__name__}.encrypt", n_messages, time.perf_counter() - start)
+
+            start = time.perf_counter()
+            for iv, ciphertext in results:
+                ctx.decrypt(iv, ciphertext)
+            _report(f"{context_cls.__name__}.decrypt", n_messages, time.perf_counter() - start)
+
+            out = bytearray(ctx.output_size(size))
+            plain = bytearray(size + ctx.block_size)
+            start = time.perf_counter()
+            for _ in range(n_messages):
+                iv, n = ctx.encrypt_into(data, out)
+            _report(f"{context_cls.__name__}.encrypt_into", n_messages, time.perf_counter() - start)
+
+            body = memoryview(out)[ctx.block_size:ctx.block_size + n]
+            start = time.perf_counter()
+            for _ in range(n_messages):
+                ctx.decrypt_into(iv, body, plain)
+            _report(f"{context_cls.__name__}.decrypt_into", n_messages, time.perf_counter() - start)
+
+
+def benchmark_aead(size=8 * 1024 * 1024, repeat=10):
+    """AEAD şifrelemeyi (padding yok, tag dahil) mevcut CBC yollarıyla karşılaştırır."""
+    data = os.urandom(size)
+    text = "a" * size
+    total = size * repeat
+    print(f"\n--- Tek seferlik şifreleme, {repeat} x {size // (1024 * 1024)} MB ---")
+
+    key = os.urandom(16)
+    start = time.perf_counter()
+    for _ in range(repeat):
+        aes_encrypt(text, key)
+    _report_throughput("aes_encrypt (AES-128-CBC, str)", total, time.perf_counter() - start)
+
+    ctx = AESContext(key)
+    start = time.perf_counter()
+    for _ in range(repeat):
+        ctx.encrypt(data)
+    _report_throughput("AESContext (AES-128-CBC)", total, time.perf_counter() - start)
+
+    ctx = DESContext(os.urandom(8))
+    start = time.perf_counter()
+    ctx.encrypt(data)
+    _report_throughput("DESContext (3DES-CBC)", size, time.perf_counter() - start)
+
+    for algorithm in AEAD_ALGORITHMS:
+        ctx = AEADContext(generate_aead_key(algorithm), algorithm)
+        start = time.perf_counter()
+        for _ in range(repeat):
+            nonce, ciphertext = ctx.encrypt(data, b"ad")
+        _report_throughput(f"{algorithm} şifreleme", total, time.perf_counter() - start)
+        start = time.perf_counter()
+        for _ in range(repeat):
+            ctx.decrypt(nonce, ciphertext, b"ad")
+        _report_throughput(f"{algorithm} çözme + doğrulama", total, time.perf_counter() - start)
+
+    print(f"\n--- Akış şifreleme, {size // (1024 * 1024)} MB ---")
+    for algorithm in AEAD_ALGORITHMS:
+        key = generate_aead_key(algorithm)
+        sealed = io.BytesIO()
+        start = time.perf_counter()
+        aead_encrypt_stream(io.BytesIO(data), sealed, key, algorithm)
+        _report_throughput(f"{algorithm} akış şifreleme", size, time.perf_counter() - start)
+        start = time.perf_counter()
+        aead_decrypt_stream(io.BytesIO(sealed.getvalue()), io.BytesIO(), key, algorithm)
+        _report_throughput(f"{algorithm} akış çözme", size, time.perf_counter() - start)
+
+
+def benchmark_file_encryption(sizes=(256 * 1024 * 1024, 2 * 1024 * 1024 * 1024),
+                              des_size=64 * 1024 * 1024):
+    """Büyük dosyalarda sürekli MB/s hızını ve (sabit kalması gereken) bellek tepe değerini ölçer."""
+    key = os.urandom(16)
+    with tempfile.TemporaryDirectory() as tmp:
+        src, enc, dec = (os.path.join(tmp, name) for name in ("src", "enc", "dec"))
+        for size in sizes:
+            with open(src, 'wb') as f:
+                for _ in range(0, size, 16 * 1024 * 1024):
+                    f.write(os.urandom(16 * 1024 * 1024))
+            print(f"\n--- Dosya şifreleme, {size // (1024 * 1024)} MB ---")
+
+            for use_mmap in (False, True):
+                label = "mmap" if use_mmap else "readinto"
+                tracemalloc.start()
+                start = time.perf_counter()
+                aes_encrypt_file(src, enc, key, use_mmap=use_mmap)
+                elapsed = time.perf_counter() - start
+                peak = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+                _report_throughput(f"aes_encrypt_file ({label})", size, elapsed)
+                print(f"{'  bellek tepe değeri':<36} {peak / 1024:>10.1f} KB")
+
+                start = time.perf_counter()
+                aes_decrypt_file(enc, dec, key, use_mmap=use_mmap)
+                _report_throughput(f"aes_decrypt_file ({label})", size, time.perf_counter() - start)
+
+        with open(src, 'wb') as f:
+            f.write(os.urandom(des_size))
+        print(f"\n--- Dosya şifreleme (DES), {des_size // (1024 * 1024)} MB ---")
+        start = time.perf_counter()
+        des_encrypt_file(src, enc, os.urandom(8))
+        _report_throughput("des_encrypt_file", des_size, time.perf_counter() - start)
+
+
+def benchmark_segmented(size=256 * 1024 * 1024, segment_size=1024 * 1024, max_workers=None):
+    """Parçalı AEAD şifrelemenin 1'den N iş parçacığına ölçeklenmesini ölçer."""
+    max_workers = max_workers or os.cpu_count() or 1
+    data = os.urandom(size)
+    print(f"\n--- Parçalı şifreleme, {size // (1024 * 1024)} MB, "
+          f"{segment_size // 1024} KB parça, {os.cpu_count()} çekirdek ---")
+
+    key = os.urandom(16)
+    ctx = AESContext(key)
+    start = time.perf_counter()
+    ctx.encrypt(data)
+    _report_throughput("AES-128-CBC (seri)", size, time.perf_counter() - start)
+
+    workers = 1
+    while True:
+        for algorithm in ('AES-256-GCM', 'CHACHA20-POLY1305'):
+            with SegmentedCipher(generate_aead_key(algorithm), algorithm, segment_size, workers) as engine:
+                start = time.perf_counter()
+                container = engine.encrypt(data)
+                _report_throughput(f"{algorithm} şifreleme ({workers} iş parçacığı)",
+                                   size, time.perf_counter() - start)
+                start = time.perf_counter()
+                engine.decrypt(container)
+                _report_throughput(f"{algorithm} çözme ({workers} iş parçacığı)",
+                                   size, time.perf_counter() - start)
+        if workers >= max_workers:
+            break
+        workers = min(workers * 2, max_workers)
+
+    with SegmentedCipher(generate_aead_key('AES-256-GCM'), 'AES-256-GCM', segment_size) as engine:
+        container = engine.encrypt(data)
+        n = 1000
+        start = time.perf_counter()
+        for i in range(n):
+            engine.decrypt_segment(container, i % (size // segment_size))
+        elapsed = time.perf_counter() - start
+        print(f"{'Tek parça çözme (rastgele erişim)':<36} {n / elapsed:>10,.0f} parça/s")
+
+
+def benchmark_encrypt_many(n_records=200000, size=48):
+    """Kısa kayıtlarda toplu API'yi kayıt başına çağrılarla (kayıt/saniye) karşılaştırır."""
+    key = os.urandom(16)
+    texts = ["a" * size] * n_records
+    records = [t.encode('utf-8') for t in texts]
+    print(f"\n--- Toplu şifreleme, {n_records} x {size} byte kayıt ---")
+
+    start = time.perf_counter()
+    results = [aes_encrypt(t, key) for t in texts]
+    _report("aes_encrypt (kayıt başına)", n_records, time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for iv, ciphertext in results:
+        aes_decrypt(iv, ciphertext, key)
+    _report("aes_decrypt (kayıt başına)", n_records, time.perf_counter() - start)
+
+    ctx = AESContext(key)
+    start = time.perf_counter()
+    results = [ctx.encrypt(r) for r in records]
+    _report("AESContext.encrypt (kayıt başına)", n_records, time.perf_counter() - start)
+
+    start = time.perf_counter()
+    buffer, offsets = aes_encrypt_many(records, key)
+    _report("aes_encrypt_many", n_records, time.perf_counter() - start)
+
+    start = time.perf_counter()
+    aes_decrypt_many(buffer, offsets, key)
+    _report("aes_decrypt_many", n_records, time.perf_counter() - start)
+
+
+def main():
+    print("="*60)
+    print("MODERN ŞİFRELEME PERFORMANS ÖLÇÜMÜ")
+    print("="*60)
+    benchmark_contexts()
+    benchmark_encrypt_many()
+    benchmark_aead()
+    benchmark_file_encryption()
+    benchmark_segmented()
+
+
+if __name__ == "__main__":
+    main()
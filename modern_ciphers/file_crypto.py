@@ -0,0 +1,229 @@
+"""
+Dosyaların Parça Parça (Chunked) AES/DES-CBC ile Şifrelenmesi
+Kütüphane kullanarak implementasyon
+
+Dosya sabit boyutlu parçalar halinde okunur ve aynı encryptor'a beslenir;
+okuma ve yazma için önceden ayrılmış tamponlar kullanıldığından bellek
+kullanımı dosya boyutundan bağımsızdır. İstenirse kaynak dosya mmap ile
+kopyalanmadan okunur. PKCS7 padding sadece son bloğa uygulanır.
+
+Şifreli dosya biçimi (kendini tanımlayan başlık):
+    magic (4) 'MCFE' | sürüm (1) | algoritma (1) | parça boyutu (4) |
+    IV uzunluğu (1) | IV | şifreli veri
+"""
+
+import mmap
+import os
+import struct
+
+from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+from cryptography.hazmat.backends import default_backend
+
+from .aes_des import _normalize_key
+
+MAGIC = b'MCFE'
+VERSION = 1
+DEFAULT_FILE_CHUNK_SIZE = 1024 * 1024
+# Başlıktaki parça boyutu güvenilmez; tampon ayırmadan önce bu sınırla denetlenir
+MAX_FILE_CHUNK_SIZE = 64 * 1024 * 1024
+
+# algoritma -> (başlık kimliği, blok/IV boyutu, anahtar boyutu, algoritma sınıfı)
+FILE_ALGORITHMS = {
+    'AES': (1, 16, 16, algorithms.AES),
+    'DES': (2, 8, 8, algorithms.TripleDES),   # des_encrypt gibi 8 byte anahtarlı TripleDES
+}
+_ALGORITHM_BY_ID = {spec[0]: name for name, spec in FILE_ALGORITHMS.items()}
+
+_HEADER = struct.Struct('>4sBBIB')
+
+
+def _check_algorithm(algorithm):
+    algorithm = algorithm.upper()
+    if algorithm not in FILE_ALGORITHMS:
+        raise ValueError(f"Algoritma {', '.join(FILE_ALGORITHMS)} değerlerinden biri olmalıdır!")
+    return algorithm
+
+def _cipher(algorithm, key, iv):
+    _, _, key_size, algorithm_cls = FILE_ALGORITHMS[algorithm]
+    return Cipher(algorithm_cls(_normalize_key(key, key_size)), modes.CBC(iv),
+                  backend=default_backend())
+
+def _input_chunks(src, start, size, chunk_size, use_mmap):
+    """
+    Kaynak dosyanın start ofsetinden itibaren size byte'ını parça görünümleri
+    (memoryview) olarak üretir.
+
+    mmap kullanılmıyorsa dosya start konumunda olmalıdır; tek bir okuma
+    tamponu yeniden kullanılır ve üretilen görünüm bir sonraki parçada
+    üzerine yazılır.
+    """
+    if use_mmap:
+        if not size:
+            return
+        with mmap.mmap(src.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            view = memoryview(mapped)
+            try:
+                for offset in range(start, start + size, chunk_size):
+                    chunk = view[offset:min(offset + chunk_size, start + size)]
+                    try:
+                        yield chunk
+                    finally:
+                        # Erken çıkışta da mmap kapanmadan görünüm serbest bırakılır
+                        chunk.release()
+            finally:
+                view.release()
+        return
+
+    buffer = bytearray(chunk_size)
+    view = memoryview(buffer)
+    while True:
+        n = src.readinto(buffer)
+        if not n:
+            return
+        # Kısa okumalarda parçayı tamamla (dosya sonu hariç)
+        while n < chunk_size:
+            more = src.readinto(view[n:])
+            if not more:
+                break
+            n += more
+        yield view[:n]
+        if n < chunk_size:
+            return
+
+def _remove_on_error(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def encrypt_file(src_path, dst_path, key, algorithm='AES',
+                 chunk_size=DEFAULT_FILE_CHUNK_SIZE, use_mmap=False):
+    """
+    Dosyayı parça parça CBC modunda şifreler.
+
+    Args:
+        src_path: Şifrelenecek dosya
+        dst_path: Şifreli çıktının yazılacağı dosya
+        key: Anahtar (bytes; AES için 16, DES için 8 byte'a tamamlanır/kısaltılır)
+        algorithm: 'AES' veya 'DES'
+        chunk_size: Okuma parçası boyutu (16'nın katı, en fazla MAX_FILE_CHUNK_SIZE)
+        use_mmap: True ise kaynak dosya mmap ile okunur
+
+    Returns:
+        Yazılan toplam byte sayısı (başlık dahil); hata olursa yarım çıktı silinir
+    """
+    algorithm = _check_algorithm(algorithm)
+    if chunk_size < 16 or chunk_size % 16 or chunk_size > MAX_FILE_CHUNK_SIZE:
+        raise ValueError(f"Parça boyutu 16'nın pozitif katı ve en fazla {MAX_FILE_CHUNK_SIZE} olmalıdır!")
+    algorithm_id, block_size, _, _ = FILE_ALGORITHMS[algorithm]
+    iv = os.urandom(block_size)
+    encryptor = _cipher(algorithm, key, iv).encryptor()
+    out_buffer = bytearray(chunk_size + block_size - 1)
+
+    with open(src_path, 'rb') as src:
+        try:
+            with open(dst_path, 'wb') as dst:
+                dst.write(_HEADER.pack(MAGIC, VERSION, algorithm_id, chunk_size, block_size) + iv)
+                written = _HEADER.size + block_size
+                tail = b''
+                for chunk in _input_chunks(src, 0, os.fstat(src.fileno()).st_size, chunk_size, use_mmap):
+                    body = len(chunk) - len(chunk) % block_size
+                    n = encryptor.update_into(chunk[:body], out_buffer)
+                    dst.write(memoryview(out_buffer)[:n])
+                    written += n
+                    tail = bytes(chunk[body:])
+
+                # Sadece son parça blok boyutunun katı olmayabilir
+                pad = block_size - len(tail)
+                final = encryptor.update(tail + bytes([pad]) * pad) + encryptor.finalize()
+                dst.write(final)
+                return written + len(final)
+        except BaseException:
+            _remove_on_error(dst_path)
+            raise
+
+def read_file_header(src):
+    """
+    Açık şifreli dosyanın başlığını okur.
+
+    Returns:
+        (algoritma, parça boyutu, iv) tuple'ı
+
+    Raises:
+        ValueError: Başlık geçersizse
+    """
+    header = src.read(_HEADER.size)
+    if len(header) != _HEADER.size:
+        raise ValueError("Dosya başlığı eksik!")
+    magic, version, algorithm_id, chunk_size, iv_size = _HEADER.unpack(header)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError("Desteklenmeyen dosya biçimi!")
+    if algorithm_id not in _ALGORITHM_BY_ID:
+        raise ValueError("Bilinmeyen algoritma!")
+    algorithm = _ALGORITHM_BY_ID[algorithm_id]
+    if (iv_size != FILE_ALGORITHMS[algorithm][1] or chunk_size < 16 or chunk_size % 16
+            or chunk_size > MAX_FILE_CHUNK_SIZE):
+        raise ValueError("Dosya başlığı bozuk!")
+    iv = src.read(iv_size)
+    if len(iv) != iv_size:
+        raise ValueError("Dosya başlığı eksik!")
+    return algorithm, chunk_size, iv
+
+def decrypt_file(src_path, dst_path, key, use_mmap=False):
+    """
+    encrypt_file çıktısını parça parça çözer; algoritma ve parça boyutu başlıktan okunur.
+
+    Returns:
+        Yazılan düz metin byte sayısı
+
+    Raises:
+        ValueError: Başlık, uzunluk veya padding geçersizse (yarım çıktı silinir)
+    """
+    with open(src_path, 'rb') as src:
+        algorithm, chunk_size, iv = read_file_header(src)
+        block_size = FILE_ALGORITHMS[algorithm][1]
+        header_size = _HEADER.size + block_size
+        size = os.fstat(src.fileno()).st_size - header_size
+        if size <= 0 or size % block_size:
+            raise ValueError(f"Şifreli veri uzunluğu {block_size}'in katı olmalıdır!")
+
+        decryptor = _cipher(algorithm, key, iv).decryptor()
+        out_buffer = bytearray(chunk_size + block_size - 1)
+        out_view = memoryview(out_buffer)
+        try:
+            with open(dst_path, 'wb') as dst:
+                written = 0
+                processed = 0
+                for chunk in _input_chunks(src, header_size, size, chunk_size, use_mmap):
+                    n = decryptor.update_into(chunk, out_buffer)
+                    processed += len(chunk)
+                    if processed == size:
+                        # Son parça: padding doğrulanıp kaldırılır
+                        pad = out_buffer[n - 1]
+                        if not 1 <= pad <= block_size or out_view[n - pad:n] != bytes([pad]) * pad:
+                            raise ValueError("Geçersiz padding!")
+                        n -= pad
+                    dst.write(out_view[:n])
+                    written += n
+                decryptor.finalize()
+                return written
+        except BaseException:
+            _remove_on_error(dst_path)
+            raise
+
+def aes_encrypt_file(src_path, dst_path, key, chunk_size=DEFAULT_FILE_CHUNK_SIZE, use_mmap=False):
+    """Dosyayı AES-128-CBC ile şifreler; bkz. encrypt_file."""
+    return encrypt_file(src_path, dst_path, key, 'AES', chunk_size, use_mmap)
+
+def aes_decrypt_file(src_path, dst_path, key, use_mmap=False):
+    """aes_encrypt_file çıktısını çözer; bkz. decrypt_file."""
+    return decrypt_file(src_path, dst_path, key, use_mmap)
+
+def des_encrypt_file(src_path, dst_path, key, chunk_size=DEFAULT_FILE_CHUNK_SIZE, use_mmap=False):
+    """Dosyayı DES-CBC (8 byte anahtarlı TripleDES) ile şifreler; bkz. encrypt_file."""
+    return encrypt_file(src_path, dst_path, key, 'DES', chunk_size, use_mmap)
+
+def des_decrypt_file(src_path, dst_path, key, use_mmap=False):
+    """des_encrypt_file çıktısını çözer; bkz. decrypt_file."""
+    return decrypt_file(src_path, dst_path, key, use_mmap)
@@ -0,0 +1,244 @@
+"""
+Parçalı (Segmented) Paralel AEAD Şifreleme
+Kütüphane kullanarak implementasyon
+
+CBC seridir; büyük veriler için girdi bağımsız parçalara (segment) bölünür
+ve her parça kendi nonce'u ve tag'i ile AES-GCM (veya ChaCha20-Poly1305)
+ile şifrelenir. cryptography şifreleme sırasında GIL'i bıraktığı için
+parçalar ThreadPoolExecutor ile çekirdeklere dağıtılır ve sonuç tek bir
+kapsayıcıda (container) önceden ayrılmış tampona yazılır.
+
+Kapsayıcı biçimi:
+    başlık: magic (4) 'MCSG' | sürüm (1) | algoritma (1) | parça boyutu (4) |
+            düz metin uzunluğu (8) | nonce öneki (7)
+    parçalar: [şifreli parça || tag (16)] ... (son parça kısa olabilir)
+
+Parça i'nin nonce'u = önek || i (4) || son parça bayrağı (1), ek doğrulanmış
+verisi = başlık || associated_data'dır. Böylece parça sırası değiştirilemez,
+kapsayıcı kesilemez ve başlık değiştirilemez. Parça i'nin konumu
+hesaplanabildiği için tek bir parça, diğerlerine dokunmadan çözülebilir.
+"""
+
+import os
+import struct
+from concurrent.futures import ThreadPoolExecutor
+
+from cryptography.exceptions import InvalidTag
+
+from .aead import (
+    AEAD_ALGORITHMS, TAG_SIZE, _STREAM_PREFIX_SIZE, _chunk_nonce, _check_key, check_algorithm
+)
+
+MAGIC = b'MCSG'
+VERSION = 1
+DEFAULT_SEGMENT_SIZE = 1024 * 1024
+
+_ALGORITHM_IDS = {'AES-128-GCM': 1, 'AES-256-GCM': 2, 'CHACHA20-POLY1305': 3}
+_ALGORITHM_BY_ID = {v: k for k, v in _ALGORITHM_IDS.items()}
+
+_HEADER = struct.Struct(f'>4sBBIQ{_STREAM_PREFIX_SIZE}s')
+HEADER_SIZE = _HEADER.size
+
+# encrypt_into/decrypt_into cryptography 44+ ile gelir; yoksa kopyalanarak yazılır
+_HAS_INTO = hasattr(AEAD_ALGORITHMS['AES-128-GCM'][1], 'encrypt_into')
+
+
+def _segment_count(length, segment_size):
+    """Boş veri için de (sadece tag içeren) bir parça bulunur."""
+    return max(1, -(-length // segment_size))
+
+def read_segmented_header(container):
+    """
+    Kapsayıcı başlığını çözümler.
+
+    Returns:
+        {'algorithm', 'segment_size', 'length', 'segments', 'prefix'} sözlüğü
+
+    Raises:
+        ValueError: Başlık geçersizse
+    """
+    header = bytes(memoryview(container)[:HEADER_SIZE])
+    if len(header) != HEADER_SIZE:
+        raise ValueError("Kapsayıcı başlığı eksik!")
+    magic, version, algorithm_id, segment_size, length, prefix = _HEADER.unpack(header)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError("Desteklenmeyen kapsayıcı biçimi!")
+    if algorithm_id not in _ALGORITHM_BY_ID or segment_size < 1:
+        raise ValueError("Kapsayıcı başlığı bozuk!")
+    return {
+        'algorithm': _ALGORITHM_BY_ID[algorithm_id],
+        'segment_size': segment_size,
+        'length': length,
+        'segments': _segment_count(length, segment_size),
+        'prefix': prefix,
+    }
+
+def segmented_size(length, segment_size=DEFAULT_SEGMENT_SIZE):
+    """length byte düz metin için kapsayıcı boyutu."""
+    return HEADER_SIZE + length + _segment_count(length, segment_size) * TAG_SIZE
+
+
+class SegmentedCipher:
+    """
+    Bir anahtar için iş parçacığı havuzunu açık tutan parçalı AEAD şifreleyici.
+
+    Args:
+        key: Algoritmaya uygun boyutta anahtar
+        algorithm: 'AES-128-GCM', 'AES-256-GCM' veya 'CHACHA20-POLY1305'
+        segment_size: Parça boyutu (şifrelemede; çözmede başlıktan okunur)
+        workers: İş parçacığı sayısı (None ise çekirdek sayısı)
+
+    Kullanım:
+        with SegmentedCipher(key, 'AES-256-GCM', workers=8) as engine:
+            container = engine.encrypt(data)
+            part = engine.decrypt_segment(container, 3)
+    """
+
+    def __init__(self, key, algorithm='AES-256-GCM', segment_size=DEFAULT_SEGMENT_SIZE, workers=None):
+        if segment_size < 1 or segment_size >= 1 << 32:
+            raise ValueError("Parça boyutu pozitif ve 4 GB'tan küçük olmalıdır!")
+        self.algorithm = check_algorithm(algorithm)
+        self.key = _check_key(key, self.algorithm)
+        self.segment_size = segment_size
+        self.workers = workers or os.cpu_count() or 1
+        self._aead = AEAD_ALGORITHMS[self.algorithm][1](self.key)
+        self._executor = None
+
+    def _map(self, fn, indices):
+        """Parçaları havuzda (tek iş parçacığı veya tek parça ise seri) işler."""
+        if self.workers < 2 or len(indices) < 2:
+            return [fn(i) for i in indices]
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers)
+        return list(self._executor.map(fn, indices))
+
+    def encrypt(self, plaintext, associated_data=None):
+        """
+        Veriyi parçalara bölüp paralel şifreler.
+
+        Args:
+            plaintext: Şifrelenecek veri (buffer protocol)
+            associated_data: Her parçaya bağlanan ek doğrulanmış veri
+
+        Returns:
+            Kapsayıcı (bytearray)
+        """
+        data = memoryview(plaintext).cast('B')
+        length = len(data)
+        segment_size = self.segment_size
+        count = _segment_count(length, segment_size)
+        prefix = os.urandom(_STREAM_PREFIX_SIZE)
+        header = _HEADER.pack(MAGIC, VERSION, _ALGORITHM_IDS[self.algorithm],
+                              segment_size, length, prefix)
+        aad = header + (associated_data or b'')
+
+        container = bytearray(segmented_size(length, segment_size))
+        container[:HEADER_SIZE] = header
+        out = memoryview(container)
+
+        def seal(i):
+            chunk = data[i * segment_size:(i + 1) * segment_size]
+            start = HEADER_SIZE + i * (segment_size + TAG_SIZE)
+            target = out[start:start + len(chunk) + TAG_SIZE]
+            nonce = _chunk_nonce(prefix, i, i == count - 1)
+            if _HAS_INTO:
+                self._aead.encrypt_into(nonce, chunk, aad, target)
+            else:
+                target[:] = self._aead.encrypt(nonce, bytes(chunk), aad)
+
+        self._map(seal, range(count))
+        return container
+
+    def _open(self, container, info, aad, i, target):
+        """Parça i'yi doğrulayıp target'a çözer."""
+        segment_size = info['segment_size']
+        start = HEADER_SIZE + i * (segment_size + TAG_SIZE)
+        size = min(segment_size, info['length'] - i * segment_size) + TAG_SIZE
+        sealed = container[start:start + size]
+        if len(sealed) != size:
+            raise ValueError("Kapsayıcı eksik (kesilmiş)!")
+        nonce = _chunk_nonce(info['prefix'], i, i == info['segments'] - 1)
+        try:
+            if _HAS_INTO:
+                self._aead.decrypt_into(nonce, sealed, aad, target)
+            else:
+                target[:] = self._aead.decrypt(nonce, bytes(sealed), aad)
+        except InvalidTag:
+            raise ValueError(f"Parça {i} doğrulanamadı: veri değiştirilmiş veya anahtar yanlış!") from None
+
+    def _parse(self, container, associated_data):
+        container = memoryview(container).cast('B')
+        info = read_segmented_header(container)
+        if info['algorithm'] != self.algorithm:
+            raise ValueError(f"Kapsayıcı {info['algorithm']} ile şifrelenmiş!")
+        if len(container) != segmented_size(info['length'], info['segment_size']):
+            raise ValueError("Kapsayıcı boyutu başlıkla uyuşmuyor!")
+        aad = bytes(container[:HEADER_SIZE]) + (associated_data or b'')
+        return container, info, aad
+
+    def decrypt(self, container, associated_data=None):
+        """
+        Tüm kapsayıcıyı paralel doğrulayıp çözer.
+
+        Returns:
+            Çözülmüş veri (bytearray)
+
+        Raises:
+            ValueError: Başlık geçersizse veya herhangi bir parça doğrulanamazsa
+        """
+        container, info, aad = self._parse(container, associated_data)
+        plaintext = bytearray(info['length'])
+        out = memoryview(plaintext)
+        segment_size = info['segment_size']
+
+        def open_segment(i):
+            self._open(container, info, aad, i,
+                       out[i * segment_size:(i + 1) * segment_size])
+
+        self._map(open_segment, range(info['segments']))
+        return plaintext
+
+    def decrypt_segment(self, container, index, associated_data=None):
+        """
+        Sadece index. parçayı doğrulayıp çözer (rastgele erişim).
+
+        Returns:
+            Parçanın düz metni (bytes)
+        """
+        container, info, aad = self._parse(container, associated_data)
+        if not 0 <= index < info['segments']:
+            raise ValueError(f"Parça indeksi 0 ile {info['segments'] - 1} arasında olmalıdır!")
+        size = min(info['segment_size'], info['length'] - index * info['segment_size'])
+        target = bytearray(size)
+        self._open(container, info, aad, index, memoryview(target))
+        return bytes(target)
+
+    def close(self):
+        """İş parçacığı havuzunu kapatır."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def segmented_encrypt(plaintext, key, algorithm='AES-256-GCM', segment_size=DEFAULT_SEGMENT_SIZE,
+                      associated_data=None, workers=None):
+    """Tek seferlik parçalı şifreleme; bkz. SegmentedCipher.encrypt."""
+    with SegmentedCipher(key, algorithm, segment_size, workers) as engine:
+        return engine.encrypt(plaintext, associated_data)
+
+def segmented_decrypt(container, key, associated_data=None, workers=None):
+    """Tek seferlik parçalı çözme; algoritma başlıktan okunur."""
+    algorithm = read_segmented_header(container)['algorithm']
+    with SegmentedCipher(key, algorithm, workers=workers) as engine:
+        return engine.decrypt(container, associated_data)
+
+def segmented_decrypt_segment(container, index, key, associated_data=None):
+    """Kapsayıcının tek bir parçasını çözer; algoritma başlıktan okunur."""
+    algorithm = read_segmented_header(container)['algorithm']
+    return SegmentedCipher(key, algorithm, workers=1).decrypt_segment(container, index, associated_data)
@@ -0,0 +1,208 @@
+"""
+Modern Şifreleme Test Scripti
+Terminal üzerinden test için: python -m pytest modern_ciphers
+"""
+
+import sys
+import os
+
+# Proje root'unu Python path'ine ekle
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+import io
+import random
+
+import pytest
+
+from modern_ciphers.aes_des import (
+    aes_encrypt, aes_decrypt, des_encrypt, des_decrypt, AESContext, DESContext,
+    aes_encrypt_many, aes_decrypt_many
+)
+from modern_ciphers import file_crypto
+from modern_ciphers.file_crypto import encrypt_file, decrypt_file, read_file_header
+from modern_ciphers.segmented import (
+    HEADER_SIZE, read_segmented_header, segmented_encrypt, segmented_decrypt,
+    segmented_decrypt_segment
+)
+from modern_ciphers.aead import (
+    AEAD_ALGORITHMS, AEADContext, aead_encrypt, aead_decrypt,
+    aead_encrypt_stream, aead_decrypt_stream, generate_aead_key
+)
+
+
+@pytest.mark.parametrize("context_cls, encrypt_fn, decrypt_fn, key", [
+    (AESContext, aes_encrypt, aes_decrypt, b"0123456789abcdef"),
+    (DESContext, des_encrypt, des_decrypt, b"Anahtar1"),
+])
+def test_contexts_match_functions(context_cls, encrypt_fn, decrypt_fn, key):
+    """Bağlam çıktıları eski fonksiyonlarla karşılıklı çözülebilir olmalı."""
+    rng = random.Random(21)
+    ctx = context_cls(key)
+    bs = ctx.block_size
+    for length in (0, 1, bs - 1, bs, bs + 1, 3 * bs, 100):
+        text = ''.join(rng.choice("abcçğışöü ") for _ in range(length))
+        data = text.encode('utf-8')
+
+        iv, ciphertext = ctx.encrypt(bytearray(data))
+        assert len(iv) == bs and decrypt_fn(iv, ciphertext, key) == text
+        iv, ciphertext = encrypt_fn(text, key)
+        assert ctx.decrypt(iv, memoryview(ciphertext)) == data
+
+        # Önceden ayrılmış tamponlarla
+        out = bytearray(ctx.output_size(len(data)))
+        iv, n = ctx.encrypt_into(data, out)
+        assert out[:bs] == iv and decrypt_fn(iv, bytes(out[bs:bs + n]), key) == text
+        plain = bytearray(n)
+        assert plain[:ctx.decrypt_into(iv, out[bs:bs + n], plain)] == data
+
+    with pytest.raises(ValueError):
+        ctx.decrypt(iv, ciphertext[:-1])
+    with pytest.raises(ValueError):
+        ctx.encrypt_into(b"abc", bytearray(bs))
+
+
+@pytest.mark.parametrize("algorithm", list(AEAD_ALGORITHMS))
+def test_aead_roundtrip_and_tamper(algorithm):
+    """AEAD çıktısı çözülebilmeli; değiştirilmiş veri/ek veri reddedilmeli."""
+    key = generate_aead_key(algorithm)
+    nonce, ciphertext = aead_encrypt("Kriptoloji Final Sunumu", key, algorithm, b"oturum-1")
+    assert aead_decrypt(nonce, ciphertext, key, algorithm, b"oturum-1") == "Kriptoloji Final Sunumu".encode()
+    with pytest.raises(ValueError):
+        aead_decrypt(nonce, ciphertext, key, algorithm, b"oturum-2")
+    tampered = bytearray(ciphertext)
+    tampered[0] ^= 1
+    with pytest.raises(ValueError):
+        AEADContext(key, algorithm).decrypt(nonce, tampered, b"oturum-1")
+
+
+@pytest.mark.parametrize("algorithm", list(AEAD_ALGORITHMS))
+def test_aead_stream(algorithm):
+    """Akış şifreleme parça sınırlarında doğru çalışmalı ve kesmeyi tespit etmeli."""
+    rng = random.Random(5)
+    key = generate_aead_key(algorithm)
+    for length in (0, 1, 63, 64, 65, 300):
+        data = bytes(rng.randrange(256) for _ in range(length))
+        sealed = io.BytesIO()
+        written = aead_encrypt_stream(io.BytesIO(data), sealed, key, algorithm, b"ad", chunk_size=64)
+        assert written == len(sealed.getvalue())
+
+        out = io.BytesIO()
+        aead_decrypt_stream(io.BytesIO(sealed.getvalue()), out, key, algorithm, b"ad", chunk_size=64)
+        assert out.getvalue() == data
+
+        # Tam parça sınırında kesilmiş akış son parça bayrağı sayesinde reddedilir
+        if length > 64:
+            with pytest.raises(ValueError):
+                aead_decrypt_stream(io.BytesIO(sealed.getvalue()[:7 + 80]), io.BytesIO(), key,
+                                    algorithm, b"ad", chunk_size=64)
+
+        # Değiştirilmiş parça yazıcıya hiç ulaşmaz
+        tampered = bytearray(sealed.getvalue())
+        tampered[7] ^= 1
+        out = io.BytesIO()
+        with pytest.raises(ValueError):
+            aead_decrypt_stream(io.BytesIO(tampered), out, key, algorithm, b"ad", chunk_size=64)
+        assert out.getvalue() == b''
+
+
+@pytest.mark.parametrize("algorithm", ["AES", "DES"])
+@pytest.mark.parametrize("use_mmap", [False, True])
+def test_file_encryption(tmp_path, algorithm, use_mmap):
+    """Dosya şifreleme parça sınırlarında doğru çalışmalı, başlık kendini tanımlamalı."""
+    rng = random.Random(8)
+    src, enc, dec = tmp_path / "src", tmp_path / "enc", tmp_path / "dec"
+    for length in (0, 15, 16, 1000, 4096, 10000):
+        data = bytes(rng.randrange(256) for _ in range(length))
+        src.write_bytes(data)
+        written = encrypt_file(src, enc, b"anahtar", algorithm, chunk_size=4096, use_mmap=use_mmap)
+        assert written == enc.stat().st_size
+        with open(enc, 'rb') as f:
+            header_algorithm, chunk_size, iv = read_file_header(f)
+        assert (header_algorithm, chunk_size) == (algorithm, 4096)
+
+        assert decrypt_file(enc, dec, b"anahtar", use_mmap=use_mmap) == length
+        assert dec.read_bytes() == data
+
+    # Bozuk padding: hata verilir ve yarım çıktı bırakılmaz
+    with pytest.raises(ValueError):
+        decrypt_file(enc, dec, b"yanlis-anahtar", use_mmap=use_mmap)
+    assert not dec.exists()
+
+    # Başlıktaki aşırı parça boyutu tampon ayrılmadan reddedilir
+    forged = bytearray(enc.read_bytes())
+    forged[6:10] = (0xFFFFFFF0).to_bytes(4, 'big')
+    enc.write_bytes(forged)
+    with pytest.raises(ValueError, match="bozuk"):
+        decrypt_file(enc, dec, b"anahtar", use_mmap=use_mmap)
+    assert not dec.exists()
+    with pytest.raises(ValueError):
+        encrypt_file(src, enc, b"anahtar", algorithm, chunk_size=file_crypto.MAX_FILE_CHUNK_SIZE + 16)
+
+
+def test_encrypt_file_removes_partial_output(tmp_path, monkeypatch):
+    """Okuma sırasında hata olursa yarım şifreli dosya bırakılmamalı."""
+    def failing_chunks(src, offset, size, chunk_size, use_mmap):
+        yield bytes(chunk_size)
+        raise OSError("okuma hatası")
+
+    src, enc = tmp_path / "src", tmp_path / "enc"
+    src.write_bytes(bytes(10000))
+    monkeypatch.setattr(file_crypto, '_input_chunks', failing_chunks)
+    with pytest.raises(OSError, match="okuma hatası"):
+        encrypt_file(src, enc, b"anahtar", chunk_size=4096)
+    assert not enc.exists()
+
+
+@pytest.mark.parametrize("algorithm", list(AEAD_ALGORITHMS))
+def test_segmented_container(algorithm):
+    """Parçalı kapsayıcı paralel çözülmeli, tek parça ayrıca çözülebilmeli."""
+    rng = random.Random(3)
+    key = generate_aead_key(algorithm)
+    for length in (0, 99, 100, 1001):
+        data = bytes(rng.randrange(256) for _ in range(length))
+        container = segmented_encrypt(data, key, algorithm, segment_size=100,
+                                      associated_data=b"arsiv", workers=4)
+        assert segmented_decrypt(container, key, b"arsiv", workers=4) == data
+        info = read_segmented_header(container)
+        assert info['segments'] == max(1, -(-length // 100))
+        for i in range(info['segments']):
+            assert segmented_decrypt_segment(container, i, key, b"arsiv") == data[i * 100:(i + 1) * 100]
+
+    # Değiştirilmiş parça, başlık, ek veri ve kesilmiş kapsayıcı reddedilir
+    for tampered in (HEADER_SIZE + 150, 10):
+        broken = bytearray(container)
+        broken[tampered] ^= 1
+        with pytest.raises(ValueError):
+            segmented_decrypt(broken, key, b"arsiv")
+    with pytest.raises(ValueError):
+        segmented_decrypt(container, key, b"baska")
+    with pytest.raises(ValueError):
+        segmented_decrypt(container[:-116], key, b"arsiv")
+
+
+def test_encrypt_many_packed_records():
+    """Toplu şifrelemede her kayıt kendi IV'siyle aes_decrypt ile çözülebilmeli."""
+    rng = random.Random(17)
+    key = b"0123456789abcdef"
+    records = [''.join(rng.choice("abcçğü") for _ in range(n)) for n in (0, 1, 15, 16, 17, 40)]
+    buffer, offsets = aes_encrypt_many(records, key)
+    assert len(offsets) == len(records) + 1 and offsets[-1] == len(buffer)
+    ivs = set()
+    for i, record in enumerate(records):
+        sealed = buffer[offsets[i]:offsets[i + 1]]
+        ivs.add(sealed[:16])
+        assert aes_decrypt(sealed[:16], sealed[16:], key) == record
+    assert len(ivs) == len(records)
+
+    plain, plain_offsets = aes_decrypt_many(buffer, offsets, key)
+    assert [plain[plain_offsets[i]:plain_offsets[i + 1]].decode('utf-8')
+            for i in range(len(records))] == records
+
+    with pytest.raises(ValueError):
+        aes_decrypt_many(buffer[:-1], offsets, key)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-q"])